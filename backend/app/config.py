@@ -50,6 +50,46 @@ class Settings(BaseSettings):
     review_mod_check_interval: int = 10
     review_mod_request_gap_seconds: float = 0.5
 
+    # Silent status sync: papers committed per chunk and concurrent OpenReview fetches
+    # (request starts stay spaced by review_mod_request_gap_seconds)
+    silent_sync_chunk_size: int = 200
+    silent_sync_concurrency: int = 4
+
+    # Scheduler leader lease: every worker starts the scheduler, only the lease holder runs
+    # scheduled checks; another worker takes over this many seconds after the holder stops renewing.
+    # It is renewed every lease/4 seconds from its own thread, however long a check tick runs; a renewal
+    # may wait up to SQLite's 5s busy timeout behind a write, so keep it at 20 or more
+    # (checks commit per paper and per silent-sync chunk, so their writes stay short)
+    scheduler_lease_seconds: int = 20
+
+    # SMTP connection pool (sessions are shared per host/port/user)
+    smtp_pool_size: int = 4
+    smtp_max_messages_per_connection: int = 100
+    smtp_max_messages_per_second: float = 10.0
+
+    # Email outbox delivery (runs in the scheduler lease holder only)
+    outbox_workers: int = 4
+    # Per recipient domain "domain=concurrency/per_second", comma-separated; "*" covers other domains
+    outbox_domain_limits: str = "gmail.com=4/10,*=2/5"
+    outbox_max_attempts: int = 6
+    outbox_retry_base_seconds: float = 30.0
+    outbox_retry_max_seconds: float = 3600.0
+    # Stop mailing an address after this many consecutive permanent (5xx) rejections
+    subscriber_quarantine_hard_failures: int = 3
+
+    # Digest subscribers: combine events per address over this many minutes (0 = within one event consumer pass)
+    digest_window_minutes: int = 0
+
+    # Paper event consumers (notification dispatch, digests) run every this many seconds in the
+    # scheduler lease holder, independent of check ticks
+    event_consumer_interval_seconds: int = 10
+
+    # Paper event log: processed events older than this many days are pruned (0 keeps them)
+    paper_event_retention_days: int = 30
+
+    # Paper lifecycle: archive decided papers after this many days without changes (0 disables)
+    lifecycle_retire_quiet_days: int = 14
+
     # Email verification
     email_verification_ttl_minutes: int = 10
     email_verification_cooldown_seconds: int = 60
@@ -1,6 +1,7 @@
-from sqlalchemy import create_engine, inspect, text
+from sqlalchemy import create_engine, inspect, null, text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, undefer
 from .config import get_settings
 from .utils.crypto import encrypt_value
 
@@ -12,6 +13,9 @@ engine = create_engine(
     connect_args={"check_same_thread": False}  # Needed for SQLite
 )
 
+# Worker processes starting together on a new database race to create the same tables
+_CREATE_TABLES_ATTEMPTS = 10
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -28,10 +32,24 @@ def get_db():
 
 def init_db():
     """Initialize database tables."""
-    Base.metadata.create_all(bind=engine)
+    for attempt in range(_CREATE_TABLES_ATTEMPTS):
+        try:
+            Base.metadata.create_all(bind=engine)
+            break
+        except OperationalError:
+            # Another worker process created some of the tables first (uvicorn --workers N on a new database)
+            if attempt == _CREATE_TABLES_ATTEMPTS - 1:
+                raise
     ensure_subscriber_columns()
     ensure_paper_columns()
+    ensure_outbox_columns()
+    ensure_job_checkpoint_columns()
+    ensure_paper_archive_columns()
+    ensure_event_cursor_columns()
+    ensure_indexes()
+    ensure_notification_ledger()
     ensure_encrypted_secrets()
+    ensure_review_rows()
 
 
 def ensure_subscriber_columns():
@@ -52,6 +70,24 @@ def ensure_subscriber_columns():
                 "WHERE notify_on_review_modified IS NULL"
             ))
 
+    if "digest" not in columns:
+        with engine.begin() as conn:
+            conn.execute(text(
+                "ALTER TABLE subscribers "
+                "ADD COLUMN digest BOOLEAN DEFAULT 0"
+            ))
+
+    with engine.begin() as conn:
+        for name, ddl in (
+            ("send_failures", "INTEGER NOT NULL DEFAULT 0"),
+            ("hard_failures", "INTEGER NOT NULL DEFAULT 0"),
+            ("last_send_error", "TEXT"),
+            ("next_send_after", "DATETIME"),
+            ("quarantined_at", "DATETIME"),
+        ):
+            if name not in columns:
+                conn.execute(text(f"ALTER TABLE subscribers ADD COLUMN {name} {ddl}"))
+
 
 def ensure_paper_columns():
     """Lightweight migration for scheduler timestamp columns."""
@@ -81,6 +117,142 @@ def ensure_paper_columns():
                 "WHERE last_review_mod_checked IS NULL"
             ))
 
+        if "decision_hash" not in columns:
+            # Backfilled lazily: the scheduler fingerprints decision_data on the next check.
+            conn.execute(text(
+                "ALTER TABLE papers "
+                "ADD COLUMN decision_hash VARCHAR(64)"
+            ))
+
+        if "review_count" not in columns:
+            conn.execute(text(
+                "ALTER TABLE papers "
+                "ADD COLUMN review_count INTEGER NOT NULL DEFAULT 0"
+            ))
+            if "reviews" in inspector.get_table_names():
+                conn.execute(text(
+                    "UPDATE papers SET review_count = "
+                    "(SELECT COUNT(*) FROM reviews WHERE reviews.paper_id = papers.id)"
+                ))
+
+        if "last_changed_at" not in columns:
+            # Conservative: the quiet period before retirement starts at the upgrade.
+            conn.execute(text(
+                "ALTER TABLE papers "
+                "ADD COLUMN last_changed_at DATETIME"
+            ))
+            conn.execute(text(
+                "UPDATE papers SET last_changed_at = COALESCE(last_checked, created_at) "
+                "WHERE last_changed_at IS NULL"
+            ))
+
+        if "paused_at" not in columns:
+            conn.execute(text(
+                "ALTER TABLE papers "
+                "ADD COLUMN paused_at DATETIME"
+            ))
+
+
+def ensure_outbox_columns():
+    """Lightweight migration for outbox columns."""
+    inspector = inspect(engine)
+    if "outbox" not in inspector.get_table_names():
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("outbox")}
+    if "render_key" not in columns:
+        with engine.begin() as conn:
+            conn.execute(text(
+                "ALTER TABLE outbox "
+                "ADD COLUMN render_key VARCHAR(255)"
+            ))
+    if "claim_token" not in columns:
+        with engine.begin() as conn:
+            conn.execute(text(
+                "ALTER TABLE outbox "
+                "ADD COLUMN claim_token VARCHAR(32)"
+            ))
+
+
+def ensure_job_checkpoint_columns():
+    """Lightweight migration for job checkpoint columns."""
+    inspector = inspect(engine)
+    if "job_checkpoints" not in inspector.get_table_names():
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("job_checkpoints")}
+    if "holder" not in columns:
+        with engine.begin() as conn:
+            conn.execute(text(
+                "ALTER TABLE job_checkpoints "
+                "ADD COLUMN holder VARCHAR(255)"
+            ))
+    if "failed" not in columns:
+        with engine.begin() as conn:
+            conn.execute(text(
+                "ALTER TABLE job_checkpoints "
+                "ADD COLUMN failed JSON"
+            ))
+
+
+def ensure_paper_archive_columns():
+    """Lightweight migration for paper archive columns."""
+    inspector = inspect(engine)
+    if "paper_archive" not in inspector.get_table_names():
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("paper_archive")}
+    if "review_history" not in columns:
+        with engine.begin() as conn:
+            conn.execute(text(
+                "ALTER TABLE paper_archive "
+                "ADD COLUMN review_history JSON"
+            ))
+
+
+def ensure_event_cursor_columns():
+    """Lightweight migration for event cursor failure columns."""
+    inspector = inspect(engine)
+    if "event_cursors" not in inspector.get_table_names():
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("event_cursors")}
+    for name, ddl in (
+        ("failures", "INTEGER NOT NULL DEFAULT 0"),
+        ("retry_until", "INTEGER"),
+        ("last_error", "TEXT"),
+    ):
+        if name not in columns:
+            with engine.begin() as conn:
+                conn.execute(text(f"ALTER TABLE event_cursors ADD COLUMN {name} {ddl}"))
+
+
+def ensure_notification_ledger():
+    """Backfill ledger rows for notified_* flags that have none (idempotent, runs on every start)."""
+    with engine.begin() as conn:
+        for event_key, flag in (("review", "notified_review"), ("decision", "notified_decision")):
+            conn.execute(text(
+                "INSERT INTO notification_ledger (subscriber_id, event_key, kind, created_at) "
+                f"SELECT s.id, '{event_key}', '{event_key}', CURRENT_TIMESTAMP "
+                f"FROM subscribers s WHERE s.{flag} = 1 AND NOT EXISTS ("
+                "SELECT 1 FROM notification_ledger l "
+                f"WHERE l.subscriber_id = s.id AND l.event_key = '{event_key}')"
+            ))
+
+
+# Indexes no longer declared on the models; what is owed is read from notification_ledger.
+_RETIRED_INDEXES = ("ix_subscribers_pending_review", "ix_subscribers_pending_decision")
+
+
+def ensure_indexes():
+    """Create indexes declared on tables that already existed before the index was added, and drop retired ones."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    with engine.begin() as conn:
+        for name in _RETIRED_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
 
 def ensure_encrypted_secrets():
     """Encrypt stored secrets in the database if needed."""
@@ -116,3 +288,32 @@ def ensure_encrypted_secrets():
         raise
     finally:
         db.close()
+
+
+def ensure_review_rows():
+    """Move reviews cached in the legacy papers.review_data blob into the reviews table."""
+    from .models import Paper, Review
+    from .services.reviews import sync_reviews
+    db = SessionLocal()
+    try:
+        papers = db.query(Paper).options(undefer(Paper.review_data)).filter(
+            Paper.review_data.isnot(None)
+        ).all()
+        for paper in papers:
+            stored = paper.review_data if isinstance(paper.review_data, dict) else {}
+            reviews = stored.get("reviews", [])
+            if not isinstance(reviews, list):
+                reviews = []
+            reviews = [r for r in reviews if isinstance(r, dict)]
+            has_rows = db.query(Review.id).filter(Review.paper_id == paper.id).first() is not None
+            if reviews and not has_rows:
+                sync_reviews(db, paper, reviews)
+            paper.review_data = null()  # SQL NULL rather than JSON 'null'
+
+        if papers:
+            db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
@@ -6,6 +6,8 @@ import logging
 from .database import init_db
 from .routers import papers, admin, subscribers, public
 from .services.scheduler import start_scheduler, stop_scheduler
+from .services.dispatch import stop_dispatcher
+from .services.smtp_pool import close_smtp_pools
 from .config import get_settings, validate_security_settings
 
 # Configure logging
@@ -41,6 +43,8 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down...")
     stop_scheduler()
+    stop_dispatcher()
+    close_smtp_pools()
     logger.info("Application shutdown complete")
 
 
@@ -62,6 +66,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
 # Include routers
@@ -1,8 +1,14 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    Column, Integer, BigInteger, String, Boolean, DateTime, ForeignKey, Text, JSON, UniqueConstraint,
+    Index,
+)
+from sqlalchemy.orm import relationship, deferred
 from datetime import datetime
 from .database import Base
 
+# Deferred group for the large JSON columns on Paper; opt in with undefer_group(PAPER_BLOB_GROUP).
+PAPER_BLOB_GROUP = "paper_blobs"
+
 
 class Paper(Base):
     """Paper model for tracking OpenReview submissions."""
@@ -16,17 +22,103 @@ class Paper(Base):
     # OpenReview credentials for private papers
     openreview_username = Column(String(255), nullable=True)
     openreview_password = Column(String(255), nullable=True)
-    status = Column(String(50), default="pending")  # pending, reviewed, accepted, rejected
+    status = Column(String(50), default="pending", index=True)  # pending, reviewed, accepted, rejected
     last_checked = Column(DateTime, nullable=True)
     last_decision_checked = Column(DateTime, nullable=True)
     last_review_mod_checked = Column(DateTime, nullable=True)
-    review_data = Column(JSON, nullable=True)  # Cached review data
-    decision_data = Column(JSON, nullable=True)  # Cached decision data
+    # Legacy review cache, migrated into the reviews table
+    review_data = deferred(Column(JSON, nullable=True), group=PAPER_BLOB_GROUP)
+    decision_data = deferred(Column(JSON, nullable=True), group=PAPER_BLOB_GROUP)  # Cached decision data
+    decision_hash = Column(String(64), nullable=True)  # Fingerprint of the decision fields we notify on
+    review_count = Column(Integer, default=0, nullable=False, index=True)  # Rows in reviews, kept by sync_reviews
+    # Lifecycle: last observed status/review/decision change, and when polling stopped for lack of subscribers
+    last_changed_at = Column(DateTime, default=datetime.utcnow, nullable=True)
+    paused_at = Column(DateTime, nullable=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationship
     subscribers = relationship("Subscriber", back_populates="paper", cascade="all, delete-orphan")
+    reviews = relationship(
+        "Review",
+        back_populates="paper",
+        cascade="all, delete-orphan",
+        order_by="Review.id",
+    )
+    review_versions = relationship("ReviewVersion", cascade="all, delete-orphan")
+
+
+class PaperArchive(Base):
+    """Retired paper moved out of the scheduler's working set; an admin can reactivate it."""
+    __tablename__ = "paper_archive"
+
+    id = Column(Integer, primary_key=True, index=True)
+    paper_id = Column(Integer, nullable=False)  # papers.id before retirement
+    openreview_id = Column(String(255), unique=True, index=True, nullable=False)
+    submission_number = Column(Integer, nullable=True)
+    title = Column(String(500), nullable=True)
+    venue = Column(String(255), nullable=True, index=True)
+    openreview_username = Column(String(255), nullable=True)  # Still encrypted
+    openreview_password = Column(String(255), nullable=True)
+    status = Column(String(50), nullable=True)
+    reason = Column(String(50), nullable=False)  # e.g. "decided"
+    decision_hash = Column(String(64), nullable=True)
+    review_count = Column(Integer, default=0, nullable=False)
+    subscriber_count = Column(Integer, default=0, nullable=False)
+    # Snapshots restored on reactivation
+    decision_data = deferred(Column(JSON, nullable=True), group=PAPER_BLOB_GROUP)
+    reviews = deferred(Column(JSON, nullable=False), group=PAPER_BLOB_GROUP)
+    subscribers = deferred(Column(JSON, nullable=False), group=PAPER_BLOB_GROUP)
+    review_history = deferred(Column(JSON, nullable=True), group=PAPER_BLOB_GROUP)  # review_versions rows
+    last_changed_at = Column(DateTime, nullable=True)
+    paper_created_at = Column(DateTime, nullable=True)
+    archived_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+
+class Review(Base):
+    """Latest known snapshot of an OpenReview review note, one row per (paper, review)."""
+    __tablename__ = "reviews"
+    __table_args__ = (
+        UniqueConstraint("paper_id", "review_id", name="uq_reviews_paper_review"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    paper_id = Column(Integer, ForeignKey("papers.id"), nullable=False, index=True)
+    review_id = Column(String(255), nullable=False)  # OpenReview note id
+    mdate = Column(BigInteger, nullable=True, index=True)  # OpenReview modification time (ms)
+    # Scores keep the raw OpenReview value (int or "6: marginally above ..." string)
+    rating = Column(JSON, nullable=True)
+    confidence = Column(JSON, nullable=True)
+    soundness = Column(JSON, nullable=True)
+    presentation = Column(JSON, nullable=True)
+    contribution = Column(JSON, nullable=True)
+    # Long review text is only needed to render emails
+    summary = deferred(Column(Text, nullable=True), group="review_text")
+    strengths = deferred(Column(Text, nullable=True), group="review_text")
+    weaknesses = deferred(Column(Text, nullable=True), group="review_text")
+    content_hash = Column(String(64), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relationship
+    paper = relationship("Paper", back_populates="reviews")
+
+
+class ReviewVersion(Base):
+    """Review edit history: periodic full snapshots with field-level deltas in between."""
+    __tablename__ = "review_versions"
+    __table_args__ = (
+        UniqueConstraint("paper_id", "review_id", "version", name="uq_review_versions_version"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    paper_id = Column(Integer, ForeignKey("papers.id"), nullable=False, index=True)
+    review_id = Column(String(255), nullable=False)
+    version = Column(Integer, nullable=False)
+    mdate = Column(BigInteger, nullable=True)
+    is_snapshot = Column(Boolean, default=False, nullable=False)
+    changes = Column(JSON, nullable=False)  # All review fields for snapshots, changed fields otherwise
+    recorded_at = Column(DateTime, default=datetime.utcnow)
 
 
 class Subscriber(Base):
@@ -41,10 +133,175 @@ class Subscriber(Base):
     notify_on_decision = Column(Boolean, default=True)
     notified_review = Column(Boolean, default=False)
     notified_decision = Column(Boolean, default=False)
+    digest = Column(Boolean, default=False)  # Combine notifications per address (see DigestItem)
+    # Delivery health of this address, shared by all subscriptions with the same email
+    send_failures = Column(Integer, default=0, nullable=False)  # Consecutive failed sends
+    hard_failures = Column(Integer, default=0, nullable=False)  # Consecutive 5xx rejections
+    last_send_error = Column(Text, nullable=True)
+    next_send_after = Column(DateTime, nullable=True)  # No new notifications are queued before this
+    quarantined_at = Column(DateTime, nullable=True)  # Set after too many hard failures; admin clears it
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationship
     paper = relationship("Paper", back_populates="subscribers")
+    notifications = relationship("NotificationLedger", cascade="all, delete-orphan")
+
+
+Index("ix_subscribers_email", Subscriber.email)
+# Scheduler candidate lookups for review-mod watchers.
+Index(
+    "ix_subscribers_paper_review_modified",
+    Subscriber.paper_id,
+    Subscriber.notify_on_review_modified,
+)
+
+
+class NotificationLedger(Base):
+    """
+    Notifications a subscriber has been given, one row per (subscriber, event key).
+    - Written in the same transaction that queues the email, so an event is queued at most once
+    - Subscriber.notified_* flags mirror the review/decision rows for display only; what is still owed
+      is always decided from the ledger
+    """
+    __tablename__ = "notification_ledger"
+    __table_args__ = (
+        UniqueConstraint("subscriber_id", "event_key", name="uq_notification_ledger_subscriber_event"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    subscriber_id = Column(Integer, ForeignKey("subscribers.id"), nullable=False)
+    # "review", "decision" or "review_modified:<fingerprint of the modified reviews>"
+    event_key = Column(String(255), nullable=False)
+    kind = Column(String(50), nullable=False)  # review, decision, review_modified
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class PaperEvent(Base):
+    """
+    Append-only log of changes observed by the check pipeline; the id is the consumers' cursor.
+    - Written in the same transaction as the paper state it describes
+    - Read by notification dispatch and other consumers through EventCursor rows
+    """
+    __tablename__ = "paper_events"
+    # Never reuse ids of pruned events: cursors must only move forward
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    id = Column(Integer, primary_key=True, index=True)
+    # No foreign keys, like the outbox: events outlive archived and deleted papers
+    paper_id = Column(Integer, nullable=False, index=True)
+    openreview_id = Column(String(255), nullable=False)
+    venue = Column(String(255), nullable=True)
+    kind = Column(String(50), nullable=False)  # review_added, review_modified, decision_posted, status_changed
+    payload = Column(JSON, nullable=False)
+    notify = Column(Boolean, default=True, nullable=False)  # False for changes found by a silent sync
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+
+class EventCursor(Base):
+    """Last paper_events id processed by a named consumer."""
+    __tablename__ = "event_cursors"
+
+    consumer = Column(String(100), primary_key=True)
+    position = Column(Integer, default=0, nullable=False)
+    # Failure handling (see consume_events): failed passes on the event after position, the end of a
+    # failed batch that is retried one event at a time, and the latest handler error
+    failures = Column(Integer, default=0, nullable=False)
+    retry_until = Column(Integer, nullable=True)
+    last_error = Column(Text, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class JobCheckpoint(Base):
+    """Progress of a resumable bulk job, committed with every chunk it finishes."""
+    __tablename__ = "job_checkpoints"
+
+    job = Column(String(100), primary_key=True)
+    position = Column(Integer, default=0, nullable=False)  # Last paper id committed
+    processed = Column(Integer, default=0, nullable=False)
+    failed = Column(JSON, nullable=True)  # Paper ids whose check failed; retried on resume
+    force = Column(Boolean, default=True, nullable=False)
+    holder = Column(String(255), nullable=True)  # check_run lease holder advancing the job
+    started_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)  # Heartbeat: last chunk
+
+
+class CheckJob(Base):
+    """State of a check job shared by all worker processes; the worker running it keeps the row current."""
+    __tablename__ = "check_jobs"
+
+    job_id = Column(String(32), primary_key=True)
+    job_type = Column(String(100), nullable=False)
+    worker = Column(String(255), nullable=False)  # Process that queued or runs the job
+    status = Column(String(20), nullable=False, index=True)  # queued, running, completed, failed, cancelled
+    total = Column(Integer, default=0, nullable=False)
+    processed = Column(Integer, default=0, nullable=False)
+    current_paper = Column(String(255), nullable=True)
+    counts = Column(JSON, nullable=False)
+    errors = Column(JSON, nullable=False)  # Latest paper errors
+    error = Column(Text, nullable=True)
+    cancel_requested = Column(Boolean, default=False, nullable=False)  # Set by any worker, polled by the runner
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class SchedulerLease(Base):
+    """Names the one process that runs scheduled jobs until expires_at; renewed by its heartbeat."""
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String(100), primary_key=True)
+    holder = Column(String(255), nullable=False)  # hostname:pid:random of the leading process
+    acquired_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    renewed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+
+
+class DigestItem(Base):
+    """Notification event held for a digest subscriber until the digest window closes."""
+    __tablename__ = "digest_items"
+    __table_args__ = (
+        Index("ix_digest_items_email_created", "to_email", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    to_email = Column(String(255), nullable=False)
+    kind = Column(String(50), nullable=False)  # review, decision, review_modified
+    # No foreign keys, like the outbox: a collected event survives its paper being archived
+    paper_id = Column(Integer, nullable=True)
+    subscriber_id = Column(Integer, nullable=True)
+    openreview_id = Column(String(255), nullable=False)
+    title = Column(String(1000), nullable=True)
+    venue = Column(String(255), nullable=True)
+    summary = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class OutboxMessage(Base):
+    """Rendered notification email queued for the delivery workers."""
+    __tablename__ = "outbox"
+    __table_args__ = (
+        Index("ix_outbox_status_next_attempt", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String(50), nullable=False)  # review, decision, review_modified, digest
+    # No foreign keys: queued mail is still delivered if the paper is archived or deleted
+    paper_id = Column(Integer, nullable=True, index=True)
+    subscriber_id = Column(Integer, nullable=True)
+    to_email = Column(String(255), nullable=False)
+    subject = Column(String(1000), nullable=False)
+    html = deferred(Column(Text, nullable=False))
+    # Identifies the rendered content, so workers reuse one encoded body for all recipients
+    render_key = Column(String(255), nullable=True)
+    status = Column(String(20), default="pending", nullable=False)  # pending, sending, sent, dead
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    locked_until = Column(DateTime, nullable=True)  # Claim expiry while status is "sending"
+    claim_token = Column(String(32), nullable=True)  # Identifies the latest claim; only its holder may send
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime, nullable=True)
 
 
 class EmailVerification(Base):
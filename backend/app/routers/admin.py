@@ -1,19 +1,45 @@
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List
-from datetime import timedelta
-
-from ..database import get_db
-from ..models import Paper, Subscriber, Config
+from sqlalchemy import case, func, tuple_
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Tuple
+from datetime import datetime, timedelta
+import asyncio
+import json
+
+from ..database import get_db, SessionLocal
+from ..models import Paper, PaperArchive, PaperEvent, Subscriber, Config, OutboxMessage
 from ..schemas import (
     AdminLogin, TokenResponse, PaperResponse, PaperUpdate,
-    ConfigResponse, ConfigUpdate, MessageResponse, TestEmailRequest
+    ConfigResponse, ConfigUpdate, MessageResponse, TestEmailRequest,
+    RatingTimelineResponse, ArchivedPaperResponse, OutboxMessageResponse,
+    ChangeFeedResponse, PaperEventResponse, PaperCheckRequest, CheckJobResponse, JobResponse,
+    SchedulerStatusResponse
 )
 from ..utils.auth import verify_admin_password, create_access_token, get_current_admin
 from ..utils.crypto import encrypt_value
 from ..utils.rate_limit import RateLimiter
-from ..services.scheduler import get_email_service
+from ..utils.pagination import (
+    MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, decode_cursor, encode_cursor, etag_json_response
+)
+from ..services.scheduler import get_email_service, scheduler_lease
+from ..services.config_cache import bump_config_version, get_runtime_config, invalidate_config_cache
+from ..services.reviews import get_rating_timeline
+from ..services.lifecycle import restore_archived_paper
+from ..services.dispatch import wake_dispatcher
+from ..services.events import listen_for_events
+from ..services.jobs import (
+    Job,
+    RemoteJobWatcher,
+    cancel_job as cancel_any_job,
+    get_job as get_any_job,
+    list_jobs as list_all_jobs,
+    queue_job,
+)
+from ..services.progress import progress_broker
+from ..services.smtp_pool import smtp_pool_stats
 from ..config import get_settings
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
@@ -62,46 +88,103 @@ async def admin_login(login_data: AdminLogin, request: Request):
     return TokenResponse(token=access_token)
 
 
+_PAPER_LIST_COLUMNS = (
+    Paper.id,
+    Paper.openreview_id,
+    Paper.submission_number,
+    Paper.title,
+    Paper.venue,
+    Paper.status,
+    Paper.last_checked,
+    Paper.created_at,
+    Paper.paused_at,
+)
+
+# Keyset sort keys; NULLs are coalesced so they sort first like the original venue ordering.
+_PAPER_SORT_KEYS = {
+    "venue": (func.coalesce(Paper.venue, ""), func.coalesce(Paper.submission_number, -1)),
+    "created_at": (Paper.created_at,),
+    "title": (func.coalesce(Paper.title, ""),),
+    "status": (func.coalesce(Paper.status, ""),),
+}
+
+
+def _paper_list_query(db: Session, sort_keys):
+    """Papers with subscriber stats aggregated in a single GROUP BY query."""
+    return db.query(
+        *_PAPER_LIST_COLUMNS,
+        func.count(Subscriber.id).label("subscriber_count"),
+        func.max(case((Subscriber.notified_review == True, 1), else_=0)).label("any_notified_review"),
+        func.max(case((Subscriber.notified_decision == True, 1), else_=0)).label("any_notified_decision"),
+        *[key.label(f"sort_{idx}") for idx, key in enumerate(sort_keys)],
+    ).outerjoin(
+        Subscriber, Subscriber.paper_id == Paper.id
+    ).group_by(Paper.id)
+
+
+def _paper_list_response(row) -> PaperResponse:
+    return PaperResponse(
+        id=row.id,
+        openreview_id=row.openreview_id,
+        submission_number=row.submission_number,
+        title=row.title,
+        venue=row.venue,
+        status=row.status,
+        last_checked=row.last_checked,
+        created_at=row.created_at,
+        subscriber_count=row.subscriber_count,
+        notified_review=bool(row.any_notified_review),
+        notified_decision=bool(row.any_notified_decision),
+        paused_at=row.paused_at,
+    )
+
+
 @router.get("/papers", response_model=List[PaperResponse])
 async def get_all_papers(
+    request: Request,
+    venue: Optional[str] = None,
+    paper_status: Optional[str] = Query(default=None, alias="status"),
+    sort: Literal["venue", "created_at", "title", "status"] = "venue",
+    order: Literal["asc", "desc"] = "asc",
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     _: bool = Depends(get_current_admin)
 ):
-    """Get all monitored papers with subscriber counts and notification status."""
-    # Get papers ordered by venue and submission number
-    papers = db.query(Paper).order_by(Paper.venue, Paper.submission_number).all()
-
-    result = []
-    for paper in papers:
-        # Get subscriber stats
-        sub_count = db.query(Subscriber).filter(Subscriber.paper_id == paper.id).count()
-
-        # Check if any subscriber has been notified
-        any_notified_review = db.query(Subscriber).filter(
-            Subscriber.paper_id == paper.id,
-            Subscriber.notified_review == True
-        ).first() is not None
-
-        any_notified_decision = db.query(Subscriber).filter(
-            Subscriber.paper_id == paper.id,
-            Subscriber.notified_decision == True
-        ).first() is not None
-
-        result.append(PaperResponse(
-            id=paper.id,
-            openreview_id=paper.openreview_id,
-            submission_number=paper.submission_number,
-            title=paper.title,
-            venue=paper.venue,
-            status=paper.status,
-            last_checked=paper.last_checked,
-            created_at=paper.created_at,
-            subscriber_count=sub_count,
-            notified_review=any_notified_review,
-            notified_decision=any_notified_decision,
-        ))
-
-    return result
+    """
+    Get monitored papers with subscriber counts and notification status.
+    - Optional venue/status filters and sorting
+    - Keyset pagination via limit + cursor; the next cursor is returned in X-Next-Cursor
+    - Responses carry an ETag and return 304 when the page is unchanged
+    """
+    sort_keys = _PAPER_SORT_KEYS[sort] + (Paper.id,)
+    query = _paper_list_query(db, sort_keys)
+
+    if venue is not None:
+        query = query.filter(Paper.venue == venue)
+    if paper_status is not None:
+        query = query.filter(Paper.status == paper_status)
+    if cursor:
+        after = decode_cursor(cursor, sort_keys)
+        position = tuple_(*sort_keys)
+        query = query.filter(position > tuple_(*after) if order == "asc" else position < tuple_(*after))
+
+    query = query.order_by(*[key.asc() if order == "asc" else key.desc() for key in sort_keys])
+    if limit is not None:
+        query = query.limit(limit + 1)
+    rows = query.all()
+
+    headers = {}
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            [getattr(last, f"sort_{idx}") for idx in range(len(sort_keys))]
+        )
+
+    result = [_paper_list_response(row) for row in rows]
+
+    return etag_json_response(request, result, headers=headers)
 
 
 @router.delete("/papers/{paper_id}", response_model=MessageResponse)
@@ -159,9 +242,368 @@ async def update_paper(
         status=paper.status,
         last_checked=paper.last_checked,
         created_at=paper.created_at,
-        subscriber_count=subscriber_count
+        subscriber_count=subscriber_count,
+        paused_at=paper.paused_at,
+    )
+
+
+@router.get("/papers/{paper_id}/rating-timeline", response_model=RatingTimelineResponse)
+async def get_paper_rating_timeline(
+    paper_id: int,
+    db: Session = Depends(get_db),
+    _: bool = Depends(get_current_admin)
+):
+    """Get how review ratings and confidences moved over time for a paper."""
+    paper = db.query(Paper).filter(Paper.id == paper_id).first()
+
+    if not paper:
+        raise HTTPException(status_code=404, detail="Paper not found")
+
+    return RatingTimelineResponse(
+        paper_id=paper.id,
+        openreview_id=paper.openreview_id,
+        reviews=get_rating_timeline(db, paper.id),
+    )
+
+
+_ARCHIVE_COLUMNS = (
+    PaperArchive.id,
+    PaperArchive.paper_id,
+    PaperArchive.openreview_id,
+    PaperArchive.submission_number,
+    PaperArchive.title,
+    PaperArchive.venue,
+    PaperArchive.status,
+    PaperArchive.reason,
+    PaperArchive.review_count,
+    PaperArchive.subscriber_count,
+    PaperArchive.last_changed_at,
+    PaperArchive.archived_at,
+)
+
+
+@router.get("/archive", response_model=List[ArchivedPaperResponse])
+async def get_archived_papers(
+    request: Request,
+    venue: Optional[str] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    _: bool = Depends(get_current_admin)
+):
+    """
+    Get retired papers, most recently archived first.
+    - Keyset pagination via limit + cursor; the next cursor is returned in X-Next-Cursor
+    """
+    sort_keys = (PaperArchive.archived_at, PaperArchive.id)
+    query = db.query(*_ARCHIVE_COLUMNS)
+    if venue is not None:
+        query = query.filter(PaperArchive.venue == venue)
+    if cursor:
+        after = decode_cursor(cursor, sort_keys)
+        query = query.filter(tuple_(*sort_keys) < tuple_(*after))
+
+    query = query.order_by(*[key.desc() for key in sort_keys])
+    if limit is not None:
+        query = query.limit(limit + 1)
+    rows = query.all()
+
+    headers = {}
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor([rows[-1].archived_at, rows[-1].id])
+
+    result = [ArchivedPaperResponse(**row._asdict()) for row in rows]
+    return etag_json_response(request, result, headers=headers)
+
+
+@router.post("/archive/{archive_id}/reactivate", response_model=PaperResponse)
+async def reactivate_archived_paper(
+    archive_id: int,
+    db: Session = Depends(get_db),
+    _: bool = Depends(get_current_admin)
+):
+    """Move a retired paper back into monitoring with its subscribers."""
+    archived = db.query(PaperArchive).filter(PaperArchive.id == archive_id).first()
+
+    if not archived:
+        raise HTTPException(status_code=404, detail="Archived paper not found")
+
+    if db.query(Paper.id).filter(Paper.openreview_id == archived.openreview_id).first():
+        raise HTTPException(status_code=409, detail="This paper is already being monitored")
+
+    paper = restore_archived_paper(db, archived)
+    db.commit()
+    db.refresh(paper)
+
+    subscriber_count = db.query(Subscriber).filter(Subscriber.paper_id == paper.id).count()
+
+    return PaperResponse(
+        id=paper.id,
+        openreview_id=paper.openreview_id,
+        submission_number=paper.submission_number,
+        title=paper.title,
+        venue=paper.venue,
+        status=paper.status,
+        last_checked=paper.last_checked,
+        created_at=paper.created_at,
+        subscriber_count=subscriber_count,
+        paused_at=paper.paused_at,
+    )
+
+
+@router.get("/outbox", response_model=List[OutboxMessageResponse])
+async def get_outbox_messages(
+    message_status: Optional[Literal["pending", "sending", "sent", "dead"]] = Query(default=None, alias="status"),
+    limit: int = Query(default=100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    _: bool = Depends(get_current_admin)
+):
+    """
+    Get queued notification emails, newest first.
+    - Optional status filter (e.g. status=dead for dead letters)
+    - Keyset pagination via limit + cursor; the next cursor is returned in X-Next-Cursor
+    """
+    query = db.query(OutboxMessage)
+    if message_status is not None:
+        query = query.filter(OutboxMessage.status == message_status)
+    if cursor:
+        (before_id,) = decode_cursor(cursor, (OutboxMessage.id,))
+        query = query.filter(OutboxMessage.id < before_id)
+    rows = query.order_by(OutboxMessage.id.desc()).limit(limit + 1).all()
+
+    headers = {}
+    if len(rows) > limit:
+        rows = rows[:limit]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor([rows[-1].id])
+
+    result = [OutboxMessageResponse.model_validate(row) for row in rows]
+    return JSONResponse(content=jsonable_encoder(result), headers=headers)
+
+
+@router.post("/outbox/{message_id}/retry", response_model=MessageResponse)
+async def retry_outbox_message(
+    message_id: int,
+    db: Session = Depends(get_db),
+    _: bool = Depends(get_current_admin)
+):
+    """Queue a dead-lettered email for delivery again."""
+    message = db.query(OutboxMessage).filter(OutboxMessage.id == message_id).first()
+
+    if not message:
+        raise HTTPException(status_code=404, detail="Outbox message not found")
+
+    if message.status != "dead":
+        raise HTTPException(status_code=400, detail="Only dead-lettered messages can be retried")
+
+    message.status = "pending"
+    message.attempts = 0
+    message.next_attempt_at = datetime.utcnow()
+    db.commit()
+    wake_dispatcher()
+
+    return MessageResponse(message="Message queued for delivery")
+
+
+# Without a signal from this process (e.g. events written by another worker), re-read this often
+_CHANGE_FEED_RECHECK_SECONDS = 5.0
+
+
+def _read_changes(
+    after_id: Optional[int], venue: Optional[str], limit: int
+) -> Tuple[List[PaperEventResponse], int, bool]:
+    """Events after after_id (head of the log when None); returns (events, next cursor id, truncated)."""
+    with SessionLocal() as db:
+        head_id, oldest_id = db.query(func.max(PaperEvent.id), func.min(PaperEvent.id)).one()
+        head_id = head_id or 0
+        if after_id is None:
+            return [], head_id, False
+
+        truncated = oldest_id is not None and after_id + 1 < oldest_id
+        query = db.query(PaperEvent).filter(PaperEvent.id > after_id, PaperEvent.id <= head_id)
+        if venue:
+            query = query.filter(PaperEvent.venue == venue)
+        rows = query.order_by(PaperEvent.id).limit(limit).all()
+        # Skip past non-matching events too, unless the page is full
+        next_id = rows[-1].id if len(rows) >= limit else max(after_id, head_id)
+        return [PaperEventResponse.model_validate(row) for row in rows], next_id, truncated
+
+
+@router.get("/changes", response_model=ChangeFeedResponse)
+async def get_changes(
+    cursor: Optional[str] = None,
+    venue: Optional[str] = None,
+    timeout: float = Query(default=25.0, ge=0, le=60),
+    limit: int = Query(default=100, ge=1, le=MAX_PAGE_SIZE),
+    _: bool = Depends(get_current_admin)
+):
+    """
+    Change feed of paper events (review_added, review_modified, decision_posted, status_changed).
+    - Without a cursor, returns the current head cursor immediately
+    - With a cursor, long-polls up to `timeout` seconds until newer events (optionally of one venue) arrive
+    - `truncated` means events after the cursor were pruned; reload state from /papers and continue
+    """
+    after_id = decode_cursor(cursor, (PaperEvent.id,))[0] if cursor else None
+    deadline = asyncio.get_running_loop().time() + timeout
+    truncated = False
+    with listen_for_events() as new_events:
+        while True:
+            new_events.clear()
+            events, after_id, page_truncated = _read_changes(after_id, venue, limit)
+            truncated = truncated or page_truncated
+            remaining = deadline - asyncio.get_running_loop().time()
+            if events or cursor is None or remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(new_events.wait(), timeout=min(remaining, _CHANGE_FEED_RECHECK_SECONDS))
+            except asyncio.TimeoutError:
+                pass
+
+    return ChangeFeedResponse(events=events, cursor=encode_cursor([after_id]), truncated=truncated)
+
+
+_JOB_STREAM_KEEPALIVE_SECONDS = 15.0
+# How often a stream reads check_jobs for jobs running in other workers
+_JOB_STREAM_REMOTE_POLL_SECONDS = 2.0
+
+
+def _poll_remote_jobs(watcher: RemoteJobWatcher) -> List[Tuple[str, Dict[str, Any]]]:
+    db = SessionLocal()
+    try:
+        return watcher.poll(db)
+    finally:
+        db.close()
+
+
+@router.get("/jobs/events")
+async def stream_job_events(
+    request: Request,
+    _: bool = Depends(get_current_admin)
+):
+    """
+    Server-Sent Events stream of scheduler job progress.
+    - Jobs of this worker: started, paper_fetched, paper_skipped, paper_failed, completed, failed, cancelled
+    - notifications_queued (count, digests) when the event consumers queued mail in this worker
+    - Jobs of other workers (e.g. scheduled ticks in the lease holder), read from check_jobs every few
+      seconds: started, progress (processed, total and totals so far), completed, failed, cancelled
+    - Every event carries the job_id; "dropped" reports events skipped because the client fell behind
+    - Send Last-Event-ID to resume after a reconnect (recent events of this worker only)
+    """
+    last_event_id = request.headers.get("last-event-id")
+    subscription = progress_broker.subscribe(
+        int(last_event_id) if last_event_id and last_event_id.isdigit() else None
     )
 
+    remote_jobs = RemoteJobWatcher()
+
+    async def stream() -> AsyncIterator[str]:
+        try:
+            yield "retry: 3000\n\n"
+            loop = asyncio.get_running_loop()
+            last_sent = loop.time()
+            while not await request.is_disconnected():
+                events = await subscription.next_batch(_JOB_STREAM_REMOTE_POLL_SECONDS)
+                for event in events:
+                    event_id = f"id: {event.id}\n" if event.id else ""
+                    yield f"{event_id}event: {event.kind}\ndata: {json.dumps(event.data)}\n\n"
+                remote_events = await run_in_threadpool(_poll_remote_jobs, remote_jobs)
+                for kind, data in remote_events:
+                    yield f"event: {kind}\ndata: {json.dumps(data)}\n\n"
+                if events or remote_events:
+                    last_sent = loop.time()
+                elif loop.time() - last_sent >= _JOB_STREAM_KEEPALIVE_SECONDS:
+                    yield ": keepalive\n\n"
+                    last_sent = loop.time()
+        finally:
+            progress_broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _job_response(job: Job) -> JobResponse:
+    return JobResponse(
+        job_id=job.job_id,
+        job_type=job.job_type,
+        status=job.status,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        total=job.total,
+        processed=job.processed,
+        current_paper=job.current_paper,
+        eta_seconds=job.eta_seconds,
+        counts=dict(job.counts),
+        error_count=job.counts.get("paper_failed", 0),
+        errors=list(job.errors),
+        error=job.error,
+        cancel_requested=job.cancel_requested,
+    )
+
+
+@router.get("/scheduler", response_model=SchedulerStatusResponse)
+async def get_scheduler_status(
+    db: Session = Depends(get_db),
+    _: bool = Depends(get_current_admin)
+):
+    """Which worker holds the scheduler lease and runs scheduled checks."""
+    lease = scheduler_lease.current(db)
+    return SchedulerStatusResponse(
+        worker=scheduler_lease.holder,
+        is_leader=scheduler_lease.is_leader,
+        leader=lease.holder if lease is not None and lease.expires_at > datetime.utcnow() else None,
+        lease_expires_at=lease.expires_at if lease is not None else None,
+    )
+
+
+@router.get("/jobs", response_model=List[JobResponse])
+async def list_jobs(
+    _: bool = Depends(get_current_admin)
+):
+    """List queued, running and recently finished check jobs of all workers, newest first."""
+    return [_job_response(job) for job in list_all_jobs()]
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: str,
+    _: bool = Depends(get_current_admin)
+):
+    """Get the progress of one check job (of any worker)."""
+    job = get_any_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return _job_response(job)
+
+
+@router.post("/jobs/{job_id}/cancel", response_model=JobResponse)
+async def cancel_job(
+    job_id: str,
+    _: bool = Depends(get_current_admin)
+):
+    """
+    Cancel a check job of any worker.
+    - A queued job never starts; a running job stops before its next paper and keeps the papers checked so far
+    """
+    job = cancel_any_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if not job.cancel_requested:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Job already {job.status}")
+    return _job_response(job)
+
+
+@router.get("/smtp-pool", response_model=Dict[str, Dict[str, Any]])
+async def get_smtp_pool_stats(
+    _: bool = Depends(get_current_admin)
+):
+    """Get SMTP connection pool metrics (sessions opened, reuse, throughput) for this worker."""
+    return smtp_pool_stats()
+
 
 @router.get("/config", response_model=ConfigResponse)
 async def get_config(
@@ -169,33 +611,16 @@ async def get_config(
     _: bool = Depends(get_current_admin)
 ):
     """Get system configuration."""
-    def get_config_value(key: str, default: str, allow_empty: bool = True) -> str:
-        config = db.query(Config).filter(Config.key == key).first()
-        if not config or config.value is None:
-            return default
-        if not allow_empty and not config.value.strip():
-            return default
-        return config.value
-
+    config = get_runtime_config(db)
     return ConfigResponse(
-        check_interval=int(get_config_value("check_interval", str(settings.check_interval))),
-        review_mod_check_interval=int(
-            get_config_value(
-                "review_mod_check_interval",
-                str(settings.review_mod_check_interval)
-            )
-        ),
-        review_mod_request_gap_seconds=float(
-            get_config_value(
-                "review_mod_request_gap_seconds",
-                str(settings.review_mod_request_gap_seconds)
-            )
-        ),
-        smtp_host=get_config_value("smtp_host", settings.smtp_host),
-        smtp_port=int(get_config_value("smtp_port", str(settings.smtp_port))),
-        smtp_user=get_config_value("smtp_user", settings.smtp_user),
-        from_email=get_config_value("from_email", settings.from_email),
-        from_name=get_config_value("from_name", settings.from_name, allow_empty=False)
+        check_interval=config.check_interval,
+        review_mod_check_interval=config.review_mod_check_interval,
+        review_mod_request_gap_seconds=config.review_mod_request_gap_seconds,
+        smtp_host=config.smtp_host,
+        smtp_port=config.smtp_port,
+        smtp_user=config.smtp_user,
+        from_email=config.from_email,
+        from_name=config.from_name,
     )
 
 
@@ -236,7 +661,9 @@ async def update_config(
     if config_data.from_name is not None:
         set_config_value("from_name", config_data.from_name)
 
+    bump_config_version(db)
     db.commit()
+    invalidate_config_cache()
 
     return MessageResponse(message="Configuration updated successfully")
 
@@ -258,25 +685,88 @@ async def send_test_email(
         raise HTTPException(status_code=500, detail=f"Failed to send email: {str(e)}")
 
 
-@router.post("/check-now", response_model=MessageResponse)
+@router.post("/check-now", response_model=CheckJobResponse)
 async def check_now(
     background_tasks: BackgroundTasks,
     _: bool = Depends(get_current_admin)
 ):
     """Trigger an immediate check of all papers."""
     from ..services.scheduler import check_all_papers
-    background_tasks.add_task(check_all_papers, True)
+    job = queue_job("check_all_papers")
+    background_tasks.add_task(check_all_papers, True, job.job_id)
+
+    return CheckJobResponse(job_id=job.job_id, message="Paper check initiated")
+
+
+@router.post("/papers/{paper_id}/check", response_model=PaperResponse)
+async def check_paper(
+    paper_id: int,
+    db: Session = Depends(get_db),
+    _: bool = Depends(get_current_admin)
+):
+    """Check one paper against OpenReview now and return its fresh state."""
+    from ..services.scheduler import check_paper_now
+
+    if not db.query(Paper.id).filter(Paper.id == paper_id).first():
+        raise HTTPException(status_code=404, detail="Paper not found")
+
+    run = await run_in_threadpool(check_paper_now, paper_id)
+    if run is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Another check job is running. Try again shortly.",
+        )
+    if run.error is not None or run.counts.get("paper_failed"):
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="OpenReview check failed")
+
+    db.expire_all()
+    row = _paper_list_query(db, (Paper.id,)).filter(Paper.id == paper_id).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Paper not found")
+    return _paper_list_response(row)
+
+
+@router.post("/check", response_model=CheckJobResponse)
+async def check_papers(
+    request_data: PaperCheckRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    _: bool = Depends(get_current_admin)
+):
+    """
+    Check a list of papers or every paper of a venue now, as a background job.
+    - Runs after any check job already in progress; follow it on /jobs/events by job_id
+    """
+    from ..services.scheduler import check_papers_now
+
+    if (request_data.paper_ids is None) == (request_data.venue is None):
+        raise HTTPException(status_code=400, detail="Provide either paper_ids or venue")
+
+    query = db.query(func.count(Paper.id))
+    if request_data.paper_ids is not None:
+        query = query.filter(Paper.id.in_(request_data.paper_ids))
+    else:
+        query = query.filter(Paper.venue == request_data.venue)
+    paper_count = query.scalar()
+    if not paper_count:
+        raise HTTPException(status_code=404, detail="No matching papers")
+
+    job = queue_job("check_venue" if request_data.venue is not None else "check_papers")
+    background_tasks.add_task(
+        check_papers_now, job.job_id, paper_ids=request_data.paper_ids, venue=request_data.venue
+    )
 
-    return MessageResponse(message="Paper check initiated")
+    return CheckJobResponse(job_id=job.job_id, paper_count=paper_count, message="Paper check queued")
 
 
-@router.post("/sync-status-silent", response_model=MessageResponse)
+@router.post("/sync-status-silent", response_model=CheckJobResponse)
 async def sync_status_silent(
     background_tasks: BackgroundTasks,
     _: bool = Depends(get_current_admin)
 ):
     """Trigger a full status sync without sending any notification emails."""
     from ..services.scheduler import sync_all_papers_status_silent
-    background_tasks.add_task(sync_all_papers_status_silent, True)
+    job = queue_job("sync_all_papers_status_silent")
+    background_tasks.add_task(sync_all_papers_status_silent, True, job.job_id)
 
-    return MessageResponse(message="Silent paper status sync initiated")
+    return CheckJobResponse(job_id=job.job_id, message="Silent paper status sync initiated")
@@ -8,15 +8,19 @@ import hmac
 from datetime import datetime, timedelta
 
 from ..database import get_db
-from ..models import Paper, Subscriber, EmailVerification
+from ..models import Paper, PaperArchive, Subscriber, EmailVerification
 from ..schemas import (
     PaperCreate, PaperResponse, MessageResponse,
     PaperPreview, PaperPreviewRequest, EmailVerificationRequest, EmailVerificationResponse
 )
 from ..services.openreview import OpenReviewService
 from ..services.scheduler import get_email_service
+from ..services.reviews import sync_reviews
+from ..services.lifecycle import restore_archived_paper
+from ..services.notifications import record_existing_notifications
 from ..config import get_settings
 from ..utils.crypto import encrypt_value
+from ..utils.fingerprint import decision_fingerprint
 from ..utils.auth import get_current_admin
 from ..utils.rate_limit import RateLimiter
 
@@ -238,10 +242,16 @@ def _require_valid_verification(
 async def add_paper(paper_data: PaperCreate, db: Session = Depends(get_db)):
     """Add a confirmed paper to monitor."""
 
-    # Check if paper already exists
+    # Check if paper already exists (archived papers come back with their subscribers)
     existing_paper = db.query(Paper).filter(
         Paper.openreview_id == paper_data.openreview_id
     ).first()
+    if not existing_paper:
+        archived = db.query(PaperArchive).filter(
+            PaperArchive.openreview_id == paper_data.openreview_id
+        ).first()
+        if archived:
+            existing_paper = restore_archived_paper(db, archived)
 
     if existing_paper:
         # Check if this email is already subscribed
@@ -264,11 +274,7 @@ async def add_paper(paper_data: PaperCreate, db: Session = Depends(get_db)):
         )
 
         # Add new subscriber to existing paper
-        existing_review_data = existing_paper.review_data or {}
-        existing_reviews = existing_review_data.get("reviews", [])
-        if not isinstance(existing_reviews, list):
-            existing_reviews = []
-        has_existing_reviews = bool(existing_reviews) or existing_paper.status in {
+        has_existing_reviews = existing_paper.review_count > 0 or existing_paper.status in {
             "reviewed",
             "accepted",
             "rejected",
@@ -286,10 +292,13 @@ async def add_paper(paper_data: PaperCreate, db: Session = Depends(get_db)):
             notify_on_review=paper_data.notify_on_review,
             notify_on_review_modified=paper_data.notify_on_review_modified,
             notify_on_decision=paper_data.notify_on_decision,
+            digest=paper_data.digest,
             notified_review=has_existing_reviews,
             notified_decision=has_existing_decision,
         )
         db.add(subscriber)
+        record_existing_notifications(db, subscriber)
+        existing_paper.paused_at = None
         verification.used_at = datetime.utcnow()
         db.commit()
 
@@ -349,11 +358,12 @@ async def add_paper(paper_data: PaperCreate, db: Session = Depends(get_db)):
         openreview_password=encrypt_value(paper_data.openreview_password),
         status=current_status,
         last_checked=datetime.utcnow(),
-        review_data={"reviews": current_reviews, "review_count": len(current_reviews)},
         decision_data=current_decision if current_decision else None,
+        decision_hash=decision_fingerprint(current_decision) if current_decision else None,
     )
     db.add(paper)
     db.flush()  # Get the paper ID
+    sync_reviews(db, paper, current_reviews)
 
     # Create subscriber
     subscriber = Subscriber(
@@ -362,10 +372,12 @@ async def add_paper(paper_data: PaperCreate, db: Session = Depends(get_db)):
         notify_on_review=paper_data.notify_on_review,
         notify_on_review_modified=paper_data.notify_on_review_modified,
         notify_on_decision=paper_data.notify_on_decision,
+        digest=paper_data.digest,
         notified_review=bool(current_reviews),
         notified_decision=bool(current_decision),
     )
     db.add(subscriber)
+    record_existing_notifications(db, subscriber)
     verification.used_at = datetime.utcnow()
     db.commit()
 
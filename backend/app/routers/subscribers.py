@@ -1,43 +1,148 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy import func, select, tuple_
+from typing import Iterator, List, Literal, Optional
+import csv
+import io
+import json
 
-from ..database import get_db
+from ..database import get_db, SessionLocal
 from ..models import Subscriber, Paper
 from ..schemas import SubscriberResponse, MessageResponse
 from ..utils.auth import get_current_admin
+from ..utils.pagination import MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from ..services.lifecycle import pause_if_orphaned
+from ..services.notifications import forget_notifications
 
 router = APIRouter(prefix="/api/admin/subscribers", tags=["subscribers"])
 
 
+_SUBSCRIBER_COLUMNS = (
+    Subscriber.id,
+    Subscriber.paper_id,
+    Subscriber.email,
+    Subscriber.notify_on_review,
+    Subscriber.notify_on_review_modified,
+    Subscriber.notify_on_decision,
+    Subscriber.notified_review,
+    Subscriber.notified_decision,
+    Subscriber.digest,
+    Subscriber.send_failures,
+    Subscriber.hard_failures,
+    Subscriber.last_send_error,
+    Subscriber.next_send_after,
+    Subscriber.quarantined_at,
+    Subscriber.created_at,
+    Paper.title.label("paper_title"),
+    Paper.venue.label("paper_venue"),
+    Paper.submission_number.label("submission_number"),
+)
+
+# Keyset sort key matching the venue / submission number / subscriber id ordering
+_SUBSCRIBER_SORT_KEYS = (
+    func.coalesce(Paper.venue, ""),
+    func.coalesce(Paper.submission_number, -1),
+    Subscriber.id,
+)
+
+_EXPORT_BATCH_SIZE = 1000
+
+
+def _subscriber_select():
+    return select(
+        *_SUBSCRIBER_COLUMNS,
+        *[key.label(f"sort_{idx}") for idx, key in enumerate(_SUBSCRIBER_SORT_KEYS)],
+    ).join(Paper, Paper.id == Subscriber.paper_id).order_by(*_SUBSCRIBER_SORT_KEYS)
+
+
+def _subscriber_row_dict(row) -> dict:
+    return {
+        column.key: getattr(row, column.key)
+        for column in _SUBSCRIBER_COLUMNS
+    }
+
+
 @router.get("", response_model=List[SubscriberResponse])
 async def get_all_subscribers(
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    quarantined: Optional[bool] = None,
     db: Session = Depends(get_db),
     _: bool = Depends(get_current_admin)
 ):
-    """Get all subscribers with paper information."""
-    subscribers = db.query(Subscriber).join(Paper).order_by(
-        Paper.venue, Paper.submission_number, Subscriber.id
-    ).all()
-
-    result = []
-    for sub in subscribers:
-        result.append(SubscriberResponse(
-            id=sub.id,
-            paper_id=sub.paper_id,
-            email=sub.email,
-            notify_on_review=sub.notify_on_review,
-            notify_on_review_modified=sub.notify_on_review_modified,
-            notify_on_decision=sub.notify_on_decision,
-            notified_review=sub.notified_review,
-            notified_decision=sub.notified_decision,
-            created_at=sub.created_at,
-            paper_title=sub.paper.title,
-            paper_venue=sub.paper.venue,
-            submission_number=sub.paper.submission_number,
-        ))
-
-    return result
+    """
+    Get subscribers with paper information.
+    Pass limit (and the X-Next-Cursor value of the previous page as cursor) to paginate.
+    Pass quarantined=true to list only addresses that stopped receiving mail.
+    """
+    stmt = _subscriber_select()
+    if quarantined is not None:
+        stmt = stmt.where(
+            Subscriber.quarantined_at.isnot(None) if quarantined else Subscriber.quarantined_at.is_(None)
+        )
+    if cursor:
+        after = decode_cursor(cursor, _SUBSCRIBER_SORT_KEYS)
+        stmt = stmt.where(tuple_(*_SUBSCRIBER_SORT_KEYS) > tuple_(*after))
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
+    rows = db.execute(stmt).all()
+
+    headers = {}
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            [getattr(last, f"sort_{idx}") for idx in range(len(_SUBSCRIBER_SORT_KEYS))]
+        )
+
+    result = [SubscriberResponse(**_subscriber_row_dict(row)) for row in rows]
+    return JSONResponse(content=jsonable_encoder(result), headers=headers)
+
+
+def _iter_export_rows(export_format: str) -> Iterator[str]:
+    """Stream subscriber rows from a server-side cursor using a dedicated session."""
+    db = SessionLocal()
+    try:
+        stmt = _subscriber_select().execution_options(
+            stream_results=True,
+            yield_per=_EXPORT_BATCH_SIZE,
+        )
+        fieldnames = [column.key for column in _SUBSCRIBER_COLUMNS]
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        if export_format == "csv":
+            writer.writerow(fieldnames)
+            yield buffer.getvalue()
+
+        for row in db.execute(stmt):
+            data = jsonable_encoder(_subscriber_row_dict(row))
+            if export_format == "csv":
+                buffer.seek(0)
+                buffer.truncate(0)
+                writer.writerow([data[name] for name in fieldnames])
+                yield buffer.getvalue()
+            else:
+                yield json.dumps(data, ensure_ascii=False) + "\n"
+    finally:
+        db.close()
+
+
+@router.get("/export")
+async def export_subscribers(
+    export_format: Literal["ndjson", "csv"] = Query(default="ndjson", alias="format"),
+    _: bool = Depends(get_current_admin)
+):
+    """Stream all subscribers as NDJSON or CSV without buffering the full list."""
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    filename = f"subscribers.{export_format}"
+    return StreamingResponse(
+        _iter_export_rows(export_format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.delete("/{subscriber_id}", response_model=MessageResponse)
@@ -46,13 +151,15 @@ async def delete_subscriber(
     db: Session = Depends(get_db),
     _: bool = Depends(get_current_admin)
 ):
-    """Delete a subscriber."""
+    """Delete a subscriber; the paper is paused if nobody is subscribed anymore."""
     subscriber = db.query(Subscriber).filter(Subscriber.id == subscriber_id).first()
 
     if not subscriber:
         raise HTTPException(status_code=404, detail="Subscriber not found")
 
+    paper_id = subscriber.paper_id
     db.delete(subscriber)
+    pause_if_orphaned(db, paper_id)
     db.commit()
 
     return MessageResponse(message="Subscriber deleted successfully")
@@ -70,8 +177,34 @@ async def reset_notifications(
     if not subscriber:
         raise HTTPException(status_code=404, detail="Subscriber not found")
 
-    subscriber.notified_review = False
-    subscriber.notified_decision = False
+    forget_notifications(db, subscriber)
     db.commit()
 
     return MessageResponse(message="Notification status reset")
+
+
+@router.post("/{subscriber_id}/unquarantine", response_model=MessageResponse)
+async def unquarantine_subscriber(
+    subscriber_id: int,
+    db: Session = Depends(get_db),
+    _: bool = Depends(get_current_admin)
+):
+    """Resume mail to a subscriber's address (all subscriptions of that email) and clear its failures."""
+    subscriber = db.query(Subscriber).filter(Subscriber.id == subscriber_id).first()
+
+    if not subscriber:
+        raise HTTPException(status_code=404, detail="Subscriber not found")
+
+    updated = db.query(Subscriber).filter(Subscriber.email == subscriber.email).update(
+        {
+            Subscriber.quarantined_at: None,
+            Subscriber.send_failures: 0,
+            Subscriber.hard_failures: 0,
+            Subscriber.last_send_error: None,
+            Subscriber.next_send_after: None,
+        },
+        synchronize_session=False,
+    )
+    db.commit()
+
+    return MessageResponse(message=f"Delivery resumed for {subscriber.email} ({updated} subscriptions)")
@@ -31,6 +31,7 @@ class PaperCreate(BaseModel):
     notify_on_review: bool = True
     notify_on_review_modified: bool = True
     notify_on_decision: bool = True
+    digest: bool = False  # Combine this subscription's notifications with others for the same email
 
 
 class EmailVerificationRequest(BaseModel):
@@ -55,11 +56,110 @@ class PaperResponse(BaseModel):
     subscriber_count: Optional[int] = None
     notified_review: Optional[bool] = None
     notified_decision: Optional[bool] = None
+    paused_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
 
 
+class ArchivedPaperResponse(BaseModel):
+    id: int
+    paper_id: int
+    openreview_id: str
+    submission_number: Optional[int] = None
+    title: Optional[str]
+    venue: Optional[str]
+    status: Optional[str]
+    reason: str
+    review_count: int
+    subscriber_count: int
+    last_changed_at: Optional[datetime] = None
+    archived_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class OutboxMessageResponse(BaseModel):
+    id: int
+    kind: str
+    paper_id: Optional[int] = None
+    subscriber_id: Optional[int] = None
+    to_email: str
+    subject: str
+    status: str
+    attempts: int
+    next_attempt_at: datetime
+    last_error: Optional[str] = None
+    created_at: datetime
+    sent_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class PaperEventResponse(BaseModel):
+    id: int
+    paper_id: int
+    openreview_id: str
+    venue: Optional[str] = None
+    kind: str
+    payload: Dict[str, Any]
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ChangeFeedResponse(BaseModel):
+    events: List[PaperEventResponse]
+    cursor: str  # Pass back as ?cursor= to continue after these events
+    truncated: bool = False  # Events after the given cursor were already pruned; reload full state
+
+
+class PaperCheckRequest(BaseModel):
+    """Papers to check now: explicit ids or a whole venue (exactly one of the two)."""
+    paper_ids: Optional[List[int]] = Field(default=None, min_length=1, max_length=10000)
+    venue: Optional[str] = None
+
+
+class CheckJobResponse(BaseModel):
+    job_id: str
+    paper_count: Optional[int] = None
+    message: str
+
+
+class SchedulerStatusResponse(BaseModel):
+    worker: str  # This process
+    is_leader: bool
+    leader: Optional[str] = None  # Process holding the scheduler lease
+    lease_expires_at: Optional[datetime] = None
+
+
+class JobErrorResponse(BaseModel):
+    openreview_id: Optional[str] = None
+    error: Optional[str] = None
+    at: datetime
+
+
+class JobResponse(BaseModel):
+    job_id: str
+    job_type: str
+    status: str  # queued, running, completed, failed or cancelled
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    total: int
+    processed: int
+    current_paper: Optional[str] = None
+    eta_seconds: Optional[float] = None
+    counts: Dict[str, int]
+    error_count: int
+    errors: List[JobErrorResponse]  # Latest paper errors
+    error: Optional[str] = None
+    cancel_requested: bool
+
+
 class PaperUpdate(BaseModel):
     title: Optional[str] = None
     venue: Optional[str] = None
@@ -67,6 +167,25 @@ class PaperUpdate(BaseModel):
     submission_number: Optional[int] = None
 
 
+class RatingPoint(BaseModel):
+    version: int
+    mdate: Optional[int] = None
+    recorded_at: Optional[datetime] = None
+    rating: Optional[Any] = None
+    confidence: Optional[Any] = None
+
+
+class ReviewRatingTimeline(BaseModel):
+    review_id: str
+    points: List[RatingPoint]
+
+
+class RatingTimelineResponse(BaseModel):
+    paper_id: int
+    openreview_id: str
+    reviews: List[ReviewRatingTimeline]
+
+
 # Subscriber schemas
 class SubscriberResponse(BaseModel):
     id: int
@@ -77,6 +196,12 @@ class SubscriberResponse(BaseModel):
     notify_on_decision: bool
     notified_review: bool
     notified_decision: bool
+    digest: bool = False
+    send_failures: int = 0
+    hard_failures: int = 0
+    last_send_error: Optional[str] = None
+    next_send_after: Optional[datetime] = None
+    quarantined_at: Optional[datetime] = None
     created_at: datetime
     paper_title: Optional[str] = None
     paper_venue: Optional[str] = None
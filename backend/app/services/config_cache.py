@@ -0,0 +1,179 @@
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, Optional
+import logging
+import time
+
+from sqlalchemy import Integer, String, cast
+
+from ..config import get_settings
+from ..database import SessionLocal
+from ..models import Config
+from ..utils.crypto import decrypt_value
+from .email import EmailService
+
+logger = logging.getLogger(__name__)
+
+CONFIG_VERSION_KEY = "config_version"
+# How long a worker trusts its cache before re-reading the version counter.
+_VERSION_CHECK_INTERVAL_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class RuntimeConfig:
+    """Typed snapshot of the admin-editable configuration (config table over env settings)."""
+    version: int
+    check_interval: int
+    review_mod_check_interval: int
+    review_mod_request_gap_seconds: float
+    smtp_host: str
+    smtp_port: int
+    smtp_user: str
+    smtp_password: str  # Stored value, possibly encrypted
+    from_email: str
+    from_name: str
+
+
+_lock = Lock()
+_cached_config: Optional[RuntimeConfig] = None
+_checked_at = 0.0
+_cached_email_service: Optional[EmailService] = None
+_cached_email_service_version: Optional[int] = None
+
+
+def _parse_version(value: Optional[str]) -> int:
+    try:
+        return int(value) if value is not None else 0
+    except (TypeError, ValueError):
+        return 0
+
+
+def _int_value(values: Dict[str, Optional[str]], key: str, default: int, min_value: int) -> int:
+    value = values.get(key)
+    if value is None:
+        return max(min_value, default)
+    try:
+        return max(min_value, int(value))
+    except (TypeError, ValueError):
+        logger.warning("Invalid integer config for %s=%s, using default=%s", key, value, default)
+        return max(min_value, default)
+
+
+def _float_value(values: Dict[str, Optional[str]], key: str, default: float, min_value: float) -> float:
+    value = values.get(key)
+    if value is None:
+        return max(min_value, default)
+    try:
+        return max(min_value, float(value))
+    except (TypeError, ValueError):
+        logger.warning("Invalid float config for %s=%s, using default=%s", key, value, default)
+        return max(min_value, default)
+
+
+def _str_value(values: Dict[str, Optional[str]], key: str, default: str, allow_empty: bool = True) -> str:
+    value = values.get(key)
+    if value is None:
+        return default
+    if not allow_empty and not value.strip():
+        return default
+    return value
+
+
+def _build_runtime_config(values: Dict[str, Optional[str]]) -> RuntimeConfig:
+    settings = get_settings()
+    return RuntimeConfig(
+        version=_parse_version(values.get(CONFIG_VERSION_KEY)),
+        check_interval=_int_value(values, "check_interval", settings.check_interval, 1),
+        review_mod_check_interval=_int_value(
+            values, "review_mod_check_interval", settings.review_mod_check_interval, 1
+        ),
+        review_mod_request_gap_seconds=_float_value(
+            values, "review_mod_request_gap_seconds", settings.review_mod_request_gap_seconds, 0.0
+        ),
+        smtp_host=_str_value(values, "smtp_host", settings.smtp_host),
+        smtp_port=_int_value(values, "smtp_port", settings.smtp_port, 1),
+        smtp_user=_str_value(values, "smtp_user", settings.smtp_user),
+        smtp_password=_str_value(values, "smtp_password", settings.smtp_password),
+        from_email=_str_value(values, "from_email", settings.from_email),
+        from_name=_str_value(values, "from_name", settings.from_name, allow_empty=False).strip(),
+    )
+
+
+def _read_version(db) -> int:
+    value = db.query(Config.value).filter(Config.key == CONFIG_VERSION_KEY).scalar()
+    return _parse_version(value)
+
+
+def get_runtime_config(db=None) -> RuntimeConfig:
+    """
+    Return the cached runtime configuration.
+    - Loads every config row in one query on first use or when the version counter moved
+    - Re-reads only the version counter, at most every few seconds, so other workers' edits show up
+    """
+    global _cached_config, _checked_at
+
+    now = time.monotonic()
+    cached = _cached_config
+    if cached is not None and now - _checked_at < _VERSION_CHECK_INTERVAL_SECONDS:
+        return cached
+
+    owns_session = db is None
+    if owns_session:
+        db = SessionLocal()
+    try:
+        with _lock:
+            cached = _cached_config
+            if cached is not None and _read_version(db) == cached.version:
+                _checked_at = now
+                return cached
+
+            values = {key: value for key, value in db.query(Config.key, Config.value).all()}
+            _cached_config = _build_runtime_config(values)
+            _checked_at = now
+            return _cached_config
+    finally:
+        if owns_session:
+            db.close()
+
+
+def bump_config_version(db) -> None:
+    """Increment the config version inside the caller's transaction."""
+    updated = db.query(Config).filter(Config.key == CONFIG_VERSION_KEY).update(
+        {Config.value: cast(cast(Config.value, Integer) + 1, String)},
+        synchronize_session=False,
+    )
+    if not updated:
+        db.add(Config(key=CONFIG_VERSION_KEY, value="1"))
+
+
+def invalidate_config_cache() -> None:
+    """Drop this worker's cached config so the next read reloads it."""
+    global _cached_config, _checked_at, _cached_email_service, _cached_email_service_version
+    with _lock:
+        _cached_config = None
+        _checked_at = 0.0
+        _cached_email_service = None
+        _cached_email_service_version = None
+
+
+def get_cached_email_service() -> EmailService:
+    """Return an EmailService (with the SMTP password decrypted once) for the current config."""
+    global _cached_email_service, _cached_email_service_version
+
+    config = get_runtime_config()
+    with _lock:
+        if _cached_email_service is not None and _cached_email_service_version == config.version:
+            return _cached_email_service
+
+    service = EmailService(
+        smtp_host=config.smtp_host,
+        smtp_port=config.smtp_port,
+        smtp_user=config.smtp_user,
+        smtp_password=decrypt_value(config.smtp_password),
+        from_email=config.from_email,
+        from_name=config.from_name or get_settings().from_name,
+    )
+    with _lock:
+        _cached_email_service = service
+        _cached_email_service_version = config.version
+    return service
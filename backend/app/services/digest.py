@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta
+from typing import List
+import logging
+
+from sqlalchemy import func
+
+from ..config import get_settings
+from ..models import DigestItem, Paper
+from .email import EmailService
+from .notifications import SubscriberInfo
+from .outbox import enqueue_email
+
+logger = logging.getLogger(__name__)
+
+_FLUSH_BATCH_SIZE = 200
+
+
+def queue_digest_item(db, kind: str, subscriber: SubscriberInfo, paper: Paper, summary: str) -> DigestItem:
+    """Collect an event for a digest subscriber in the caller's transaction."""
+    item = DigestItem(
+        to_email=subscriber.email,
+        kind=kind,
+        paper_id=paper.id,
+        subscriber_id=subscriber.id,
+        openreview_id=paper.openreview_id,
+        title=paper.title,
+        venue=paper.venue,
+        summary=summary,
+    )
+    db.add(item)
+    return item
+
+
+def flush_digests(db, email_service: EmailService, now: datetime) -> int:
+    """
+    Queue one combined email per address whose oldest collected event is older than the window.
+    - Runs with every pass of the scheduler's event consumer job, in its transaction
+    - All events collected for an address so far go into the same email
+    """
+    db.flush()
+    cutoff = now - timedelta(minutes=max(0, get_settings().digest_window_minutes))
+    due_emails: List[str] = [
+        email for (email,) in db.query(DigestItem.to_email).group_by(DigestItem.to_email).having(
+            func.min(DigestItem.created_at) <= cutoff
+        ).order_by(DigestItem.to_email).all()
+    ]
+
+    for start in range(0, len(due_emails), _FLUSH_BATCH_SIZE):
+        batch = due_emails[start:start + _FLUSH_BATCH_SIZE]
+        items = db.query(DigestItem).filter(DigestItem.to_email.in_(batch)).order_by(
+            DigestItem.to_email, DigestItem.created_at, DigestItem.id
+        ).all()
+        by_email = {}
+        for item in items:
+            by_email.setdefault(item.to_email, []).append(item)
+
+        for to_email, entries in by_email.items():
+            rendered = email_service.build_digest_notification([
+                {
+                    "kind": entry.kind,
+                    "openreview_id": entry.openreview_id,
+                    "title": entry.title,
+                    "venue": entry.venue,
+                    "summary": entry.summary,
+                }
+                for entry in entries
+            ])
+            paper_ids = {entry.paper_id for entry in entries}
+            subscriber_ids = {entry.subscriber_id for entry in entries}
+            enqueue_email(
+                db,
+                "digest",
+                to_email,
+                rendered,
+                paper_id=paper_ids.pop() if len(paper_ids) == 1 else None,
+                subscriber_id=subscriber_ids.pop() if len(subscriber_ids) == 1 else None,
+            )
+
+        db.query(DigestItem).filter(
+            DigestItem.id.in_([item.id for item in items])
+        ).delete(synchronize_session=False)
+
+    if due_emails:
+        logger.info("Queued %d digest emails", len(due_emails))
+    return len(due_emails)
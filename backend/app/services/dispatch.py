@@ -0,0 +1,237 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Event, Lock, Thread
+from typing import Deque, Dict, Optional, Tuple
+import logging
+import time
+
+from ..config import get_settings
+from ..database import SessionLocal
+from .outbox import claim_due_messages, deliver_message, release_messages
+
+logger = logging.getLogger(__name__)
+
+_POLL_INTERVAL_SECONDS = 5.0
+# Claimed-but-unsent messages held per send worker; keeps claims well inside the outbox lease.
+_QUEUE_PER_WORKER = 4
+
+
+@dataclass(frozen=True)
+class DomainLimit:
+    concurrency: int
+    per_second: float  # 0 = no rate limit
+
+
+_DEFAULT_DOMAIN_LIMIT = DomainLimit(concurrency=2, per_second=5.0)
+
+
+def parse_domain_limits(value: str) -> Dict[str, DomainLimit]:
+    """
+    Parse OUTBOX_DOMAIN_LIMITS, e.g. "gmail.com=4/10,edu=1/2,*=2/5".
+    - Each entry is domain=concurrency/per_second; "*" is the default for other domains
+    - A rule for a parent domain (e.g. "edu") also covers its subdomains
+    """
+    limits: Dict[str, DomainLimit] = {}
+    for entry in (value or "").split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        try:
+            domain, spec = entry.split("=", 1)
+            concurrency, per_second = spec.split("/", 1)
+            limits[domain.strip().lower()] = DomainLimit(
+                concurrency=max(1, int(concurrency)),
+                per_second=max(0.0, float(per_second)),
+            )
+        except ValueError:
+            logger.warning("Ignoring invalid OUTBOX_DOMAIN_LIMITS entry: %s", entry)
+    return limits
+
+
+def recipient_domain(email: str) -> str:
+    return email.rsplit("@", 1)[-1].strip().lower()
+
+
+def limit_for_domain(limits: Dict[str, DomainLimit], domain: str) -> DomainLimit:
+    parts = domain.split(".")
+    for idx in range(len(parts)):
+        rule = limits.get(".".join(parts[idx:]))
+        if rule is not None:
+            return rule
+    return limits.get("*", _DEFAULT_DOMAIN_LIMIT)
+
+
+class _DomainLane:
+    """Claimed messages for one recipient domain, released within its concurrency and rate."""
+
+    def __init__(self, limit: DomainLimit):
+        self.limit = limit
+        self.queue: Deque[Tuple[int, str]] = deque()  # (message id, claim token)
+        self.in_flight = 0
+        self.next_start = 0.0
+
+    def wait_seconds(self, now: float) -> Optional[float]:
+        """0 if a message can start now, seconds until it can, or None if blocked on concurrency/empty."""
+        if not self.queue or self.in_flight >= self.limit.concurrency:
+            return None
+        return max(0.0, self.next_start - now)
+
+    def take(self, now: float) -> Tuple[int, str]:
+        self.in_flight += 1
+        if self.limit.per_second > 0:
+            self.next_start = max(now, self.next_start) + 1.0 / self.limit.per_second
+        return self.queue.popleft()
+
+
+class DispatchEngine:
+    """
+    Drains the email outbox with a pool of send workers.
+    - One dispatcher thread claims due messages, fairly across papers, into per-domain lanes
+    - Lanes start sends round-robin, each within its domain's concurrency and rate limit,
+      so a slow or strict provider never holds up mail to other domains
+    """
+
+    def __init__(self, workers: int, domain_limits: Dict[str, DomainLimit]):
+        self.workers = max(1, workers)
+        self._limits = domain_limits
+        self._lanes: Dict[str, _DomainLane] = {}
+        self._lock = Lock()
+        self._wake = Event()
+        self._stop = Event()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[Thread] = None
+        self._capacity = self.workers * _QUEUE_PER_WORKER
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="outbox-send")
+        self._thread = Thread(target=self._run, name="outbox-dispatcher", daemon=True)
+        self._thread.start()
+        logger.info("Outbox dispatcher started with %d send workers", self.workers)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop claiming, let in-flight sends finish, and hand queued messages back."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+        with self._lock:
+            unsent = [claim for lane in self._lanes.values() for claim in lane.queue]
+            self._lanes.clear()
+        if unsent:
+            db = SessionLocal()
+            try:
+                release_messages(db, unsent)
+            finally:
+                db.close()
+        logger.info("Outbox dispatcher stopped (%d queued messages released)", len(unsent))
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def _lane(self, domain: str) -> _DomainLane:
+        lane = self._lanes.get(domain)
+        if lane is None:
+            lane = _DomainLane(limit_for_domain(self._limits, domain))
+            self._lanes[domain] = lane
+        return lane
+
+    def _claim(self) -> None:
+        with self._lock:
+            held = sum(len(lane.queue) + lane.in_flight for lane in self._lanes.values())
+        free = self._capacity - held
+        if free <= 0:
+            return
+
+        db = SessionLocal()
+        try:
+            claimed = claim_due_messages(db, datetime.utcnow(), free)
+        finally:
+            db.close()
+
+        with self._lock:
+            for message_id, to_email, claim_token in claimed:
+                self._lane(recipient_domain(to_email)).queue.append((message_id, claim_token))
+
+    def _start_ready(self) -> float:
+        """Start every send the lane limits allow; returns seconds until the next lane frees up."""
+        next_wait = _POLL_INTERVAL_SECONDS
+        with self._lock:
+            started = True
+            while started:
+                started = False
+                now = time.monotonic()
+                for domain, lane in list(self._lanes.items()):
+                    wait = lane.wait_seconds(now)
+                    if wait is None:
+                        continue
+                    if wait > 0:
+                        next_wait = min(next_wait, wait)
+                        continue
+                    message_id, claim_token = lane.take(now)
+                    self._executor.submit(self._send, domain, message_id, claim_token)
+                    started = True
+            # Drop idle lanes so the dict does not grow with every domain ever seen
+            for domain in [d for d, lane in self._lanes.items() if not lane.queue and not lane.in_flight]:
+                if self._lanes[domain].next_start <= time.monotonic():
+                    del self._lanes[domain]
+        return next_wait
+
+    def _send(self, domain: str, message_id: int, claim_token: str) -> None:
+        try:
+            deliver_message(message_id, claim_token)
+        except Exception as e:
+            logger.error("Outbox delivery of message %s failed: %s", message_id, e)
+        finally:
+            with self._lock:
+                lane = self._lanes.get(domain)
+                if lane is not None:
+                    lane.in_flight -= 1
+            self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._claim()
+            except Exception as e:
+                logger.error("Outbox dispatcher failed to claim messages: %s", e)
+            wait = self._start_ready()
+            self._wake.wait(wait)
+            self._wake.clear()
+
+
+_engine: Optional[DispatchEngine] = None
+
+
+def start_dispatcher() -> None:
+    """Start outbox delivery (OUTBOX_WORKERS send workers; 0 leaves delivery to another process)."""
+    global _engine
+    if _engine is not None:
+        return
+
+    settings = get_settings()
+    if settings.outbox_workers <= 0:
+        logger.info("Outbox delivery disabled in this process")
+        return
+
+    _engine = DispatchEngine(settings.outbox_workers, parse_domain_limits(settings.outbox_domain_limits))
+    _engine.start()
+
+
+def stop_dispatcher() -> None:
+    global _engine
+    if _engine is None:
+        return
+    _engine.stop()
+    _engine = None
+
+
+def wake_dispatcher() -> None:
+    """Tell the dispatcher that new messages were committed."""
+    if _engine is not None:
+        _engine.wake()
@@ -1,19 +1,159 @@
-import smtplib
-import ssl
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.utils import formataddr
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from email.utils import formataddr, formatdate, make_msgid
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Tuple, Union
 import logging
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 import socket
 
+from . import email_templates
+from ..utils.fingerprint import event_fingerprint
+
+if TYPE_CHECKING:
+    import smtplib
+    from email.mime.multipart import MIMEMultipart
+
 logger = logging.getLogger(__name__)
 
 # Thread pool for blocking SMTP operations
 _executor = ThreadPoolExecutor(max_workers=3)
 
+_RENDER_CACHE_SIZE = 256
+# DATA replies that reject the mailbox itself (unavailable, full, bad name) rather than the content
+_MAILBOX_REJECT_CODES = {550, 551, 552, 553}
+
+
+class EmailDeliveryError(ValueError):
+    """
+    A failed send.
+    - recipient_failure is "temporary" (4xx) or "permanent" (5xx) when the server refused the
+      recipient's mailbox, and None when the failure was not about the address (auth, network)
+    """
+
+    def __init__(self, message: str, smtp_code: Optional[int] = None, recipient_failure: Optional[str] = None):
+        super().__init__(message)
+        self.smtp_code = smtp_code
+        self.recipient_failure = recipient_failure
+
+
+def _smtp_rejection(error: "smtplib.SMTPException") -> Tuple[Optional[int], Optional[str]]:
+    """(SMTP reply code, recipient failure kind) for a failed send."""
+    import smtplib
+
+    code = getattr(error, "smtp_code", None)
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        codes = [reply_code for reply_code, _ in error.recipients.values()]
+        code = max(codes) if codes else None
+    elif not (isinstance(error, smtplib.SMTPDataError) and code in _MAILBOX_REJECT_CODES):
+        return code, None
+    if code is None:
+        return None, None
+    return code, "permanent" if code >= 500 else "temporary"
+
+
+def _new_message(subject: str, from_header: str, to_email: Optional[str]) -> "MIMEMultipart":
+    """Create an empty multipart message (the MIME stack is imported on first use)."""
+    from email.mime.multipart import MIMEMultipart
+
+    msg = MIMEMultipart("alternative")
+    msg["Subject"] = subject
+    msg["From"] = from_header
+    if to_email is not None:
+        msg["To"] = to_email
+    return msg
+
+
+def _attach_text(msg: "MIMEMultipart", content: str, subtype: str) -> None:
+    from email.mime.text import MIMEText
+
+    msg.attach(MIMEText(content, subtype))
+
+
+@dataclass(frozen=True)
+class RenderedEmail:
+    """Subject and HTML body of a notification, independent of the recipient and sender."""
+    subject: str
+    html: str
+    # "template:paper:event fingerprint" for cached notifications; identifies the content
+    key: Optional[str] = field(default=None, compare=False)
+
+
+@dataclass(frozen=True)
+class StampedEmail:
+    """A ready-to-send message: a shared encoded body with one recipient's headers in front."""
+    from_addr: str
+    to_addr: str
+    data: bytes
+
+
+@dataclass(frozen=True)
+class _EncodedEmail:
+    headers: bytes  # Subject, From and MIME headers shared by every recipient
+    body: bytes
+
+    def stamp(self, from_addr: str, to_email: str) -> StampedEmail:
+        if "\r" in to_email or "\n" in to_email:
+            raise ValueError(f"Invalid recipient address: {to_email!r}")
+        domain = from_addr.rpartition("@")[2] or None
+        recipient = (
+            f"To: {to_email}\r\n"
+            f"Date: {formatdate(localtime=True)}\r\n"
+            f"Message-ID: {make_msgid(domain=domain)}\r\n"
+        ).encode("ascii")
+        return StampedEmail(from_addr, to_email, recipient + self.headers + b"\r\n" + self.body)
+
+
+class _LRUCache:
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# Rendered notifications by key, and their encoded MIME bodies by (key, From header).
+_rendered_cache = _LRUCache(_RENDER_CACHE_SIZE)
+_encoded_cache = _LRUCache(_RENDER_CACHE_SIZE)
+
+
+def _render_cached(template: str, paper_id: str, fingerprint: str, render) -> RenderedEmail:
+    """Render a notification once per (template, paper, event fingerprint)."""
+    key = f"{template}:{paper_id}:{fingerprint}"
+    rendered = _rendered_cache.get(key)
+    if rendered is None:
+        subject, html = render()
+        rendered = RenderedEmail(subject=subject, html=html, key=key)
+        _rendered_cache.put(key, rendered)
+    return rendered
+
+
+def _encode(rendered: RenderedEmail, from_header: str) -> _EncodedEmail:
+    """Build and serialize the MIME tree once, the way smtplib's send_message would."""
+    from email.generator import BytesGenerator
+    from io import BytesIO
+
+    msg = _new_message(rendered.subject, from_header, None)
+    _attach_text(msg, rendered.html, "html")
+    buffer = BytesIO()
+    BytesGenerator(buffer).flatten(msg, linesep="\r\n")
+    headers, _, body = buffer.getvalue().partition(b"\r\n\r\n")
+    return _EncodedEmail(headers=headers + b"\r\n", body=body)
+
 
 class EmailService:
     """Service for sending email notifications."""
@@ -41,152 +181,6 @@ class EmailService:
         )
         self.timeout = timeout
 
-    def _render_review_template(
-        self,
-        paper_title: str,
-        paper_id: str,
-        venue: str,
-        reviews: List[Dict],
-    ) -> str:
-        """Render email template for review notification with full details."""
-        reviews_html = ""
-        for i, review in enumerate(reviews, 1):
-            rating = review.get("rating", "N/A")
-            confidence = review.get("confidence", "N/A")
-            summary = review.get("summary", "") or ""
-            strengths = review.get("strengths", "") or ""
-            weaknesses = review.get("weaknesses", "") or ""
-
-            reviews_html += f"""
-            <div style="margin: 15px 0; padding: 15px; background: #f8f9fa; border-radius: 8px; border-left: 4px solid #4f46e5;">
-                <h4 style="margin: 0 0 10px 0; color: #1f2937;">Reviewer {i}</h4>
-                <div style="display: flex; gap: 20px; margin-bottom: 10px;">
-                    <span><strong>Rating:</strong> {rating}</span>
-                    <span><strong>Confidence:</strong> {confidence}</span>
-                </div>
-                {"<div style='margin-top: 10px;'><strong>Summary:</strong><p style='margin: 5px 0; color: #4b5563;'>" + summary[:500] + ("..." if len(summary) > 500 else "") + "</p></div>" if summary else ""}
-                {"<div style='margin-top: 10px;'><strong>Strengths:</strong><p style='margin: 5px 0; color: #059669;'>" + strengths[:300] + ("..." if len(strengths) > 300 else "") + "</p></div>" if strengths else ""}
-                {"<div style='margin-top: 10px;'><strong>Weaknesses:</strong><p style='margin: 5px 0; color: #dc2626;'>" + weaknesses[:300] + ("..." if len(weaknesses) > 300 else "") + "</p></div>" if weaknesses else ""}
-            </div>
-            """
-
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <style>
-                body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; color: #333; margin: 0; padding: 0; }}
-                .container {{ max-width: 700px; margin: 0 auto; padding: 20px; }}
-                .header {{ background: linear-gradient(135deg, #4f46e5 0%, #7c3aed 100%); color: white; padding: 30px; border-radius: 12px 12px 0 0; }}
-                .content {{ background: #fff; padding: 25px; border: 1px solid #e5e7eb; border-top: none; border-radius: 0 0 12px 12px; }}
-                .button {{ display: inline-block; padding: 12px 24px; background: #4f46e5; color: white; text-decoration: none; border-radius: 8px; font-weight: 500; }}
-                .footer {{ margin-top: 20px; padding-top: 20px; border-top: 1px solid #e5e7eb; font-size: 12px; color: #6b7280; }}
-                .venue-badge {{ display: inline-block; background: #e0e7ff; color: #4338ca; padding: 4px 12px; border-radius: 20px; font-size: 14px; font-weight: 500; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h2 style="margin: 0 0 10px 0;">📝 Reviews Available!</h2>
-                    <span class="venue-badge">{venue or "OpenReview"}</span>
-                </div>
-                <div class="content">
-                    <h3 style="margin-top: 0;">{paper_title or paper_id}</h3>
-                    <p style="color: #6b7280;">Your paper has received {len(reviews)} review(s). Here are the details:</p>
-
-                    {reviews_html}
-
-                    <div style="margin-top: 25px; text-align: center;">
-                        <a href="https://openreview.net/forum?id={paper_id}" class="button">
-                            View Full Reviews on OpenReview
-                        </a>
-                    </div>
-                </div>
-                <div class="footer">
-                    <p>This notification was sent by OpenReview Monitor. You subscribed to updates for this paper.</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-
-    def _render_decision_template(
-        self,
-        paper_title: str,
-        paper_id: str,
-        venue: str,
-        decision: str,
-        comment: Optional[str],
-        reviews: List[Dict],
-    ) -> str:
-        """Render email template for decision notification with full details."""
-        is_accepted = "accept" in decision.lower()
-        decision_color = "#059669" if is_accepted else "#dc2626"
-        decision_bg = "#ecfdf5" if is_accepted else "#fef2f2"
-        decision_emoji = "🎉" if is_accepted else "📋"
-        header_gradient = "linear-gradient(135deg, #059669 0%, #10b981 100%)" if is_accepted else "linear-gradient(135deg, #dc2626 0%, #ef4444 100%)"
-
-        # Build reviews summary
-        reviews_summary = ""
-        if reviews:
-            ratings = [r.get("rating", "N/A") for r in reviews]
-            reviews_summary = f"""
-            <div style="margin: 20px 0; padding: 15px; background: #f8f9fa; border-radius: 8px;">
-                <h4 style="margin: 0 0 10px 0;">Review Summary</h4>
-                <p><strong>Ratings:</strong> {', '.join(str(r) for r in ratings)}</p>
-                <p><strong>Number of Reviews:</strong> {len(reviews)}</p>
-            </div>
-            """
-
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <style>
-                body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; color: #333; margin: 0; padding: 0; }}
-                .container {{ max-width: 700px; margin: 0 auto; padding: 20px; }}
-                .header {{ background: {header_gradient}; color: white; padding: 30px; border-radius: 12px 12px 0 0; }}
-                .content {{ background: #fff; padding: 25px; border: 1px solid #e5e7eb; border-top: none; border-radius: 0 0 12px 12px; }}
-                .decision-box {{ background: {decision_bg}; border: 2px solid {decision_color}; padding: 20px; border-radius: 8px; text-align: center; margin: 20px 0; }}
-                .decision-text {{ font-size: 24px; font-weight: bold; color: {decision_color}; margin: 0; }}
-                .button {{ display: inline-block; padding: 12px 24px; background: #4f46e5; color: white; text-decoration: none; border-radius: 8px; font-weight: 500; }}
-                .footer {{ margin-top: 20px; padding-top: 20px; border-top: 1px solid #e5e7eb; font-size: 12px; color: #6b7280; }}
-                .venue-badge {{ display: inline-block; background: rgba(255,255,255,0.2); color: white; padding: 4px 12px; border-radius: 20px; font-size: 14px; font-weight: 500; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h2 style="margin: 0 0 10px 0;">{decision_emoji} Decision Announced</h2>
-                    <span class="venue-badge">{venue or "OpenReview"}</span>
-                </div>
-                <div class="content">
-                    <h3 style="margin-top: 0;">{paper_title or paper_id}</h3>
-
-                    <div class="decision-box">
-                        <p class="decision-text">{decision}</p>
-                    </div>
-
-                    {"<div style='margin: 20px 0; padding: 15px; background: #f8f9fa; border-radius: 8px;'><h4 style='margin: 0 0 10px 0;'>Meta Review / Comments</h4><p style='margin: 0; color: #4b5563;'>" + (comment or "No additional comments provided.") + "</p></div>" if comment else ""}
-
-                    {reviews_summary}
-
-                    <div style="margin-top: 25px; text-align: center;">
-                        <a href="https://openreview.net/forum?id={paper_id}" class="button">
-                            View on OpenReview
-                        </a>
-                    </div>
-                </div>
-                <div class="footer">
-                    <p>This notification was sent by OpenReview Monitor. You subscribed to updates for this paper.</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-
     def _render_test_template(self) -> str:
         """Render test email template."""
         return """
@@ -255,36 +249,41 @@ class EmailService:
         </html>
         """
 
-    def _send_email_sync(self, msg: MIMEMultipart) -> None:
-        """Send an email message synchronously (blocking)."""
+    def _open_connection(self) -> "smtplib.SMTP":
+        """Open and authenticate a new SMTP session (SSL on port 465, STARTTLS otherwise)."""
+        import smtplib
+        import ssl
+
+        logger.info(f"Connecting to SMTP server {self.smtp_host}:{self.smtp_port}...")
+        if self.smtp_port == 465:
+            context = ssl.create_default_context()
+            server = smtplib.SMTP_SSL(self.smtp_host, self.smtp_port, context=context, timeout=self.timeout)
+        else:
+            server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=self.timeout)
+        try:
+            if self.smtp_port != 465:
+                server.starttls()
+            server.login(self.smtp_user, self.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        logger.info("SMTP session established")
+        return server
+
+    def _send_email_sync(self, msg: Union["MIMEMultipart", StampedEmail]) -> None:
+        """Send an email message synchronously (blocking) over a pooled SMTP session."""
+        import smtplib
+        from .smtp_pool import get_smtp_pool
+
         if not self.smtp_user or not self.smtp_password:
             raise ValueError("SMTP credentials not configured. Please set SMTP username and password.")
 
         if not self.from_email:
             raise ValueError("From email not configured. Please set the sender email address.")
 
-        logger.info(f"Connecting to SMTP server {self.smtp_host}:{self.smtp_port}...")
-
         try:
-            # Try SSL first for port 465, otherwise use STARTTLS
-            if self.smtp_port == 465:
-                # SSL connection
-                context = ssl.create_default_context()
-                with smtplib.SMTP_SSL(self.smtp_host, self.smtp_port, context=context, timeout=self.timeout) as server:
-                    logger.info("Connected via SSL, logging in...")
-                    server.login(self.smtp_user, self.smtp_password)
-                    logger.info("Sending message...")
-                    server.send_message(msg)
-            else:
-                # STARTTLS connection (for port 587, 25, etc.)
-                with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=self.timeout) as server:
-                    logger.info("Connected, starting TLS...")
-                    server.starttls()
-                    logger.info("TLS started, logging in...")
-                    server.login(self.smtp_user, self.smtp_password)
-                    logger.info("Sending message...")
-                    server.send_message(msg)
-
+            pool = get_smtp_pool(self.smtp_host, self.smtp_port, self.smtp_user, self.smtp_password)
+            pool.send(msg, self._open_connection)
             logger.info("Email sent successfully!")
 
         except socket.timeout:
@@ -306,26 +305,44 @@ class EmailService:
         except smtplib.SMTPException as e:
             error_msg = f"SMTP error: {e}"
             logger.error(error_msg)
-            raise ValueError(error_msg)
+            smtp_code, recipient_failure = _smtp_rejection(e)
+            raise EmailDeliveryError(error_msg, smtp_code, recipient_failure)
         except Exception as e:
             error_msg = f"Failed to send email: {type(e).__name__}: {e}"
             logger.error(error_msg)
             raise ValueError(error_msg)
 
-    async def _send_email_async(self, msg: MIMEMultipart) -> None:
+    def _encoded(self, rendered: RenderedEmail) -> _EncodedEmail:
+        if rendered.key is None:
+            return _encode(rendered, self.from_header)
+        cache_key = (rendered.key, self.from_header)
+        encoded = _encoded_cache.get(cache_key)
+        if encoded is None:
+            encoded = _encode(rendered, self.from_header)
+            _encoded_cache.put(cache_key, encoded)
+        return encoded
+
+    def send_rendered(self, to_email: str, rendered: RenderedEmail) -> None:
+        """Send a pre-rendered HTML email (blocking); raises ValueError on failure."""
+        if not to_email.isascii():
+            # Internationalized addresses need SMTPUTF8, which send_message negotiates.
+            msg = _new_message(rendered.subject, self.from_header, to_email)
+            _attach_text(msg, rendered.html, "html")
+            self._send_email_sync(msg)
+            return
+        self._send_email_sync(self._encoded(rendered).stamp(self.from_email, to_email))
+
+    async def _send_email_async(self, msg: "MIMEMultipart") -> None:
         """Send an email message asynchronously using thread pool."""
         loop = asyncio.get_running_loop()
         await loop.run_in_executor(_executor, self._send_email_sync, msg)
 
     def send_test_email_sync(self, to_email: str) -> bool:
         """Send a test email synchronously."""
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = "[OpenReview Monitor] Test Email"
-        msg["From"] = self.from_header
-        msg["To"] = to_email
+        msg = _new_message("[OpenReview Monitor] Test Email", self.from_header, to_email)
 
         html_content = self._render_test_template()
-        msg.attach(MIMEText(html_content, "html"))
+        _attach_text(msg, html_content, "html")
 
         self._send_email_sync(msg)
         logger.info(f"Sent test email to {to_email}")
@@ -333,13 +350,10 @@ class EmailService:
 
     async def send_test_email(self, to_email: str) -> bool:
         """Send a test email asynchronously."""
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = "[OpenReview Monitor] Test Email"
-        msg["From"] = self.from_header
-        msg["To"] = to_email
+        msg = _new_message("[OpenReview Monitor] Test Email", self.from_header, to_email)
 
         html_content = self._render_test_template()
-        msg.attach(MIMEText(html_content, "html"))
+        _attach_text(msg, html_content, "html")
 
         await self._send_email_async(msg)
         logger.info(f"Sent test email to {to_email}")
@@ -353,10 +367,7 @@ class EmailService:
         expires_in_minutes: int,
     ) -> bool:
         """Send an email verification code asynchronously."""
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = "[OpenReview Monitor] Verification Code"
-        msg["From"] = self.from_header
-        msg["To"] = to_email
+        msg = _new_message("[OpenReview Monitor] Verification Code", self.from_header, to_email)
 
         text_content = (
             "OpenReview Monitor email verification\n\n"
@@ -366,160 +377,74 @@ class EmailService:
         )
         html_content = self._render_verification_template(code, openreview_id, expires_in_minutes)
 
-        msg.attach(MIMEText(text_content, "plain"))
-        msg.attach(MIMEText(html_content, "html"))
+        _attach_text(msg, text_content, "plain")
+        _attach_text(msg, html_content, "html")
 
         await self._send_email_async(msg)
         logger.info(f"Sent verification code to {to_email}")
         return True
 
-    def send_review_notification(
+    def build_review_notification(
         self,
-        to_email: str,
         paper_title: str,
         paper_id: str,
         venue: str,
         reviews: List[Dict],
-    ) -> bool:
-        """Send review notification email (synchronous, for background tasks)."""
-        try:
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = f"[{venue or 'OpenReview'}] Reviews available: {paper_title or paper_id}"
-            msg["From"] = self.from_header
-            msg["To"] = to_email
-
-            html_content = self._render_review_template(paper_title, paper_id, venue, reviews)
-            msg.attach(MIMEText(html_content, "html"))
-
-            self._send_email_sync(msg)
-            logger.info(f"Sent review notification to {to_email} for paper {paper_id}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to send review notification: {e}")
-            return False
+    ) -> RenderedEmail:
+        """Render the review notification once; it is the same for every subscriber of a paper."""
+        return _render_cached(
+            "review",
+            paper_id,
+            event_fingerprint(paper_title, venue, reviews),
+            lambda: (
+                f"[{venue or 'OpenReview'}] Reviews available: {paper_title or paper_id}",
+                email_templates.render_review(paper_title, paper_id, venue, reviews),
+            ),
+        )
 
-    def send_decision_notification(
+    def build_decision_notification(
         self,
-        to_email: str,
         paper_title: str,
         paper_id: str,
         venue: str,
         decision: str,
         comment: Optional[str],
         reviews: List[Dict],
-    ) -> bool:
-        """Send decision notification email (synchronous, for background tasks)."""
-        try:
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = f"[{venue or 'OpenReview'}] Decision: {decision} - {paper_title or paper_id}"
-            msg["From"] = self.from_header
-            msg["To"] = to_email
-
-            html_content = self._render_decision_template(
-                paper_title, paper_id, venue, decision, comment, reviews
-            )
-            msg.attach(MIMEText(html_content, "html"))
-
-            self._send_email_sync(msg)
-            logger.info(f"Sent decision notification to {to_email} for paper {paper_id}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to send decision notification: {e}")
-            return False
-    def _render_review_modified_template(
-        self,
-        paper_title: str,
-        paper_id: str,
-        venue: str,
-        modified_reviews: List[Dict],
-    ) -> str:
-        """Render email template for modified review notification."""
-        reviews_html = ""
-        for review in modified_reviews:
-            rating = review.get("rating", "N/A")
-            confidence = review.get("confidence", "N/A")
-            summary = review.get("summary", "") or ""
-            strengths = review.get("strengths", "") or ""
-            weaknesses = review.get("weaknesses", "") or ""
-            # Calculate review number if available (optional enhancement)
-            
-            reviews_html += f"""
-            <div style="margin: 15px 0; padding: 15px; background: #fffcf0; border-radius: 8px; border-left: 4px solid #d97706;">
-                <h4 style="margin: 0 0 10px 0; color: #92400e;">Modified Review</h4>
-                <div style="display: flex; gap: 20px; margin-bottom: 10px;">
-                    <span><strong>Rating:</strong> {rating}</span>
-                    <span><strong>Confidence:</strong> {confidence}</span>
-                </div>
-                {"<div style='margin-top: 10px;'><strong>Summary:</strong><p style='margin: 5px 0; color: #4b5563;'>" + summary[:500] + ("..." if len(summary) > 500 else "") + "</p></div>" if summary else ""}
-                {"<div style='margin-top: 10px;'><strong>Strengths:</strong><p style='margin: 5px 0; color: #059669;'>" + strengths[:300] + ("..." if len(strengths) > 300 else "") + "</p></div>" if strengths else ""}
-                {"<div style='margin-top: 10px;'><strong>Weaknesses:</strong><p style='margin: 5px 0; color: #dc2626;'>" + weaknesses[:300] + ("..." if len(weaknesses) > 300 else "") + "</p></div>" if weaknesses else ""}
-            </div>
-            """
-
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <style>
-                body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; color: #333; margin: 0; padding: 0; }}
-                .container {{ max-width: 700px; margin: 0 auto; padding: 20px; }}
-                .header {{ background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%); color: white; padding: 30px; border-radius: 12px 12px 0 0; }}
-                .content {{ background: #fff; padding: 25px; border: 1px solid #e5e7eb; border-top: none; border-radius: 0 0 12px 12px; }}
-                .button {{ display: inline-block; padding: 12px 24px; background: #d97706; color: white; text-decoration: none; border-radius: 8px; font-weight: 500; }}
-                .footer {{ margin-top: 20px; padding-top: 20px; border-top: 1px solid #e5e7eb; font-size: 12px; color: #6b7280; }}
-                .venue-badge {{ display: inline-block; background: rgba(255,255,255,0.2); color: white; padding: 4px 12px; border-radius: 20px; font-size: 14px; font-weight: 500; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h2 style="margin: 0 0 10px 0;">✏️ Reviews Modified</h2>
-                    <span class="venue-badge">{venue or "OpenReview"}</span>
-                </div>
-                <div class="content">
-                    <h3 style="margin-top: 0;">{paper_title or paper_id}</h3>
-                    <p style="color: #6b7280;">Some reviews for your paper have been updated. Here are the details:</p>
-
-                    {reviews_html}
-
-                    <div style="margin-top: 25px; text-align: center;">
-                        <a href="https://openreview.net/forum?id={paper_id}" class="button">
-                            View Modified Reviews on OpenReview
-                        </a>
-                    </div>
-                </div>
-                <div class="footer">
-                    <p>This notification was sent by OpenReview Monitor. You subscribed to updates for this paper.</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+    ) -> RenderedEmail:
+        """Render the decision notification for a paper."""
+        return _render_cached(
+            "decision",
+            paper_id,
+            event_fingerprint(paper_title, venue, decision, comment, reviews),
+            lambda: (
+                f"[{venue or 'OpenReview'}] Decision: {decision} - {paper_title or paper_id}",
+                email_templates.render_decision(paper_title, paper_id, venue, decision, comment, reviews),
+            ),
+        )
 
-    def send_review_modified_notification(
+    def build_review_modified_notification(
         self,
-        to_email: str,
         paper_title: str,
         paper_id: str,
         venue: str,
         modified_reviews: List[Dict],
-    ) -> bool:
-        """Send review modification notification email (synchronous)."""
-        try:
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = f"[{venue or 'OpenReview'}] Reviews Modified: {paper_title or paper_id}"
-            msg["From"] = self.from_header
-            msg["To"] = to_email
-
-            html_content = self._render_review_modified_template(
-                paper_title, paper_id, venue, modified_reviews
-            )
-            msg.attach(MIMEText(html_content, "html"))
+    ) -> RenderedEmail:
+        """Render the review modification notification for a paper."""
+        return _render_cached(
+            "review_modified",
+            paper_id,
+            event_fingerprint(paper_title, venue, modified_reviews),
+            lambda: (
+                f"[{venue or 'OpenReview'}] Reviews Modified: {paper_title or paper_id}",
+                email_templates.render_review_modified(paper_title, paper_id, venue, modified_reviews),
+            ),
+        )
 
-            self._send_email_sync(msg)
-            logger.info(f"Sent review modification notification to {to_email} for paper {paper_id}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to send review modification notification: {e}")
-            return False
+    def build_digest_notification(self, items: List[Dict]) -> RenderedEmail:
+        """Render one combined email for a digest subscriber (never cached: it is per recipient)."""
+        titles = {item.get("title") or item["openreview_id"] for item in items}
+        if len(titles) == 1:
+            subject = f"[OpenReview Monitor] {len(items)} update(s): {titles.pop()}"
+        else:
+            subject = f"[OpenReview Monitor] {len(items)} updates on {len(titles)} papers"
+        return RenderedEmail(subject=subject, html=email_templates.render_digest(items))
@@ -0,0 +1,269 @@
+"""
+Notification email templates.
+- The HTML/CSS shell of each template is assembled once at import into a string.Template
+- Rendering only substitutes the per-paper fields and review cards
+"""
+from string import Template
+from typing import Dict, List, Optional
+
+_BASE_CSS = (
+    "body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; "
+    "line-height: 1.6; color: #333; margin: 0; padding: 0; }\n"
+    ".container { max-width: 700px; margin: 0 auto; padding: 20px; }\n"
+    ".content { background: #fff; padding: 25px; border: 1px solid #e5e7eb; border-top: none; "
+    "border-radius: 0 0 12px 12px; }\n"
+    ".footer { margin-top: 20px; padding-top: 20px; border-top: 1px solid #e5e7eb; font-size: 12px; color: #6b7280; }\n"
+)
+
+_NOTIFICATION_SHELL = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+{css}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h2 style="margin: 0 0 10px 0;">{heading}</h2>
+            <span class="venue-badge">$venue</span>
+        </div>
+        <div class="content">
+            <h3 style="margin-top: 0;">$title</h3>
+$body
+            <div style="margin-top: 25px; text-align: center;">
+                <a href="https://openreview.net/forum?id=$paper_id" class="button">
+                    {button}
+                </a>
+            </div>
+        </div>
+        <div class="footer">
+            <p>This notification was sent by OpenReview Monitor. You subscribed to updates for this paper.</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+
+def _notification_template(css: str, heading: str, button: str) -> Template:
+    """Bake the static parts into the shell; $venue, $title, $body and $paper_id remain."""
+    return Template(_NOTIFICATION_SHELL.format(css=(_BASE_CSS + css).rstrip(), heading=heading, button=button))
+
+
+def _header_css(header_background: str, button_color: str, badge_css: str) -> str:
+    return (
+        f".header {{ background: {header_background}; color: white; padding: 30px; border-radius: 12px 12px 0 0; }}\n"
+        f".button {{ display: inline-block; padding: 12px 24px; background: {button_color}; color: white; "
+        f"text-decoration: none; border-radius: 8px; font-weight: 500; }}\n"
+        f".venue-badge {{ display: inline-block; {badge_css} padding: 4px 12px; border-radius: 20px; "
+        f"font-size: 14px; font-weight: 500; }}\n"
+    )
+
+
+_LIGHT_BADGE = "background: rgba(255,255,255,0.2); color: white;"
+
+REVIEW_TEMPLATE = _notification_template(
+    _header_css(
+        "linear-gradient(135deg, #4f46e5 0%, #7c3aed 100%)",
+        "#4f46e5",
+        "background: #e0e7ff; color: #4338ca;",
+    ),
+    "📝 Reviews Available!",
+    "View Full Reviews on OpenReview",
+)
+
+REVIEW_MODIFIED_TEMPLATE = _notification_template(
+    _header_css("linear-gradient(135deg, #f59e0b 0%, #d97706 100%)", "#d97706", _LIGHT_BADGE),
+    "✏️ Reviews Modified",
+    "View Modified Reviews on OpenReview",
+)
+
+
+def _decision_template(accepted: bool) -> Template:
+    color = "#059669" if accepted else "#dc2626"
+    background = "#ecfdf5" if accepted else "#fef2f2"
+    gradient = (
+        "linear-gradient(135deg, #059669 0%, #10b981 100%)"
+        if accepted
+        else "linear-gradient(135deg, #dc2626 0%, #ef4444 100%)"
+    )
+    css = _header_css(gradient, "#4f46e5", _LIGHT_BADGE) + (
+        f".decision-box {{ background: {background}; border: 2px solid {color}; padding: 20px; "
+        f"border-radius: 8px; text-align: center; margin: 20px 0; }}\n"
+        f".decision-text {{ font-size: 24px; font-weight: bold; color: {color}; margin: 0; }}\n"
+    )
+    heading = "🎉 Decision Announced" if accepted else "📋 Decision Announced"
+    return _notification_template(css, heading, "View on OpenReview")
+
+
+DECISION_ACCEPTED_TEMPLATE = _decision_template(accepted=True)
+DECISION_REJECTED_TEMPLATE = _decision_template(accepted=False)
+
+_REVIEW_CARD = Template("""
+            <div style="margin: 15px 0; padding: 15px; background: $background; border-radius: 8px; border-left: 4px solid $accent;">
+                <h4 style="margin: 0 0 10px 0; color: $heading_color;">$heading</h4>
+                <div style="display: flex; gap: 20px; margin-bottom: 10px;">
+                    <span><strong>Rating:</strong> $rating</span>
+                    <span><strong>Confidence:</strong> $confidence</span>
+                </div>
+                $sections
+            </div>
+""")
+
+_REVIEW_SECTIONS = (
+    # (field, label, text color, max length)
+    ("summary", "Summary", "#4b5563", 500),
+    ("strengths", "Strengths", "#059669", 300),
+    ("weaknesses", "Weaknesses", "#dc2626", 300),
+)
+
+
+def _review_sections(review: Dict) -> str:
+    parts = []
+    for field, label, color, limit in _REVIEW_SECTIONS:
+        text = review.get(field, "") or ""
+        if not text:
+            continue
+        excerpt = text[:limit] + ("..." if len(text) > limit else "")
+        parts.append(
+            f"<div style='margin-top: 10px;'><strong>{label}:</strong>"
+            f"<p style='margin: 5px 0; color: {color};'>{excerpt}</p></div>"
+        )
+    return "\n                ".join(parts)
+
+
+def _review_card(review: Dict, heading: str, background: str, accent: str, heading_color: str) -> str:
+    return _REVIEW_CARD.substitute(
+        background=background,
+        accent=accent,
+        heading_color=heading_color,
+        heading=heading,
+        rating=review.get("rating", "N/A"),
+        confidence=review.get("confidence", "N/A"),
+        sections=_review_sections(review),
+    )
+
+
+def render_review(paper_title: str, paper_id: str, venue: str, reviews: List[Dict]) -> str:
+    cards = "".join(
+        _review_card(review, f"Reviewer {i}", "#f8f9fa", "#4f46e5", "#1f2937")
+        for i, review in enumerate(reviews, 1)
+    )
+    body = (
+        f'            <p style="color: #6b7280;">Your paper has received {len(reviews)} review(s). '
+        f"Here are the details:</p>\n{cards}"
+    )
+    return REVIEW_TEMPLATE.substitute(
+        venue=venue or "OpenReview", title=paper_title or paper_id, body=body, paper_id=paper_id
+    )
+
+
+def render_review_modified(paper_title: str, paper_id: str, venue: str, modified_reviews: List[Dict]) -> str:
+    cards = "".join(
+        _review_card(review, "Modified Review", "#fffcf0", "#d97706", "#92400e")
+        for review in modified_reviews
+    )
+    body = (
+        '            <p style="color: #6b7280;">Some reviews for your paper have been updated. '
+        f"Here are the details:</p>\n{cards}"
+    )
+    return REVIEW_MODIFIED_TEMPLATE.substitute(
+        venue=venue or "OpenReview", title=paper_title or paper_id, body=body, paper_id=paper_id
+    )
+
+
+def render_decision(
+    paper_title: str,
+    paper_id: str,
+    venue: str,
+    decision: str,
+    comment: Optional[str],
+    reviews: List[Dict],
+) -> str:
+    parts = [
+        '            <div class="decision-box">\n'
+        f'                <p class="decision-text">{decision}</p>\n'
+        "            </div>\n"
+    ]
+    if comment:
+        parts.append(
+            "            <div style='margin: 20px 0; padding: 15px; background: #f8f9fa; border-radius: 8px;'>"
+            "<h4 style='margin: 0 0 10px 0;'>Meta Review / Comments</h4>"
+            f"<p style='margin: 0; color: #4b5563;'>{comment}</p></div>\n"
+        )
+    if reviews:
+        ratings = ", ".join(str(review.get("rating", "N/A")) for review in reviews)
+        parts.append(
+            '            <div style="margin: 20px 0; padding: 15px; background: #f8f9fa; border-radius: 8px;">\n'
+            '                <h4 style="margin: 0 0 10px 0;">Review Summary</h4>\n'
+            f"                <p><strong>Ratings:</strong> {ratings}</p>\n"
+            f"                <p><strong>Number of Reviews:</strong> {len(reviews)}</p>\n"
+            "            </div>\n"
+        )
+    template = DECISION_ACCEPTED_TEMPLATE if "accept" in decision.lower() else DECISION_REJECTED_TEMPLATE
+    return template.substitute(
+        venue=venue or "OpenReview", title=paper_title or paper_id, body="".join(parts), paper_id=paper_id
+    )
+
+
+DIGEST_TEMPLATE = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+{css}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h2 style="margin: 0 0 10px 0;">📬 Paper Updates</h2>
+            <span class="venue-badge">$count update(s)</span>
+        </div>
+        <div class="content">
+            <p style="color: #6b7280; margin-top: 0;">Here is what changed on the papers you follow:</p>
+$body
+        </div>
+        <div class="footer">
+            <p>This digest was sent by OpenReview Monitor. You subscribed to digest updates for these papers.</p>
+        </div>
+    </div>
+</body>
+</html>
+""".format(css=(_BASE_CSS + _header_css(
+    "linear-gradient(135deg, #4f46e5 0%, #7c3aed 100%)", "#4f46e5", _LIGHT_BADGE
+)).rstrip()))
+
+_DIGEST_ENTRY = Template("""
+            <div style="margin: 15px 0; padding: 15px; background: #f8f9fa; border-radius: 8px; border-left: 4px solid $accent;">
+                <p style="margin: 0; font-size: 12px; color: $accent; font-weight: 600;">$label · $venue</p>
+                <h4 style="margin: 4px 0 8px 0; color: #1f2937;">$title</h4>
+                <p style="margin: 0 0 10px 0; color: #4b5563;">$summary</p>
+                <a href="https://openreview.net/forum?id=$paper_id" class="button">View on OpenReview</a>
+            </div>
+""")
+
+_DIGEST_KINDS = {
+    # kind: (label, accent color)
+    "review": ("Reviews available", "#4f46e5"),
+    "review_modified": ("Reviews modified", "#d97706"),
+    "decision": ("Decision announced", "#059669"),
+}
+
+
+def render_digest(items: List[Dict]) -> str:
+    """Items: dicts with kind, openreview_id, title, venue and summary."""
+    entries = []
+    for item in items:
+        label, accent = _DIGEST_KINDS.get(item["kind"], ("Update", "#4f46e5"))
+        entries.append(_DIGEST_ENTRY.substitute(
+            accent=accent,
+            label=label,
+            venue=item.get("venue") or "OpenReview",
+            title=item.get("title") or item["openreview_id"],
+            summary=item["summary"],
+            paper_id=item["openreview_id"],
+        ))
+    return DIGEST_TEMPLATE.substitute(count=len(items), body="".join(entries))
@@ -0,0 +1,162 @@
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+import asyncio
+import logging
+
+from sqlalchemy import func
+
+from ..config import get_settings
+from ..models import EventCursor, Paper, PaperEvent
+
+logger = logging.getLogger(__name__)
+
+REVIEW_ADDED = "review_added"
+REVIEW_MODIFIED = "review_modified"
+DECISION_POSTED = "decision_posted"
+STATUS_CHANGED = "status_changed"
+
+_CONSUME_BATCH_SIZE = 500
+# Passes in a row an event may fail before its consumer logs and skips it
+_MAX_EVENT_ATTEMPTS = 3
+
+EventHandler = Callable[[Any, List[PaperEvent]], None]
+
+# Long-poll listeners woken when a check tick commits new events (this process only)
+_listeners_lock = Lock()
+_listeners: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+
+def append_event(db, paper: Paper, kind: str, payload: Dict[str, Any], notify: bool = True) -> PaperEvent:
+    """Append a change to the log in the caller's transaction."""
+    event = PaperEvent(
+        paper_id=paper.id,
+        openreview_id=paper.openreview_id,
+        venue=paper.venue,
+        kind=kind,
+        payload=payload,
+        notify=notify,
+    )
+    db.add(event)
+    return event
+
+
+def _cursor(db, consumer: str) -> EventCursor:
+    cursor = db.get(EventCursor, consumer)
+    if cursor is None:
+        cursor = EventCursor(consumer=consumer, position=0)
+        db.add(cursor)
+    return cursor
+
+
+def _record_failure(cursor: EventCursor, events: List[PaperEvent], error: Exception) -> None:
+    cursor.last_error = f"event {events[0].id}: {error}"
+    if len(events) > 1:
+        # Retry the batch one event at a time (next pass) to find the failing event
+        cursor.retry_until = events[-1].id
+        logger.warning(
+            "Consumer %s failed on events %d-%d, retrying them one by one: %s",
+            cursor.consumer, events[0].id, events[-1].id, error,
+        )
+        return
+    cursor.failures = (cursor.failures or 0) + 1
+    if cursor.failures < _MAX_EVENT_ATTEMPTS:
+        logger.warning(
+            "Consumer %s failed on event %d (attempt %d): %s", cursor.consumer, events[0].id, cursor.failures, error
+        )
+        return
+    logger.error(
+        "Consumer %s skipped event %d after %d failed attempts: %s",
+        cursor.consumer, events[0].id, cursor.failures, error,
+    )
+    cursor.position = events[0].id
+    cursor.failures = 0
+
+
+def consume_events(db, consumer: str, handler: EventHandler, batch_size: int = _CONSUME_BATCH_SIZE) -> int:
+    """
+    Feed events after the consumer's cursor to handler in id order, in batches.
+    - The cursor advances in the caller's transaction, so a rolled-back pass replays its events
+    - A new consumer starts from the oldest retained event
+    - Every batch runs in a savepoint: a failing batch is rolled back and the pass stops there with the
+      error on the cursor; the next pass retries it one event at a time, and an event that fails
+      _MAX_EVENT_ATTEMPTS passes in a row is logged and skipped, so one bad event never stalls the cursor
+    - Handlers must tolerate being called again for events of a rolled-back batch
+    """
+    db.flush()
+    cursor = _cursor(db, consumer)
+    handled = 0
+    while True:
+        single = cursor.retry_until is not None and cursor.position < cursor.retry_until
+        events = db.query(PaperEvent).filter(PaperEvent.id > cursor.position).order_by(
+            PaperEvent.id
+        ).limit(1 if single else batch_size).all()
+        if not events:
+            break
+        try:
+            with db.begin_nested():
+                handler(db, events)
+                db.flush()
+        except Exception as e:
+            _record_failure(cursor, events, e)
+            db.flush()
+            break
+        cursor.position = events[-1].id
+        cursor.failures = 0
+        cursor.last_error = None
+        if cursor.retry_until is not None and cursor.position >= cursor.retry_until:
+            cursor.retry_until = None
+        handled += len(events)
+        db.flush()
+
+    if handled:
+        logger.info("Consumer %s processed %d paper events", consumer, handled)
+    return handled
+
+
+def rewind_consumer(db, consumer: str, position: int = 0) -> None:
+    """Move a consumer's cursor back so it replays retained events from position onwards."""
+    _cursor(db, consumer).position = max(0, position)
+
+
+def prune_events(db, now: datetime) -> int:
+    """Delete events past the retention period that every consumer has already processed."""
+    retention_days = get_settings().paper_event_retention_days
+    if retention_days <= 0:
+        return 0
+
+    processed: Optional[int] = db.query(func.min(EventCursor.position)).scalar()
+    if not processed:
+        return 0
+    deleted = db.query(PaperEvent).filter(
+        PaperEvent.id <= processed,
+        PaperEvent.created_at < now - timedelta(days=retention_days),
+    ).delete(synchronize_session=False)
+    if deleted:
+        logger.info("Pruned %d paper events", deleted)
+    return deleted
+
+
+@contextmanager
+def listen_for_events() -> Iterator[asyncio.Event]:
+    """Register an asyncio.Event that is set whenever new events are committed."""
+    listener = (asyncio.get_running_loop(), asyncio.Event())
+    with _listeners_lock:
+        _listeners.add(listener)
+    try:
+        yield listener[1]
+    finally:
+        with _listeners_lock:
+            _listeners.discard(listener)
+
+
+def signal_new_events() -> None:
+    """Wake long-poll listeners; call after committing a transaction that appended events."""
+    with _listeners_lock:
+        listeners = list(_listeners)
+    for loop, event in listeners:
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            pass  # Loop already closed; the listener is discarded when its request ends
@@ -0,0 +1,462 @@
+"""
+Registry of scheduler jobs: scheduled ticks, manual checks and silent syncs.
+- A job is registered when it is requested (queued) or when a tick starts, and kept for a while after it ends
+- The job running in the current context publishes its progress through progress_broker (this worker)
+- Every job is mirrored to the check_jobs table, so any worker can list, inspect and cancel it:
+  state changes are written right away, progress with the runner's commits (save_job_progress)
+- Cancellation is cooperative: check loops call job_checkpoint() before every paper, which also picks up
+  cancel requests made in other workers
+"""
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+import os
+import socket
+import time
+import uuid
+
+from sqlalchemy import or_
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..database import SessionLocal
+from ..models import CheckJob
+from .progress import progress_broker
+
+logger = logging.getLogger(__name__)
+
+_FINISHED_JOB_HISTORY = 100
+_JOB_ERROR_HISTORY = 20
+# How often a running job reads cancel requests made in other workers
+_CANCEL_POLL_SECONDS = 1.0
+
+# Identifies this process in check_jobs.worker
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+_FINISHED_STATUSES = (COMPLETED, FAILED, CANCELLED)
+
+
+class JobCancelled(Exception):
+    """Raised at a checkpoint once cancellation of the current job was requested."""
+
+
+@dataclass
+class Job:
+    job_id: str
+    job_type: str
+    status: str = QUEUED
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    total: int = 0  # Papers the job plans to visit; grows per check phase
+    processed: int = 0
+    current_paper: Optional[str] = None
+    counts: Dict[str, int] = field(default_factory=dict)
+    errors: List[Dict[str, Any]] = field(default_factory=list)  # Latest paper errors
+    error: Optional[str] = None  # Why the whole job failed
+    cancel_requested: bool = False
+    worker: str = WORKER_ID
+    _started_monotonic: Optional[float] = field(default=None, repr=False)
+    _cancel_polled: float = field(default=0.0, repr=False)
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        if self.status != RUNNING or not self.processed:
+            return None
+        if self._started_monotonic is not None:
+            elapsed = time.monotonic() - self._started_monotonic
+        elif self.started_at is not None:
+            # Job of another worker, loaded from check_jobs
+            elapsed = (datetime.utcnow() - self.started_at).total_seconds()
+        else:
+            return None
+        return round(elapsed / self.processed * max(0, self.total - self.processed), 1)
+
+
+def _job_values(job: Job) -> Dict[str, Any]:
+    return {
+        "job_type": job.job_type,
+        "worker": job.worker,
+        "status": job.status,
+        "total": job.total,
+        "processed": job.processed,
+        "current_paper": job.current_paper,
+        "counts": dict(job.counts),
+        "errors": [
+            {**entry, "at": entry["at"].isoformat() if isinstance(entry.get("at"), datetime) else entry.get("at")}
+            for entry in job.errors
+        ],
+        "error": job.error,
+        "cancel_requested": job.cancel_requested,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+    }
+
+
+def _job_from_row(row: CheckJob) -> Job:
+    return Job(
+        job_id=row.job_id,
+        job_type=row.job_type,
+        status=row.status,
+        created_at=row.created_at,
+        started_at=row.started_at,
+        finished_at=row.finished_at,
+        total=row.total or 0,
+        processed=row.processed or 0,
+        current_paper=row.current_paper,
+        counts=dict(row.counts or {}),
+        errors=list(row.errors or []),
+        error=row.error,
+        cancel_requested=bool(row.cancel_requested),
+        worker=row.worker,
+    )
+
+
+def _write_job(db, job: Job) -> None:
+    row = db.get(CheckJob, job.job_id)
+    if row is None:
+        db.add(CheckJob(job_id=job.job_id, **_job_values(job)))
+        return
+    values = _job_values(job)
+    if not job.cancel_requested:
+        # Never clear a cancel request stored by another worker
+        del values["cancel_requested"]
+    for key, value in values.items():
+        setattr(row, key, value)
+
+
+def _prune_jobs(db) -> None:
+    keep = db.query(CheckJob.job_id).filter(CheckJob.status.in_(_FINISHED_STATUSES)).order_by(
+        CheckJob.created_at.desc()
+    ).limit(_FINISHED_JOB_HISTORY)
+    db.query(CheckJob).filter(
+        CheckJob.status.in_(_FINISHED_STATUSES),
+        CheckJob.job_id.notin_(keep),
+    ).delete(synchronize_session=False)
+
+
+def store_job(job: Job, prune: bool = False) -> None:
+    """Write the job's state to check_jobs in its own transaction; errors are logged, never raised."""
+    db = SessionLocal()
+    try:
+        _write_job(db, job)
+        if prune:
+            _prune_jobs(db)
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.warning("Could not store job %s: %s", job.job_id, e)
+    finally:
+        db.close()
+
+
+def _load_job(job_id: str) -> Optional[Job]:
+    db = SessionLocal()
+    try:
+        row = db.get(CheckJob, job_id)
+        return _job_from_row(row) if row is not None else None
+    finally:
+        db.close()
+
+
+class JobRegistry:
+    """Jobs of this process (fresher than their check_jobs rows while they run)."""
+
+    def __init__(self, history: int = _FINISHED_JOB_HISTORY):
+        self._lock = Lock()
+        self._history = history
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+
+    def create(self, job_type: str, job_id: Optional[str] = None) -> Job:
+        job = Job(job_id=job_id or uuid.uuid4().hex[:12], job_type=job_type)
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._trim()
+        return job
+
+    def _trim(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.status in _FINISHED_STATUSES]
+        for job_id in finished[:max(0, len(finished) - self._history)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        """Newest first."""
+        with self._lock:
+            return list(reversed(self._jobs.values()))
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Request cancellation; a queued job is cancelled right away, a running one at its next checkpoint."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status in _FINISHED_STATUSES:
+                return job
+            job.cancel_requested = True
+            if job.status == QUEUED:
+                job.status = CANCELLED
+                job.finished_at = datetime.utcnow()
+        return job
+
+    def skip(self, job_id: str, reason: str) -> Optional[Job]:
+        """A queued job that will not run (e.g. another check job held the lock)."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job.status == QUEUED:
+                job.status = FAILED
+                job.error = reason
+                job.finished_at = datetime.utcnow()
+        return job
+
+    def finished(self) -> None:
+        with self._lock:
+            self._trim()
+
+
+job_registry = JobRegistry()
+
+_current_job: ContextVar[Optional[Job]] = ContextVar("current_job", default=None)
+
+
+def queue_job(job_type: str) -> Job:
+    """Register a job requested now that runs later (e.g. as a background task)."""
+    job = job_registry.create(job_type)
+    store_job(job)
+    return job
+
+
+def get_job(job_id: str) -> Optional[Job]:
+    """A job of any worker: this process's copy if it has one, else its check_jobs row."""
+    return job_registry.get(job_id) or _load_job(job_id)
+
+
+def list_jobs() -> List[Job]:
+    """Queued, running and recently finished jobs of all workers, newest first."""
+    db = SessionLocal()
+    try:
+        rows = db.query(CheckJob).order_by(CheckJob.created_at.desc()).limit(
+            _FINISHED_JOB_HISTORY + 10
+        ).all()
+        jobs = [_job_from_row(row) for row in rows]
+    finally:
+        db.close()
+    local = {job.job_id: job for job in job_registry.list()}
+    merged = [local.pop(job.job_id, job) for job in jobs]
+    return sorted(merged + list(local.values()), key=lambda job: job.created_at, reverse=True)
+
+
+def cancel_job(job_id: str) -> Optional[Job]:
+    """
+    Request cancellation of a job of any worker (see JobRegistry.cancel).
+    - Jobs of other workers are flagged in check_jobs; their runner stops at its next checkpoint
+    """
+    job = job_registry.cancel(job_id)
+    if job is not None:
+        if job.cancel_requested:
+            store_job(job)
+        return job
+
+    db = SessionLocal()
+    try:
+        row = db.get(CheckJob, job_id)
+        if row is None:
+            return None
+        if row.status not in _FINISHED_STATUSES:
+            row.cancel_requested = True
+            if row.status == QUEUED:
+                row.status = CANCELLED
+                row.finished_at = datetime.utcnow()
+            db.commit()
+        return _job_from_row(row)
+    finally:
+        db.close()
+
+
+def skip_job(job_id: str, reason: str) -> None:
+    job = job_registry.skip(job_id, reason)
+    if job is not None:
+        store_job(job)
+
+
+def poll_cancel_request(job: Job) -> bool:
+    """Pick up a cancel request stored by another worker (a read, so it never waits for the runner's writes)."""
+    if job.cancel_requested:
+        return True
+    job._cancel_polled = time.monotonic()
+    db = SessionLocal()
+    try:
+        requested = db.query(CheckJob.cancel_requested).filter(CheckJob.job_id == job.job_id).scalar()
+    except SQLAlchemyError as e:
+        logger.warning("Could not read cancel request of job %s: %s", job.job_id, e)
+        requested = False
+    finally:
+        db.close()
+    if requested:
+        job.cancel_requested = True
+    return job.cancel_requested
+
+
+def start_job(job_type: str, job_id: Optional[str] = None, **data: Any) -> Job:
+    """Mark a queued job (or a new one) running, make it current in this context and publish "started"."""
+    job = job_registry.get(job_id) if job_id else None
+    if job is None:
+        job = job_registry.create(job_type, job_id)
+    job.status = RUNNING
+    job.started_at = datetime.utcnow()
+    job._started_monotonic = time.monotonic()
+    _current_job.set(job)
+    store_job(job)
+    progress_broker.publish("started", {
+        "job_id": job.job_id, "job": job.job_type, "started_at": job.started_at.isoformat(), **data
+    })
+    return job
+
+
+def fail_interrupted_jobs(current: Job) -> None:
+    """
+    Mark check_jobs rows still "running" besides current as failed: their worker stopped mid-run.
+    Only call while no other job can run (the caller holds the cluster-wide check_run lock).
+    """
+    db = SessionLocal()
+    try:
+        updated = db.query(CheckJob).filter(
+            CheckJob.status == RUNNING,
+            CheckJob.job_id != current.job_id,
+        ).update({
+            CheckJob.status: FAILED,
+            CheckJob.error: "Interrupted: its worker stopped",
+            CheckJob.finished_at: datetime.utcnow(),
+        }, synchronize_session=False)
+        db.commit()
+        if updated:
+            logger.info("Marked %d interrupted jobs as failed", updated)
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.warning("Could not mark interrupted jobs: %s", e)
+    finally:
+        db.close()
+
+
+def save_job_progress(db) -> None:
+    """Write the current job's progress in db's transaction; the runner calls it right before it commits."""
+    job = _current_job.get()
+    if job is not None:
+        _write_job(db, job)
+
+
+def add_job_total(count: int) -> None:
+    job = _current_job.get()
+    if job is not None:
+        job.total += count
+
+
+def job_checkpoint(openreview_id: Optional[str] = None) -> None:
+    """Called before each paper: raises JobCancelled if requested, else records the paper being checked."""
+    job = _current_job.get()
+    if job is None:
+        return
+    if job.cancel_requested or (
+        time.monotonic() - job._cancel_polled >= _CANCEL_POLL_SECONDS and poll_cancel_request(job)
+    ):
+        raise JobCancelled(job.job_id)
+    job.current_paper = openreview_id
+
+
+def job_paper_done() -> None:
+    job = _current_job.get()
+    if job is not None:
+        job.processed += 1
+
+
+def job_event(kind: str, amount: int = 1, publish: bool = True, **data: Any) -> None:
+    """Add amount to the current job's count of kind and (optionally) publish it; no-op outside a job."""
+    job = _current_job.get()
+    if job is None:
+        return
+    job.counts[kind] = job.counts.get(kind, 0) + amount
+    if kind == "paper_failed":
+        job.errors = (job.errors + [{
+            "openreview_id": data.get("openreview_id"), "error": data.get("error"), "at": datetime.utcnow()
+        }])[-_JOB_ERROR_HISTORY:]
+    if publish:
+        progress_broker.publish(kind, {"job_id": job.job_id, **data})
+
+
+def finish_job(job: Job, error: Optional[str] = None, cancelled: bool = False) -> None:
+    """Publish "completed", "cancelled" or "failed" with the job's totals and clear the current job."""
+    job.status = FAILED if error is not None else CANCELLED if cancelled else COMPLETED
+    job.error = error
+    job.finished_at = datetime.utcnow()
+    job.current_paper = None
+    store_job(job, prune=True)
+    progress_broker.publish(job.status, _job_totals(job))
+    if _current_job.get() is job:
+        _current_job.set(None)
+    job_registry.finished()
+
+
+def _job_totals(job: Job) -> Dict[str, Any]:
+    totals = {
+        "job_id": job.job_id,
+        "job": job.job_type,
+        "duration_ms": round(((job.finished_at or datetime.utcnow()) - (job.started_at or job.created_at))
+                             .total_seconds() * 1000),
+        "totals": dict(job.counts),
+    }
+    if job.error is not None:
+        totals["error"] = job.error
+    return totals
+
+
+class RemoteJobWatcher:
+    """
+    Turns check_jobs rows of other workers into progress events for this worker's SSE clients.
+    - "started" when a job starts running, "progress" (processed/total/totals) while it advances,
+      then "completed", "failed" or "cancelled"
+    """
+
+    def __init__(self, since: Optional[datetime] = None):
+        self._since = since or datetime.utcnow()
+        self._seen: Dict[str, Tuple[str, int]] = {}
+
+    def poll(self, db) -> List[Tuple[str, Dict[str, Any]]]:
+        rows = db.query(CheckJob).filter(
+            CheckJob.worker != WORKER_ID,
+            or_(CheckJob.status == RUNNING, CheckJob.finished_at >= self._since),
+        ).order_by(CheckJob.created_at).all()
+        events: List[Tuple[str, Dict[str, Any]]] = []
+        for row in rows:
+            previous = self._seen.get(row.job_id)
+            state = (row.status, row.processed or 0)
+            if previous == state:
+                continue
+            self._seen[row.job_id] = state
+            job = _job_from_row(row)
+            if row.status == RUNNING:
+                if previous is None or previous[0] != RUNNING:
+                    events.append(("started", {
+                        "job_id": job.job_id,
+                        "job": job.job_type,
+                        "started_at": job.started_at.isoformat() if job.started_at else None,
+                    }))
+                events.append(("progress", {
+                    "job_id": job.job_id,
+                    "job": job.job_type,
+                    "processed": job.processed,
+                    "total": job.total,
+                    "totals": dict(job.counts),
+                }))
+            elif row.status in _FINISHED_STATUSES and row.started_at is not None:
+                events.append((row.status, _job_totals(job)))
+        return events
@@ -0,0 +1,182 @@
+"""
+DB-backed leases, so exactly one process leads (or holds a lock) when several workers share a database.
+- "scheduler": held for as long as a worker runs; its holder runs scheduled jobs and outbox delivery
+- "check_run": taken around every check job (scheduled or manual) and released when it ends
+- Every worker heartbeats the same lease row from a background thread (every lease_seconds / 4); the
+  holder renews it, the others take it over only once it expired, so a dead leader is replaced
+  within lease_seconds
+- Conditional UPDATEs decide the winner; a leader that shuts down expires its lease right away
+- A process considers itself leader until lease_seconds after its last successful renewal started
+  (measured on its own monotonic clock, so it never outlives the lease the others see)
+"""
+from datetime import datetime, timedelta
+from threading import Event, Thread
+from typing import Callable, Optional
+import logging
+import os
+import socket
+import time
+import uuid
+
+from sqlalchemy import case, or_
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from ..database import SessionLocal
+from ..models import SchedulerLease
+
+logger = logging.getLogger(__name__)
+
+_ACQUIRE_POLL_SECONDS = 0.5
+
+
+class LeaderLease:
+    def __init__(
+        self,
+        name: str,
+        lease_seconds: float,
+        on_elected: Optional[Callable[[], None]] = None,
+        on_lost: Optional[Callable[[], None]] = None,
+        log_transitions: bool = True,
+    ):
+        self.name = name
+        self.lease_seconds = max(1.0, float(lease_seconds))
+        self.holder = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._on_elected = on_elected
+        self._on_lost = on_lost
+        self._log = logger.info if log_transitions else logger.debug
+        self._valid_until = 0.0
+        self._leading = False
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return time.monotonic() < self._valid_until
+
+    def _claim(self, db, now: datetime) -> bool:
+        expires_at = now + timedelta(seconds=self.lease_seconds)
+        updated = db.query(SchedulerLease).filter(
+            SchedulerLease.name == self.name,
+            or_(SchedulerLease.holder == self.holder, SchedulerLease.expires_at <= now),
+        ).update(
+            {
+                SchedulerLease.acquired_at: case(
+                    (SchedulerLease.holder == self.holder, SchedulerLease.acquired_at), else_=now
+                ),
+                SchedulerLease.holder: self.holder,
+                SchedulerLease.renewed_at: now,
+                SchedulerLease.expires_at: expires_at,
+            },
+            synchronize_session=False,
+        )
+        if not updated:
+            if db.query(SchedulerLease.name).filter(SchedulerLease.name == self.name).first():
+                db.rollback()
+                return False
+            db.add(SchedulerLease(
+                name=self.name, holder=self.holder, acquired_at=now, renewed_at=now, expires_at=expires_at
+            ))
+        try:
+            db.commit()
+        except IntegrityError:
+            # Another process created the row first
+            db.rollback()
+            return False
+        return True
+
+    def heartbeat(self) -> bool:
+        """Take or renew the lease; returns whether this process leads afterwards."""
+        started = time.monotonic()
+        db = SessionLocal()
+        try:
+            if self._claim(db, datetime.utcnow()):
+                self._valid_until = started + self.lease_seconds
+            else:
+                self._valid_until = 0.0
+        except SQLAlchemyError as e:
+            # Keep leading until the lease lapses; the next heartbeat may still renew it
+            db.rollback()
+            logger.warning("Could not renew %s lease: %s", self.name, e)
+        finally:
+            db.close()
+        self._transition()
+        return self.is_leader
+
+    def _transition(self) -> None:
+        leading = self.is_leader
+        if leading == self._leading:
+            return
+        self._leading = leading
+        if leading:
+            self._log("This process (%s) now holds the %s lease", self.holder, self.name)
+            if self._on_elected is not None:
+                self._on_elected()
+        else:
+            logger.warning("This process (%s) lost the %s lease", self.holder, self.name)
+            if self._on_lost is not None:
+                self._on_lost()
+
+    def _run(self) -> None:
+        interval = self.lease_seconds / 4
+        while not self._stop.wait(interval):
+            try:
+                self.heartbeat()
+            except Exception as e:
+                logger.error("%s lease heartbeat failed: %s", self.name, e)
+
+    def _start_heartbeat(self) -> None:
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name=f"{self.name}-lease", daemon=True)
+        self._thread.start()
+
+    def start(self) -> None:
+        """Heartbeat once now, then keep heartbeating in a background thread."""
+        self.heartbeat()
+        self._start_heartbeat()
+
+    def acquire(self, timeout: Optional[float] = 0.0) -> bool:
+        """
+        Take the lease like a lock and keep renewing it until stop().
+        - timeout: seconds to wait for the current holder (0 tries once, None waits indefinitely)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.heartbeat():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(_ACQUIRE_POLL_SECONDS)
+        self._start_heartbeat()
+        return True
+
+    def stop(self) -> None:
+        """Stop heartbeating and release the lease."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.lease_seconds)
+            self._thread = None
+        self.release()
+
+    def release(self) -> None:
+        """Expire the lease now if this process holds it, so another worker takes over at its next heartbeat."""
+        if not self._leading:
+            return
+        self._valid_until = 0.0
+        self._leading = False
+        if self._on_lost is not None:
+            self._on_lost()
+        db = SessionLocal()
+        try:
+            now = datetime.utcnow()
+            db.query(SchedulerLease).filter(
+                SchedulerLease.name == self.name,
+                SchedulerLease.holder == self.holder,
+            ).update({SchedulerLease.expires_at: now}, synchronize_session=False)
+            db.commit()
+            self._log("Released %s lease", self.name)
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.warning("Could not release %s lease: %s", self.name, e)
+        finally:
+            db.close()
+
+    def current(self, db) -> Optional[SchedulerLease]:
+        return db.get(SchedulerLease, self.name)
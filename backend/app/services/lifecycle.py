@@ -0,0 +1,210 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+import logging
+
+from sqlalchemy import exists, func, or_
+from sqlalchemy.orm import aliased, undefer_group
+
+from ..config import get_settings
+from ..models import Paper, PaperArchive, Review, Subscriber, PAPER_BLOB_GROUP
+from .notifications import DECISION_EVENT, owed_clause, record_existing_notifications
+from .reviews import dump_review_history, load_reviews, restore_review_history, sync_reviews
+
+logger = logging.getLogger(__name__)
+
+_DECIDED_STATUSES = ("accepted", "rejected", "decided")
+_SUBSCRIBER_SNAPSHOT_FIELDS = (
+    "email",
+    "notify_on_review",
+    "notify_on_review_modified",
+    "notify_on_decision",
+    "notified_review",
+    "notified_decision",
+    "digest",
+    # Delivery health, so a reactivated paper does not restart a bounce loop
+    "send_failures",
+    "hard_failures",
+    "last_send_error",
+    "next_send_after",
+    "quarantined_at",
+)
+_SUBSCRIBER_SNAPSHOT_DATETIMES = ("next_send_after", "quarantined_at")
+
+
+@dataclass
+class LifecycleResult:
+    paused: int = 0
+    resumed: int = 0
+    retired: List[str] = field(default_factory=list)
+
+
+def _has_subscribers():
+    return exists().where(Subscriber.paper_id == Paper.id)
+
+
+def pause_if_orphaned(db, paper_id: int, now: Optional[datetime] = None) -> bool:
+    """Pause a paper as soon as its last subscriber is removed."""
+    db.flush()
+    updated = db.query(Paper).filter(
+        Paper.id == paper_id,
+        Paper.paused_at.is_(None),
+        ~_has_subscribers(),
+    ).update({Paper.paused_at: now or datetime.utcnow()}, synchronize_session=False)
+    return bool(updated)
+
+
+def _pause_orphaned_papers(db, now: datetime) -> int:
+    return db.query(Paper).filter(
+        Paper.paused_at.is_(None),
+        ~_has_subscribers(),
+    ).update({Paper.paused_at: now}, synchronize_session=False)
+
+
+def _resume_subscribed_papers(db) -> int:
+    return db.query(Paper).filter(
+        Paper.paused_at.isnot(None),
+        _has_subscribers(),
+    ).update({Paper.paused_at: None}, synchronize_session=False)
+
+
+def _retirement_candidates(db, cutoff: datetime) -> List[Paper]:
+    """Decided papers with no status/review/decision change and no owed decision email since cutoff."""
+    pending = aliased(Subscriber)
+    return db.query(Paper).filter(
+        or_(Paper.decision_hash.isnot(None), Paper.status.in_(_DECIDED_STATUSES)),
+        func.coalesce(Paper.last_changed_at, Paper.created_at) <= cutoff,
+        ~exists().where(Review.paper_id == Paper.id, Review.updated_at > cutoff),
+        ~exists().where(
+            pending.paper_id == Paper.id,
+            pending.quarantined_at.is_(None),
+            pending.notify_on_decision == True,
+            owed_clause(pending.id, DECISION_EVENT),
+        ),
+    ).order_by(Paper.id).all()
+
+
+def _subscriber_snapshot(subscriber: Subscriber) -> Dict[str, Any]:
+    data = {key: getattr(subscriber, key) for key in _SUBSCRIBER_SNAPSHOT_FIELDS}
+    for key in _SUBSCRIBER_SNAPSHOT_DATETIMES + ("created_at",):
+        value = getattr(subscriber, key)
+        data[key] = value.isoformat() if value else None
+    return data
+
+
+def _restored_subscriber_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    # Archives taken before a field was snapshotted keep the column default
+    fields = {key: data[key] for key in _SUBSCRIBER_SNAPSHOT_FIELDS if key in data}
+    for key in _SUBSCRIBER_SNAPSHOT_DATETIMES:
+        if fields.get(key):
+            fields[key] = datetime.fromisoformat(fields[key])
+    return fields
+
+
+def archive_paper(db, paper: Paper, reason: str, now: datetime) -> PaperArchive:
+    """Snapshot a paper with its reviews, review history and subscribers into paper_archive, then delete it."""
+    subscribers = db.query(Subscriber).filter(Subscriber.paper_id == paper.id).order_by(Subscriber.id).all()
+    archive = PaperArchive(
+        paper_id=paper.id,
+        openreview_id=paper.openreview_id,
+        submission_number=paper.submission_number,
+        title=paper.title,
+        venue=paper.venue,
+        openreview_username=paper.openreview_username,
+        openreview_password=paper.openreview_password,
+        status=paper.status,
+        reason=reason,
+        decision_hash=paper.decision_hash,
+        review_count=paper.review_count or 0,
+        subscriber_count=len(subscribers),
+        decision_data=paper.decision_data,
+        reviews=load_reviews(db, paper.id),
+        review_history=dump_review_history(db, paper.id),
+        subscribers=[_subscriber_snapshot(sub) for sub in subscribers],
+        last_changed_at=paper.last_changed_at,
+        paper_created_at=paper.created_at,
+        archived_at=now,
+    )
+    db.add(archive)
+    db.delete(paper)  # Cascades to subscribers, reviews and review history
+    db.flush()
+    return archive
+
+
+def restore_archived_paper(db, archive: PaperArchive, now: Optional[datetime] = None) -> Paper:
+    """
+    Move an archived paper back into the working set.
+    - Subscribers come back with their notification flags, digest preference and delivery health
+      (failure counters, backoff and quarantine)
+    - Reviews and their edit history are restored from the snapshot (history restarts from the reviews
+      for archives taken before it was kept)
+    - last_checked is cleared so the next scheduler tick refreshes the paper
+    """
+    now = now or datetime.utcnow()
+    archive = db.query(PaperArchive).options(undefer_group(PAPER_BLOB_GROUP)).filter(
+        PaperArchive.id == archive.id
+    ).one()
+    subscribers = archive.subscribers if isinstance(archive.subscribers, list) else []
+
+    paper = Paper(
+        openreview_id=archive.openreview_id,
+        submission_number=archive.submission_number,
+        title=archive.title,
+        venue=archive.venue,
+        openreview_username=archive.openreview_username,
+        openreview_password=archive.openreview_password,
+        status=archive.status or "pending",
+        decision_data=archive.decision_data,
+        decision_hash=archive.decision_hash,
+        last_changed_at=now,
+        paused_at=None if subscribers else now,
+        created_at=archive.paper_created_at or now,
+    )
+    db.add(paper)
+    db.flush()
+
+    reviews = archive.reviews if isinstance(archive.reviews, list) else []
+    history = archive.review_history if isinstance(archive.review_history, list) else []
+    restore_review_history(db, paper.id, history)
+    sync_reviews(db, paper, [review for review in reviews if isinstance(review, dict)], record_history=not history)
+
+    for data in subscribers:
+        created_at = data.get("created_at")
+        subscriber = Subscriber(
+            paper_id=paper.id,
+            created_at=datetime.fromisoformat(created_at) if created_at else now,
+            **_restored_subscriber_fields(data),
+        )
+        db.add(subscriber)
+        record_existing_notifications(db, subscriber)
+
+    db.delete(archive)
+    db.flush()
+    logger.info("Reactivated archived paper %s (%d subscribers)", paper.openreview_id, len(subscribers))
+    return paper
+
+
+def apply_lifecycle_policies(db, now: datetime) -> LifecycleResult:
+    """
+    Shrink the scheduler's working set; runs at the start of every check tick.
+    - Papers without subscribers are paused; paused papers that gained subscribers resume
+    - Decided papers quiet for LIFECYCLE_RETIRE_QUIET_DAYS are moved to paper_archive
+    """
+    result = LifecycleResult()
+    result.resumed = _resume_subscribed_papers(db)
+    result.paused = _pause_orphaned_papers(db, now)
+
+    quiet_days = get_settings().lifecycle_retire_quiet_days
+    if quiet_days > 0:
+        for paper in _retirement_candidates(db, now - timedelta(days=quiet_days)):
+            archive_paper(db, paper, "decided", now)
+            result.retired.append(paper.openreview_id)
+
+    if result.paused or result.resumed or result.retired:
+        logger.info(
+            "Lifecycle: paused %d, resumed %d, retired %d papers",
+            result.paused,
+            result.resumed,
+            len(result.retired),
+        )
+    return result
@@ -0,0 +1,189 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+import logging
+
+from sqlalchemy import exists, update
+
+from ..models import NotificationLedger, Paper, Subscriber
+from ..utils.fingerprint import event_fingerprint
+from .reviews import review_notify_hash
+
+logger = logging.getLogger(__name__)
+
+_UPDATE_CHUNK_SIZE = 500
+_NOTIFIED_FLAGS = ("notified_review", "notified_decision")
+
+REVIEW_EVENT = "review"
+DECISION_EVENT = "decision"
+# Ledger events mirrored by a Subscriber.notified_* flag
+_EVENT_FLAGS = {REVIEW_EVENT: "notified_review", DECISION_EVENT: "notified_decision"}
+
+
+def review_modified_event_key(modified_reviews: List[Dict[str, Any]]) -> str:
+    """
+    The same set of edits (even if detected again after a crash) always maps to the same key.
+    The review version is part of the key, so an edit reverted and then made again is notified again.
+    """
+    edits = sorted(
+        (str(review.get("id")), review.get("version") or 0, review_notify_hash(review))
+        for review in modified_reviews
+    )
+    return f"review_modified:{event_fingerprint(edits)}"
+
+
+def owed_clause(subscriber_id, event_key: str):
+    """SQL: the subscriber has no ledger row for event_key yet (the notified_* flags are only a mirror)."""
+    return ~exists().where(
+        NotificationLedger.subscriber_id == subscriber_id,
+        NotificationLedger.event_key == event_key,
+    )
+
+
+def record_existing_notifications(db, subscriber: Subscriber) -> None:
+    """Add ledger rows for the notified_* flags a new or restored subscriber starts with."""
+    db.flush()
+    for event_key, flag in _EVENT_FLAGS.items():
+        if getattr(subscriber, flag):
+            db.add(NotificationLedger(subscriber_id=subscriber.id, event_key=event_key, kind=event_key))
+
+
+def forget_notifications(db, subscriber: Subscriber) -> None:
+    """Drop the review/decision ledger rows so those notifications are sent again."""
+    db.query(NotificationLedger).filter(
+        NotificationLedger.subscriber_id == subscriber.id,
+        NotificationLedger.event_key.in_(list(_EVENT_FLAGS)),
+    ).delete(synchronize_session=False)
+    for flag in _EVENT_FLAGS.values():
+        setattr(subscriber, flag, False)
+
+
+@dataclass
+class SubscriberInfo:
+    """Plain snapshot of a subscriber row used by the scheduler fan-out."""
+    id: int
+    paper_id: int
+    email: str
+    notify_on_review: bool
+    notify_on_review_modified: bool
+    notify_on_decision: bool
+    notified_review: bool
+    notified_decision: bool
+    digest: bool = False
+    next_send_after: Optional[datetime] = None
+    quarantined: bool = False
+
+    def backing_off(self, now: datetime) -> bool:
+        """True while new notifications for this address should wait (failures or quarantine)."""
+        return self.quarantined or (self.next_send_after is not None and self.next_send_after > now)
+
+
+_SUBSCRIBER_COLUMNS = (
+    Subscriber.id,
+    Subscriber.paper_id,
+    Subscriber.email,
+    Subscriber.notify_on_review,
+    Subscriber.notify_on_review_modified,
+    Subscriber.notify_on_decision,
+    Subscriber.notified_review,
+    Subscriber.notified_decision,
+    Subscriber.digest,
+    Subscriber.next_send_after,
+    Subscriber.quarantined_at,
+)
+
+
+class SubscriberIndex:
+    """
+    Subscribers of the papers checked in one scheduler tick, indexed by paper id.
+    - Loaded with one joined query per check phase instead of one query per paper
+    - Their notification ledger keys are loaded alongside and decide what is still owed
+    - notified_* flag changes are buffered and written as bulk UPDATEs before commit
+    """
+
+    def __init__(self):
+        self._by_paper: Dict[int, List[SubscriberInfo]] = {}
+        self._ledger: Dict[int, Set[str]] = {}
+        self._pending_flags: Dict[str, Set[int]] = {flag: set() for flag in _NOTIFIED_FLAGS}
+
+    def load(self, db, paper_criteria: Iterable, paper_ids: Iterable[int]) -> None:
+        """Load subscribers of papers matching the criteria; papers loaded earlier are kept as-is."""
+        paper_ids = [paper_id for paper_id in paper_ids if paper_id not in self._by_paper]
+        if not paper_ids:
+            return
+
+        wanted = set(paper_ids)
+        loaded: Dict[int, List[SubscriberInfo]] = {paper_id: [] for paper_id in paper_ids}
+        rows = db.query(*_SUBSCRIBER_COLUMNS).join(
+            Paper, Paper.id == Subscriber.paper_id
+        ).filter(*paper_criteria).order_by(Subscriber.id).all()
+        for row in rows:
+            if row.paper_id not in wanted:
+                continue
+            loaded[row.paper_id].append(SubscriberInfo(
+                id=row.id,
+                paper_id=row.paper_id,
+                email=row.email,
+                notify_on_review=bool(row.notify_on_review),
+                notify_on_review_modified=bool(row.notify_on_review_modified),
+                notify_on_decision=bool(row.notify_on_decision),
+                notified_review=bool(row.notified_review),
+                notified_decision=bool(row.notified_decision),
+                digest=bool(row.digest),
+                next_send_after=row.next_send_after,
+                quarantined=row.quarantined_at is not None,
+            ))
+        self._by_paper.update(loaded)
+        self._load_ledger(db, [sub.id for subs in loaded.values() for sub in subs])
+
+    def _load_ledger(self, db, subscriber_ids: List[int]) -> None:
+        for subscriber_id in subscriber_ids:
+            self._ledger.setdefault(subscriber_id, set())
+        for start in range(0, len(subscriber_ids), _UPDATE_CHUNK_SIZE):
+            chunk = subscriber_ids[start:start + _UPDATE_CHUNK_SIZE]
+            rows = db.query(NotificationLedger.subscriber_id, NotificationLedger.event_key).filter(
+                NotificationLedger.subscriber_id.in_(chunk)
+            ).all()
+            for subscriber_id, event_key in rows:
+                self._ledger[subscriber_id].add(event_key)
+
+    def notified(self, subscriber: SubscriberInfo, event_key: str) -> bool:
+        return event_key in self._ledger.get(subscriber.id, ())
+
+    def record(self, db, subscriber: SubscriberInfo, kind: str, event_key: str) -> bool:
+        """
+        Claim an event for a subscriber in the caller's transaction; False if it was already given.
+        - Concurrent writers of the same event collide on the ledger's unique index at commit
+        """
+        seen = self._ledger.setdefault(subscriber.id, set())
+        if event_key in seen:
+            return False
+        seen.add(event_key)
+        db.add(NotificationLedger(subscriber_id=subscriber.id, event_key=event_key, kind=kind))
+        flag = _EVENT_FLAGS.get(event_key)
+        if flag is not None:
+            self.mark(subscriber, flag)
+        return True
+
+    def for_paper(self, paper_id: int) -> List[SubscriberInfo]:
+        return self._by_paper.get(paper_id, [])
+
+    def mark(self, subscriber: SubscriberInfo, flag: str) -> None:
+        """Set a notified_* flag locally and queue it for the bulk update."""
+        if getattr(subscriber, flag):
+            return
+        setattr(subscriber, flag, True)
+        self._pending_flags[flag].add(subscriber.id)
+
+    def flush(self, db) -> None:
+        """Write buffered flag changes with one UPDATE per flag (chunked)."""
+        for flag, subscriber_ids in self._pending_flags.items():
+            ids = sorted(subscriber_ids)
+            for start in range(0, len(ids), _UPDATE_CHUNK_SIZE):
+                chunk = ids[start:start + _UPDATE_CHUNK_SIZE]
+                db.execute(
+                    update(Subscriber).where(Subscriber.id.in_(chunk)).values({flag: True})
+                )
+            if ids:
+                logger.info("Marked %d subscribers as %s", len(ids), flag)
+            subscriber_ids.clear()
@@ -0,0 +1,231 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+import logging
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import undefer
+
+from ..models import Paper, PaperEvent, Subscriber
+from .digest import queue_digest_item
+from .email import EmailService
+from .events import DECISION_POSTED, REVIEW_ADDED, REVIEW_MODIFIED, consume_events
+from .notifications import (
+    DECISION_EVENT, REVIEW_EVENT, SubscriberIndex, SubscriberInfo, owed_clause, review_modified_event_key
+)
+from .outbox import enqueue_email
+from .reviews import load_reviews
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATIONS_CONSUMER = "notifications"
+_PAPER_CHUNK_SIZE = 500
+
+
+def _send_review_modified_notifications(
+    db,
+    subscriber_index: SubscriberIndex,
+    paper: Paper,
+    email_service: EmailService,
+    modified_reviews: List[Dict[str, Any]],
+) -> int:
+    if not modified_reviews:
+        return 0
+
+    # Edits are not re-sent later, so only quarantined addresses are skipped
+    event_key = review_modified_event_key(modified_reviews)
+    subscribers = [
+        sub for sub in subscriber_index.for_paper(paper.id)
+        if sub.notify_on_review_modified
+        and not sub.quarantined
+        and not subscriber_index.notified(sub, event_key)
+    ]
+    if not subscribers:
+        return 0
+
+    rendered = None
+    summary = f"{len(modified_reviews)} review(s) modified"
+    for sub in subscribers:
+        subscriber_index.record(db, sub, "review_modified", event_key)
+        if sub.digest:
+            queue_digest_item(db, "review_modified", sub, paper, summary)
+            continue
+        if rendered is None:
+            rendered = email_service.build_review_modified_notification(
+                paper_title=paper.title,
+                paper_id=paper.openreview_id,
+                venue=paper.venue,
+                modified_reviews=modified_reviews,
+            )
+        enqueue_email(db, "review_modified", sub.email, rendered, paper_id=paper.id, subscriber_id=sub.id)
+    return len(subscribers)
+
+
+def _send_review_notifications(
+    db,
+    paper: Paper,
+    email_service: EmailService,
+    subscribers: List[SubscriberInfo],
+    subscriber_index: SubscriberIndex,
+    reviews: List[Dict[str, Any]],
+) -> None:
+    rendered = None
+    summary = f"{len(reviews)} review(s) available. Ratings: " + ", ".join(
+        str(review.get("rating", "N/A")) for review in reviews
+    )
+    for sub in subscribers:
+        subscriber_index.record(db, sub, "review", REVIEW_EVENT)
+        if sub.digest:
+            queue_digest_item(db, "review", sub, paper, summary)
+        else:
+            if rendered is None:
+                rendered = email_service.build_review_notification(
+                    paper_title=paper.title,
+                    paper_id=paper.openreview_id,
+                    venue=paper.venue,
+                    reviews=reviews,
+                )
+            enqueue_email(db, "review", sub.email, rendered, paper_id=paper.id, subscriber_id=sub.id)
+        logger.info("Queued review notification to %s for %s", sub.email, paper.openreview_id)
+
+
+def _send_decision_notifications(
+    db,
+    paper: Paper,
+    email_service: EmailService,
+    subscribers: List[SubscriberInfo],
+    subscriber_index: SubscriberIndex,
+    decision: Dict[str, Any],
+    reviews: List[Dict[str, Any]],
+) -> None:
+    rendered = None
+    summary = f"Decision: {decision.get('decision', 'Unknown')}"
+    for sub in subscribers:
+        subscriber_index.record(db, sub, "decision", DECISION_EVENT)
+        if sub.digest:
+            queue_digest_item(db, "decision", sub, paper, summary)
+        else:
+            if rendered is None:
+                rendered = email_service.build_decision_notification(
+                    paper_title=paper.title,
+                    paper_id=paper.openreview_id,
+                    venue=paper.venue,
+                    decision=decision.get("decision", "Unknown"),
+                    comment=decision.get("comment"),
+                    reviews=reviews,
+                )
+            enqueue_email(db, "decision", sub.email, rendered, paper_id=paper.id, subscriber_id=sub.id)
+        logger.info("Queued decision notification to %s for %s", sub.email, paper.openreview_id)
+
+
+class NotificationConsumer:
+    """
+    Turns paper events into queued notifications.
+    - review_modified events are sent as they are read, with the edited reviews from the event
+    - Review/decision notifications are owed state: every subscriber who opted in and has no ledger
+      entry yet is notified once the paper has reviews/a decision. Papers with review_added or
+      decision_posted events are evaluated, plus papers whose owed subscribers were skipped before
+      (back-off, admin reset)
+    - Events from silent syncs (notify=False) are skipped
+    """
+
+    def __init__(self, email_service: EmailService, now: datetime):
+        self.email_service = email_service
+        self.now = now
+        self.subscriber_index = SubscriberIndex()
+        self._owed_papers: Set[int] = set()
+        self.queued = 0  # Emails and digest items queued
+
+    def _papers(self, db, paper_ids: List[int]) -> Dict[int, Paper]:
+        criteria = (Paper.id.in_(paper_ids),)
+        papers = db.query(Paper).options(undefer(Paper.decision_data)).filter(*criteria).all()
+        self.subscriber_index.load(db, criteria, [paper.id for paper in papers])
+        return {paper.id: paper for paper in papers}
+
+    def handle(self, db, events: List[PaperEvent]) -> None:
+        events = [event for event in events if event.notify]
+        modified = [event for event in events if event.kind == REVIEW_MODIFIED]
+        self._owed_papers.update(
+            event.paper_id for event in events if event.kind in (REVIEW_ADDED, DECISION_POSTED)
+        )
+        if not modified:
+            return
+
+        papers = self._papers(db, sorted({event.paper_id for event in modified}))
+        for event in modified:
+            paper = papers.get(event.paper_id)
+            reviews = event.payload.get("reviews") if isinstance(event.payload, dict) else None
+            if paper is not None and isinstance(reviews, list):
+                self.queued += _send_review_modified_notifications(
+                    db, self.subscriber_index, paper, self.email_service, reviews
+                )
+
+    def _catch_up_papers(self, db) -> Set[int]:
+        """Papers with subscribers still owed a notification that can be mailed now."""
+        rows = db.query(Subscriber.paper_id).join(Paper, Paper.id == Subscriber.paper_id).filter(
+            Paper.paused_at.is_(None),
+            Subscriber.quarantined_at.is_(None),
+            or_(Subscriber.next_send_after.is_(None), Subscriber.next_send_after <= self.now),
+            or_(
+                and_(
+                    Subscriber.notify_on_review == True,
+                    Paper.review_count > 0,
+                    owed_clause(Subscriber.id, REVIEW_EVENT),
+                ),
+                and_(
+                    Subscriber.notify_on_decision == True,
+                    Paper.decision_hash.isnot(None),
+                    owed_clause(Subscriber.id, DECISION_EVENT),
+                ),
+            ),
+        ).distinct().all()
+        return {paper_id for (paper_id,) in rows}
+
+    def _owed(self, sub: SubscriberInfo, opted_in: bool, event_key: str) -> bool:
+        return opted_in and not self.subscriber_index.notified(sub, event_key) and not sub.backing_off(self.now)
+
+    def _send_owed(self, db, paper: Paper) -> None:
+        subscribers = self.subscriber_index.for_paper(paper.id)
+        review_subscribers = [sub for sub in subscribers if self._owed(sub, sub.notify_on_review, REVIEW_EVENT)]
+        decision = paper.decision_data if isinstance(paper.decision_data, dict) else None
+        decision_subscribers = [
+            sub for sub in subscribers if self._owed(sub, sub.notify_on_decision, DECISION_EVENT)
+        ] if decision else []
+        if not review_subscribers and not decision_subscribers:
+            return
+
+        reviews = load_reviews(db, paper.id)
+        if reviews and review_subscribers:
+            _send_review_notifications(
+                db, paper, self.email_service, review_subscribers, self.subscriber_index, reviews
+            )
+            self.queued += len(review_subscribers)
+        if decision_subscribers:
+            _send_decision_notifications(
+                db, paper, self.email_service, decision_subscribers, self.subscriber_index, decision, reviews
+            )
+            self.queued += len(decision_subscribers)
+
+    def send_owed(self, db) -> None:
+        paper_ids = sorted(self._owed_papers | self._catch_up_papers(db))
+        for start in range(0, len(paper_ids), _PAPER_CHUNK_SIZE):
+            papers = self._papers(db, paper_ids[start:start + _PAPER_CHUNK_SIZE])
+            for paper in papers.values():
+                try:
+                    with db.begin_nested():
+                        self._send_owed(db, paper)
+                except Exception as e:
+                    # Still owed, so retried by the next pass; one bad paper must not hold up the rest
+                    logger.error("Could not queue notifications for paper %s: %s", paper.openreview_id, e)
+        self._owed_papers.clear()
+
+
+def dispatch_notifications(db, email_service: EmailService, now: Optional[datetime] = None) -> int:
+    """
+    Run the notification consumer over new paper events; run by the scheduler's event consumer job.
+    Returns the number of emails and digest items queued.
+    """
+    consumer = NotificationConsumer(email_service, now or datetime.utcnow())
+    consume_events(db, NOTIFICATIONS_CONSUMER, consumer.handle)
+    consumer.send_owed(db)
+    consumer.subscriber_index.flush(db)
+    return consumer.queued
@@ -1,4 +1,3 @@
-import openreview
 from typing import Optional, Dict, List, Any
 import logging
 import re
@@ -11,6 +10,9 @@ class OpenReviewService:
 
     def __init__(self, username: Optional[str] = None, password: Optional[str] = None):
         """Initialize with optional credentials for private papers."""
+        # openreview-py is heavy to import; load it only when a client is needed.
+        import openreview
+
         if username and password:
             self.client = openreview.api.OpenReviewClient(
                 baseurl='https://api2.openreview.net',
@@ -0,0 +1,248 @@
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+import logging
+import random
+import secrets
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import undefer
+
+from ..config import get_settings
+from ..database import SessionLocal
+from ..models import OutboxMessage, Subscriber
+from .config_cache import get_cached_email_service
+from .email import EmailService, RenderedEmail
+
+logger = logging.getLogger(__name__)
+
+# A message stuck in "sending" longer than this is assumed lost with its worker and is retried.
+_CLAIM_LEASE_SECONDS = 300
+_MAX_ERROR_LENGTH = 2000
+
+
+def enqueue_email(
+    db,
+    kind: str,
+    to_email: str,
+    rendered: RenderedEmail,
+    paper_id: Optional[int] = None,
+    subscriber_id: Optional[int] = None,
+) -> OutboxMessage:
+    """Queue a rendered email in the caller's transaction; the dispatcher delivers it after commit."""
+    message = OutboxMessage(
+        kind=kind,
+        paper_id=paper_id,
+        subscriber_id=subscriber_id,
+        to_email=to_email,
+        subject=rendered.subject,
+        html=rendered.html,
+        render_key=rendered.key,
+        status="pending",
+        next_attempt_at=datetime.utcnow(),
+    )
+    db.add(message)
+    return message
+
+
+def retry_delay_seconds(attempts: int) -> float:
+    """Exponential backoff with jitter, so retries after an SMTP outage spread out."""
+    settings = get_settings()
+    delay = settings.outbox_retry_base_seconds * (2 ** max(0, attempts - 1))
+    delay *= random.uniform(0.8, 1.2)
+    return min(delay, settings.outbox_retry_max_seconds)
+
+
+def _due_clause(now: datetime):
+    return or_(
+        and_(OutboxMessage.status == "pending", OutboxMessage.next_attempt_at <= now),
+        and_(OutboxMessage.status == "sending", OutboxMessage.locked_until < now),
+    )
+
+
+def claim_due_messages(db, now: datetime, limit: int) -> List[Tuple[int, str, str]]:
+    """
+    Claim up to `limit` due messages as (id, to_email, claim token), committing the claim.
+    - Round-robin across papers: every paper's oldest message comes before any paper's second
+      (messages without a paper, such as digests, each count as their own paper)
+    - Conditional updates make sure concurrent dispatchers never claim the same message
+    - Every claim gets a new token; a claim that expired and was taken over by another dispatcher
+      can no longer be sent or released with the old one
+    """
+    paper_rank = func.row_number().over(
+        partition_by=func.coalesce(OutboxMessage.paper_id, -OutboxMessage.id),
+        order_by=(OutboxMessage.next_attempt_at, OutboxMessage.id),
+    ).label("paper_rank")
+    due = db.query(
+        OutboxMessage.id,
+        OutboxMessage.to_email,
+        OutboxMessage.next_attempt_at,
+        paper_rank,
+    ).filter(_due_clause(now)).subquery()
+    candidates = db.query(due.c.id, due.c.to_email).order_by(
+        due.c.paper_rank, due.c.next_attempt_at, due.c.id
+    ).limit(limit).all()
+
+    claimed = []
+    for message_id, to_email in candidates:
+        claim_token = secrets.token_hex(16)
+        updated = db.query(OutboxMessage).filter(
+            OutboxMessage.id == message_id,
+            _due_clause(now),
+        ).update(
+            {
+                OutboxMessage.status: "sending",
+                OutboxMessage.locked_until: now + timedelta(seconds=_CLAIM_LEASE_SECONDS),
+                OutboxMessage.claim_token: claim_token,
+            },
+            synchronize_session=False,
+        )
+        if updated:
+            claimed.append((message_id, to_email, claim_token))
+    db.commit()
+    return claimed
+
+
+def _claimed_clause(message_id: int, claim_token: str):
+    return and_(
+        OutboxMessage.id == message_id,
+        OutboxMessage.status == "sending",
+        OutboxMessage.claim_token == claim_token,
+    )
+
+
+def release_messages(db, claims: List[Tuple[int, str]]) -> None:
+    """Hand claimed but unsent messages, as (id, claim token), back to the queue (dispatcher shutdown)."""
+    if not claims:
+        return
+    for message_id, claim_token in claims:
+        db.query(OutboxMessage).filter(_claimed_clause(message_id, claim_token)).update(
+            {OutboxMessage.status: "pending", OutboxMessage.locked_until: None},
+            synchronize_session=False,
+        )
+    db.commit()
+
+
+def is_quarantined(db, email: str) -> bool:
+    return db.query(Subscriber.id).filter(
+        Subscriber.email == email,
+        Subscriber.quarantined_at.isnot(None),
+    ).first() is not None
+
+
+def record_send_success(db, email: str) -> None:
+    """Clear the failure streak of an address after a successful send."""
+    db.query(Subscriber).filter(
+        Subscriber.email == email,
+        or_(Subscriber.send_failures > 0, Subscriber.next_send_after.isnot(None)),
+    ).update(
+        {
+            Subscriber.send_failures: 0,
+            Subscriber.hard_failures: 0,
+            Subscriber.last_send_error: None,
+            Subscriber.next_send_after: None,
+        },
+        synchronize_session=False,
+    )
+
+
+def record_send_failure(db, email: str, error: str, permanent: bool, now: datetime) -> bool:
+    """
+    Record a refused send on every subscription of an address; returns True if it got quarantined.
+    - The address backs off exponentially: no new notifications are queued for it meanwhile
+    - SUBSCRIBER_QUARANTINE_HARD_FAILURES consecutive 5xx rejections quarantine it
+    """
+    threshold = get_settings().subscriber_quarantine_hard_failures
+    quarantined = False
+    for subscriber in db.query(Subscriber).filter(Subscriber.email == email).all():
+        subscriber.send_failures = (subscriber.send_failures or 0) + 1
+        if permanent:
+            subscriber.hard_failures = (subscriber.hard_failures or 0) + 1
+        subscriber.last_send_error = error[:_MAX_ERROR_LENGTH]
+        subscriber.next_send_after = now + timedelta(seconds=retry_delay_seconds(subscriber.send_failures))
+        if threshold > 0 and subscriber.hard_failures >= threshold and subscriber.quarantined_at is None:
+            subscriber.quarantined_at = now
+            quarantined = True
+    if quarantined:
+        logger.warning("Quarantined %s after %d permanent delivery failures", email, threshold)
+    return quarantined
+
+
+def _deliver(db, message: OutboxMessage, email_service: EmailService, now: datetime) -> bool:
+    message.attempts = (message.attempts or 0) + 1
+    message.locked_until = None
+    if is_quarantined(db, message.to_email):
+        message.status = "dead"
+        message.last_error = "Recipient address is quarantined"
+        logger.info("Dropped %s email %s to quarantined %s", message.kind, message.id, message.to_email)
+        return False
+
+    try:
+        email_service.send_rendered(message.to_email, RenderedEmail(message.subject, message.html, message.render_key))
+    except Exception as e:
+        message.last_error = str(e)[:_MAX_ERROR_LENGTH]
+        recipient_failure = getattr(e, "recipient_failure", None)
+        quarantined = False
+        if recipient_failure is not None:
+            quarantined = record_send_failure(
+                db, message.to_email, message.last_error, recipient_failure == "permanent", now
+            )
+        if quarantined or message.attempts >= get_settings().outbox_max_attempts:
+            message.status = "dead"
+            logger.error(
+                "Giving up on %s email %s to %s after %d attempts: %s",
+                message.kind,
+                message.id,
+                message.to_email,
+                message.attempts,
+                e,
+            )
+        else:
+            message.status = "pending"
+            message.next_attempt_at = now + timedelta(seconds=retry_delay_seconds(message.attempts))
+            logger.warning(
+                "Delivery of %s email %s to %s failed (attempt %d), retrying at %s: %s",
+                message.kind,
+                message.id,
+                message.to_email,
+                message.attempts,
+                message.next_attempt_at,
+                e,
+            )
+        return False
+
+    message.status = "sent"
+    message.sent_at = now
+    message.last_error = None
+    record_send_success(db, message.to_email)
+    logger.info("Sent %s email %s to %s", message.kind, message.id, message.to_email)
+    return True
+
+
+def deliver_message(message_id: int, claim_token: str) -> bool:
+    """
+    Send one claimed message and record the outcome; returns True if it was sent.
+    - The claim is renewed (and committed) just before sending; a message whose claim expired while
+      it waited in a dispatch lane and was claimed again elsewhere is left to the new claim
+    """
+    db = SessionLocal()
+    try:
+        now = datetime.utcnow()
+        renewed = db.query(OutboxMessage).filter(_claimed_clause(message_id, claim_token)).update(
+            {OutboxMessage.locked_until: now + timedelta(seconds=_CLAIM_LEASE_SECONDS)},
+            synchronize_session=False,
+        )
+        db.commit()
+        if not renewed:
+            logger.info("Skipping email %s: its claim expired and it was claimed again", message_id)
+            return False
+        message = db.query(OutboxMessage).options(undefer(OutboxMessage.html)).filter(
+            OutboxMessage.id == message_id
+        ).first()
+        sent = _deliver(db, message, get_cached_email_service(), now)
+        db.commit()
+        return sent
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
@@ -0,0 +1,94 @@
+"""
+In-process pub/sub of scheduler job progress (see jobs.py), streamed to the admin panel over SSE.
+- Jobs publish from scheduler threads; subscribers are asyncio request handlers
+- Every subscriber has a bounded buffer: when a client reads too slowly its oldest events are
+  dropped and a "dropped" event tells it how many, so a stalled client never holds more memory
+- A short history lets reconnecting clients resume with Last-Event-ID
+"""
+from collections import deque
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Deque, Dict, List, Optional, Set
+import asyncio
+import itertools
+
+_SUBSCRIBER_BUFFER_SIZE = 256
+_HISTORY_SIZE = 256
+
+
+@dataclass
+class ProgressEvent:
+    id: int
+    kind: str
+    data: Dict[str, Any]
+
+
+class ProgressSubscription:
+    """Bounded event buffer of one stream client."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, buffer_size: int):
+        self._loop = loop
+        self._lock = Lock()
+        self._buffer: Deque[ProgressEvent] = deque(maxlen=buffer_size)
+        self._dropped = 0
+        self._ready = asyncio.Event()
+
+    def push(self, event: ProgressEvent) -> None:
+        with self._lock:
+            if len(self._buffer) == self._buffer.maxlen:
+                self._dropped += 1
+            self._buffer.append(event)
+        try:
+            self._loop.call_soon_threadsafe(self._ready.set)
+        except RuntimeError:
+            pass  # Loop already closed; the subscription is removed when its request ends
+
+    async def next_batch(self, timeout: float) -> List[ProgressEvent]:
+        """Wait up to timeout for buffered events and take them all; [] on timeout."""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return []
+        with self._lock:
+            self._ready.clear()
+            events = list(self._buffer)
+            self._buffer.clear()
+            dropped, self._dropped = self._dropped, 0
+        if dropped:
+            events.insert(0, ProgressEvent(id=0, kind="dropped", data={"count": dropped}))
+        return events
+
+
+class ProgressBroker:
+    def __init__(self, buffer_size: int = _SUBSCRIBER_BUFFER_SIZE, history_size: int = _HISTORY_SIZE):
+        self._lock = Lock()
+        self._ids = itertools.count(1)
+        self._buffer_size = buffer_size
+        self._history: Deque[ProgressEvent] = deque(maxlen=history_size)
+        self._subscribers: Set[ProgressSubscription] = set()
+
+    def publish(self, kind: str, data: Dict[str, Any]) -> None:
+        with self._lock:
+            event = ProgressEvent(id=next(self._ids), kind=kind, data=data)
+            self._history.append(event)
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            subscription.push(event)
+
+    def subscribe(self, last_event_id: Optional[int] = None) -> ProgressSubscription:
+        """Must be called from the subscriber's event loop."""
+        subscription = ProgressSubscription(asyncio.get_running_loop(), self._buffer_size)
+        with self._lock:
+            if last_event_id is not None:
+                for event in self._history:
+                    if event.id > last_event_id:
+                        subscription.push(event)
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: ProgressSubscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+
+progress_broker = ProgressBroker()
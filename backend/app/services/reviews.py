@@ -0,0 +1,297 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from sqlalchemy import func
+from sqlalchemy.orm import undefer_group
+
+from ..models import Paper, Review, ReviewVersion
+from ..utils.fingerprint import REVIEW_NOTIFY_FIELDS, fingerprint
+
+logger = logging.getLogger(__name__)
+
+REVIEW_SCORE_FIELDS = ("rating", "confidence", "soundness", "presentation", "contribution")
+REVIEW_TEXT_FIELDS = ("summary", "strengths", "weaknesses")
+REVIEW_FIELDS = REVIEW_SCORE_FIELDS + REVIEW_TEXT_FIELDS
+# Every Nth version of a review stores all fields so timelines never replay long delta chains.
+_SNAPSHOT_INTERVAL = 10
+
+
+@dataclass
+class ReviewSyncResult:
+    """Outcome of reconciling fetched reviews with the stored review rows."""
+    previous_count: int = 0
+    added: List[Dict[str, Any]] = field(default_factory=list)
+    modified: List[Dict[str, Any]] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    @property
+    def count_changed(self) -> bool:
+        return bool(self.added or self.removed)
+
+
+def _parse_mdate(value: Any) -> Optional[int]:
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def review_content_hash(review: Dict[str, Any]) -> str:
+    """Fingerprint of the normalized review fields we store; formatting-only edits hash equal."""
+    return fingerprint(review, REVIEW_FIELDS)
+
+
+def review_notify_hash(review: Dict[str, Any]) -> str:
+    """Fingerprint of the review fields shown to subscribers."""
+    return fingerprint(review, REVIEW_NOTIFY_FIELDS)
+
+
+def review_to_dict(row: Review) -> Dict[str, Any]:
+    """Convert a review row into the dict shape produced by OpenReviewService."""
+    data: Dict[str, Any] = {"id": row.review_id}
+    for key in REVIEW_FIELDS:
+        data[key] = getattr(row, key)
+    data["mdate"] = row.mdate
+    return data
+
+
+def _apply_review_fields(row: Review, review: Dict[str, Any], content_hash: str) -> None:
+    for key in REVIEW_FIELDS:
+        setattr(row, key, review.get(key))
+    row.mdate = _parse_mdate(review.get("mdate"))
+    row.content_hash = content_hash
+
+
+def _review_fields(source: Any) -> Dict[str, Any]:
+    if isinstance(source, dict):
+        return {key: source.get(key) for key in REVIEW_FIELDS}
+    return {key: getattr(source, key) for key in REVIEW_FIELDS}
+
+
+def _is_snapshot_version(version: int) -> bool:
+    return (version - 1) % _SNAPSHOT_INTERVAL == 0
+
+
+def _record_version(
+    db,
+    paper_id: int,
+    review_id: str,
+    version: int,
+    mdate: Optional[int],
+    fields: Dict[str, Any],
+    delta: Dict[str, Any],
+    recorded_at: Optional[datetime] = None,
+    snapshot: bool = False,
+) -> None:
+    is_snapshot = snapshot or _is_snapshot_version(version)
+    db.add(ReviewVersion(
+        paper_id=paper_id,
+        review_id=review_id,
+        version=version,
+        mdate=mdate,
+        is_snapshot=is_snapshot,
+        changes=fields if is_snapshot else delta,
+        recorded_at=recorded_at or datetime.utcnow(),
+    ))
+
+
+def load_reviews(db, paper_id: int) -> List[Dict[str, Any]]:
+    """Load the stored reviews of a paper, including review text."""
+    rows = db.query(Review).options(undefer_group("review_text")).filter(
+        Review.paper_id == paper_id
+    ).order_by(Review.id).all()
+    return [review_to_dict(row) for row in rows]
+
+
+def _load_review_index(db, paper_id: int) -> Dict[str, Tuple[int, Optional[int], str]]:
+    """Map review_id -> (row id, mdate, content_hash) without touching review text."""
+    rows = db.query(Review.review_id, Review.id, Review.mdate, Review.content_hash).filter(
+        Review.paper_id == paper_id
+    ).all()
+    return {review_id: (row_id, mdate, content_hash) for review_id, row_id, mdate, content_hash in rows}
+
+
+def dump_review_history(db, paper_id: int) -> List[Dict[str, Any]]:
+    """The review_versions rows of a paper as plain dicts (for the paper archive)."""
+    versions = db.query(ReviewVersion).filter(
+        ReviewVersion.paper_id == paper_id
+    ).order_by(ReviewVersion.review_id, ReviewVersion.version).all()
+    return [
+        {
+            "review_id": entry.review_id,
+            "version": entry.version,
+            "mdate": entry.mdate,
+            "is_snapshot": entry.is_snapshot,
+            "changes": entry.changes,
+            "recorded_at": entry.recorded_at.isoformat() if entry.recorded_at else None,
+        }
+        for entry in versions
+    ]
+
+
+def restore_review_history(db, paper_id: int, history: List[Dict[str, Any]]) -> None:
+    """Insert review_versions rows produced by dump_review_history for a (new) paper id."""
+    for entry in history:
+        recorded_at = entry.get("recorded_at")
+        db.add(ReviewVersion(
+            paper_id=paper_id,
+            review_id=entry["review_id"],
+            version=entry["version"],
+            mdate=entry.get("mdate"),
+            is_snapshot=bool(entry.get("is_snapshot")),
+            changes=entry.get("changes") or {},
+            recorded_at=datetime.fromisoformat(recorded_at) if recorded_at else None,
+        ))
+
+
+def sync_reviews(
+    db, paper: Paper, reviews: List[Dict[str, Any]], record_history: bool = True
+) -> ReviewSyncResult:
+    """
+    Reconcile freshly fetched reviews with the reviews table.
+    - New review ids are inserted
+    - Rows are rewritten only when their content hash changed; mdate-only bumps update mdate
+    - A review counts as modified only when a field shown to subscribers changed; modified reviews
+      carry the history version they were stored as
+    - Reviews that disappeared from OpenReview are deleted; their history is kept, and a review that
+      comes back (hidden, then shown again) continues it with a full snapshot
+    - Every content change appends a version to the review history
+    - paper.review_count is kept equal to the number of stored rows
+    - record_history=False only stores the reviews (history restored separately, e.g. from an archive)
+    """
+    index = _load_review_index(db, paper.id)
+    result = ReviewSyncResult(previous_count=len(index))
+    seen = set()
+    changed_row_ids: Dict[int, Tuple[Dict[str, Any], str]] = {}
+    mdate_updates: Dict[int, Optional[int]] = {}
+    new_reviews: List[Tuple[str, Dict[str, Any], str, Optional[int]]] = []
+
+    for review in reviews:
+        rid = review.get("id")
+        if not rid or rid in seen:
+            continue
+        seen.add(rid)
+        content_hash = review_content_hash(review)
+        new_mdate = _parse_mdate(review.get("mdate"))
+
+        stored = index.get(rid)
+        if stored is None:
+            new_reviews.append((rid, review, content_hash, new_mdate))
+            continue
+
+        row_id, stored_mdate, stored_hash = stored
+        if stored_hash != content_hash:
+            changed_row_ids[row_id] = (review, content_hash)
+        elif stored_mdate != new_mdate:
+            mdate_updates[row_id] = new_mdate
+
+    if new_reviews:
+        previous_versions = dict(
+            db.query(ReviewVersion.review_id, func.max(ReviewVersion.version)).filter(
+                ReviewVersion.paper_id == paper.id,
+                ReviewVersion.review_id.in_([rid for rid, _, _, _ in new_reviews]),
+            ).group_by(ReviewVersion.review_id).all()
+        )
+        for rid, review, content_hash, new_mdate in new_reviews:
+            row = Review(paper_id=paper.id, review_id=rid)
+            _apply_review_fields(row, review, content_hash)
+            db.add(row)
+            if record_history:
+                fields = _review_fields(review)
+                version = previous_versions.get(rid, 0) + 1
+                _record_version(db, paper.id, rid, version, new_mdate, fields, fields, snapshot=True)
+            result.added.append(review)
+
+    if changed_row_ids:
+        rows = db.query(Review).options(undefer_group("review_text")).filter(
+            Review.id.in_(list(changed_row_ids))
+        ).all()
+        latest_versions = dict(
+            db.query(ReviewVersion.review_id, func.max(ReviewVersion.version)).filter(
+                ReviewVersion.paper_id == paper.id,
+                ReviewVersion.review_id.in_([row.review_id for row in rows]),
+            ).group_by(ReviewVersion.review_id).all()
+        )
+        for row in rows:
+            review, content_hash = changed_row_ids[row.id]
+            previous_fields = _review_fields(row)
+            new_fields = _review_fields(review)
+            delta = {
+                key: value for key, value in new_fields.items()
+                if previous_fields.get(key) != value
+            }
+            if delta:
+                version = latest_versions.get(row.review_id)
+                if version is None:
+                    # Reviews stored before history existed: keep their last known state as the base.
+                    version = 1
+                    _record_version(
+                        db, paper.id, row.review_id, version, row.mdate,
+                        previous_fields, previous_fields, recorded_at=row.updated_at,
+                    )
+                _record_version(
+                    db, paper.id, row.review_id, version + 1,
+                    _parse_mdate(review.get("mdate")), new_fields, delta,
+                )
+                if review_notify_hash(previous_fields) != review_notify_hash(new_fields):
+                    logger.info(
+                        "Detected modification for review %s (mdate %s -> %s)",
+                        row.review_id,
+                        row.mdate,
+                        review.get("mdate"),
+                    )
+                    result.modified.append({**review, "version": version + 1})
+            _apply_review_fields(row, review, content_hash)
+
+    for row_id, mdate in mdate_updates.items():
+        db.query(Review).filter(Review.id == row_id).update(
+            {"mdate": mdate},
+            synchronize_session=False,
+        )
+
+    removed = [rid for rid in index if rid not in seen]
+    if removed:
+        db.query(Review).filter(
+            Review.paper_id == paper.id,
+            Review.review_id.in_(removed),
+        ).delete(synchronize_session=False)
+        result.removed = removed
+
+    paper.review_count = len(seen)
+    return result
+
+
+def get_rating_timeline(db, paper_id: int) -> List[Dict[str, Any]]:
+    """Replay the review history of a paper into per-review rating/confidence points."""
+    versions = db.query(ReviewVersion).filter(
+        ReviewVersion.paper_id == paper_id
+    ).order_by(ReviewVersion.review_id, ReviewVersion.version).all()
+
+    timelines: Dict[str, List[Dict[str, Any]]] = {}
+    state: Dict[str, Any] = {}
+    current_review_id = None
+    for entry in versions:
+        if entry.review_id != current_review_id:
+            current_review_id = entry.review_id
+            state = {}
+        changes = entry.changes if isinstance(entry.changes, dict) else {}
+        if entry.is_snapshot:
+            state = dict(changes)
+        else:
+            state.update(changes)
+        timelines.setdefault(entry.review_id, []).append({
+            "version": entry.version,
+            "mdate": entry.mdate,
+            "recorded_at": entry.recorded_at,
+            "rating": state.get("rating"),
+            "confidence": state.get("confidence"),
+        })
+
+    return [
+        {"review_id": review_id, "points": points}
+        for review_id, points in timelines.items()
+    ]
@@ -1,18 +1,51 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from collections import defaultdict
-from threading import Lock
+from functools import partial
+from threading import Event, Lock
 from typing import Any, Callable, Dict, List, Optional, Tuple
 import logging
 import time
-from sqlalchemy import and_, or_
+from sqlalchemy import exists, func, or_
+from sqlalchemy.orm import aliased
 
+from ..config import get_settings
 from ..database import SessionLocal
-from ..models import Paper, Subscriber, Config
+from ..models import JobCheckpoint, Paper, SchedulerLease, Subscriber
 from .openreview import OpenReviewService
 from .email import EmailService
-from ..config import get_settings
+from .config_cache import get_cached_email_service, get_runtime_config
+from .reviews import load_reviews, sync_reviews
+from .notifications import DECISION_EVENT, REVIEW_EVENT, SubscriberIndex
+from .notifier import dispatch_notifications
+from .events import (
+    DECISION_POSTED, REVIEW_ADDED, REVIEW_MODIFIED, STATUS_CHANGED, append_event, prune_events, signal_new_events
+)
+from .lifecycle import apply_lifecycle_policies
+from .digest import flush_digests
+from .dispatch import start_dispatcher, stop_dispatcher, wake_dispatcher
+from .progress import progress_broker
+from .leader import LeaderLease
+from .jobs import (
+    Job,
+    JobCancelled,
+    add_job_total,
+    cancel_job,
+    fail_interrupted_jobs,
+    finish_job,
+    job_checkpoint,
+    job_event,
+    job_paper_done,
+    job_registry,
+    poll_cancel_request,
+    save_job_progress,
+    skip_job,
+    start_job,
+)
 from ..utils.crypto import decrypt_value
+from ..utils.fingerprint import decision_fingerprint
+from ..utils.rate_limit import RequestPacer
 
 logger = logging.getLogger(__name__)
 
@@ -20,73 +53,31 @@ scheduler = AsyncIOScheduler()
 _scheduler_run_lock = Lock()
 _SCHEDULER_TICK_MINUTES = 1
 _VENUE_PROBE_COUNT = 5
+# How long a synchronous single-paper check waits for a running job before giving up
+_MANUAL_CHECK_LOCK_TIMEOUT_SECONDS = 30.0
 _TERMINAL_STATUSES = {"accepted", "rejected"}
+_SILENT_SYNC_JOB = "sync_all_papers_status_silent"
+# Shared by concurrent OpenReview fetches; spaced by review_mod_request_gap_seconds
+_openreview_pacer = RequestPacer()
+_SCHEDULER_LEASE_NAME = "scheduler"
+# Every check job, scheduled or manual and in any worker process, holds this DB lock while it runs
+_check_run_lock = LeaderLease("check_run", get_settings().scheduler_lease_seconds, log_transitions=False)
+# How often a silent sync waiting for a chunk's fetches looks for a cancel request
+_FETCH_CANCEL_POLL_SECONDS = 1.0
 
 
 def get_email_service() -> EmailService:
-    """Get email service with current configuration."""
-    settings = get_settings()
-    db = SessionLocal()
-
-    try:
-        def get_config_value(key: str, default: str) -> str:
-            config = db.query(Config).filter(Config.key == key).first()
-            return config.value if config and config.value is not None else default
-
-        from_name = get_config_value("from_name", settings.from_name)
-        from_name = from_name.strip() if from_name else ""
-        if not from_name:
-            from_name = settings.from_name
-
-        return EmailService(
-            smtp_host=get_config_value("smtp_host", settings.smtp_host),
-            smtp_port=int(get_config_value("smtp_port", str(settings.smtp_port))),
-            smtp_user=get_config_value("smtp_user", settings.smtp_user),
-            smtp_password=decrypt_value(get_config_value("smtp_password", settings.smtp_password)),
-            from_email=get_config_value("from_email", settings.from_email),
-            from_name=from_name,
-        )
-    finally:
-        db.close()
-
-
-def _get_int_config(db, key: str, default: int) -> int:
-    config = db.query(Config).filter(Config.key == key).first()
-    if not config or config.value is None:
-        return max(1, default)
-    try:
-        return max(1, int(config.value))
-    except (TypeError, ValueError):
-        logger.warning("Invalid integer config for %s=%s, using default=%s", key, config.value, default)
-        return max(1, default)
-
-
-def _get_float_config(db, key: str, default: float, min_value: float = 0.0) -> float:
-    config = db.query(Config).filter(Config.key == key).first()
-    if not config or config.value is None:
-        return max(min_value, default)
-    try:
-        return max(min_value, float(config.value))
-    except (TypeError, ValueError):
-        logger.warning("Invalid float config for %s=%s, using default=%s", key, config.value, default)
-        return max(min_value, default)
+    """Get email service with current configuration (cached until the config changes)."""
+    return get_cached_email_service()
 
 
 def _get_runtime_intervals(db) -> Tuple[int, int, float]:
-    settings = get_settings()
-    decision_interval = _get_int_config(db, "check_interval", settings.check_interval)
-    review_mod_interval = _get_int_config(
-        db,
-        "review_mod_check_interval",
-        settings.review_mod_check_interval
-    )
-    review_mod_request_gap_seconds = _get_float_config(
-        db,
-        "review_mod_request_gap_seconds",
-        settings.review_mod_request_gap_seconds,
-        min_value=0.0,
+    config = get_runtime_config(db)
+    return (
+        config.check_interval,
+        config.review_mod_check_interval,
+        config.review_mod_request_gap_seconds,
     )
-    return decision_interval, review_mod_interval, review_mod_request_gap_seconds
 
 
 def _is_due(last_checked: Optional[datetime], interval_minutes: int, now: datetime) -> bool:
@@ -95,49 +86,8 @@ def _is_due(last_checked: Optional[datetime], interval_minutes: int, now: dateti
     return now - last_checked >= timedelta(minutes=interval_minutes)
 
 
-def _extract_reviews_from_cache(paper: Paper) -> List[Dict[str, Any]]:
-    stored_reviews_data = paper.review_data or {}
-    reviews = stored_reviews_data.get("reviews", [])
-    if not isinstance(reviews, list):
-        return []
-    return [r for r in reviews if isinstance(r, dict)]
-
-
-def _build_review_map(reviews: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
-    review_map: Dict[str, Dict[str, Any]] = {}
-    for review in reviews:
-        rid = review.get("id")
-        if rid:
-            review_map[rid] = review
-    return review_map
-
-
-def _detect_modified_reviews(
-    stored_reviews: List[Dict[str, Any]],
-    reviews: List[Dict[str, Any]]
-) -> List[Dict[str, Any]]:
-    stored_reviews_map = _build_review_map(stored_reviews)
-    modified_reviews: List[Dict[str, Any]] = []
-
-    for review in reviews:
-        rid = review.get("id")
-        if not rid or rid not in stored_reviews_map:
-            continue
-
-        stored_review = stored_reviews_map[rid]
-        stored_mdate = stored_review.get("mdate")
-        new_mdate = review.get("mdate")
-
-        # Modification detection is based on mdate change for the same review id.
-        if stored_mdate and new_mdate and stored_mdate != new_mdate:
-            logger.info("Detected modification for review %s: %s -> %s", rid, stored_mdate, new_mdate)
-            modified_reviews.append(review)
-
-    return modified_reviews
-
-
-def _build_cached_status_info(paper: Paper) -> Dict[str, Any]:
-    reviews = _extract_reviews_from_cache(paper)
+def _build_cached_status_info(db, paper: Paper) -> Dict[str, Any]:
+    reviews = load_reviews(db, paper.id)
     decision = paper.decision_data if isinstance(paper.decision_data, dict) else None
     status = paper.status or ""
     if not status:
@@ -157,130 +107,81 @@ def _build_cached_status_info(paper: Paper) -> Dict[str, Any]:
     }
 
 
-def _decision_signature(decision: Optional[Dict[str, Any]]) -> Tuple[Any, Any, Any]:
-    """Create a comparable signature for decision snapshots."""
-    if not isinstance(decision, dict):
-        return (None, None, None)
-    return (
-        decision.get("decision"),
-        decision.get("comment"),
-        decision.get("mdate"),
-    )
-
-
 def _is_terminal_status(status: Optional[str]) -> bool:
     if not status:
         return False
     return status in _TERMINAL_STATUSES
 
 
-def _send_review_modified_notifications(
-    db,
-    paper: Paper,
-    email_service: EmailService,
-    modified_reviews: List[Dict[str, Any]],
-) -> None:
-    if not modified_reviews:
-        return
+def _not_terminal_clause():
+    """SQL form of `not _is_terminal_status(Paper.status)`."""
+    return or_(Paper.status.is_(None), Paper.status.notin_(_TERMINAL_STATUSES))
 
-    subscribers = db.query(Subscriber).filter(
-        Subscriber.paper_id == paper.id,
-        Subscriber.notify_on_review_modified == True
-    ).all()
 
-    for sub in subscribers:
-        email_service.send_review_modified_notification(
-            to_email=sub.email,
-            paper_title=paper.title,
-            paper_id=paper.openreview_id,
-            venue=paper.venue,
-            modified_reviews=modified_reviews,
-        )
-
-
-def _send_review_notifications(
-    db,
-    paper: Paper,
-    email_service: EmailService,
-    reviews: List[Dict[str, Any]],
-) -> None:
-    if not reviews:
-        return
-
-    subscribers = db.query(Subscriber).filter(
-        Subscriber.paper_id == paper.id,
-        Subscriber.notify_on_review == True,
-        Subscriber.notified_review == False
-    ).all()
-
-    for sub in subscribers:
-        success = email_service.send_review_notification(
-            to_email=sub.email,
-            paper_title=paper.title,
-            paper_id=paper.openreview_id,
-            venue=paper.venue,
-            reviews=reviews,
-        )
-        if success:
-            sub.notified_review = True
-            logger.info("Notified %s about reviews for %s", sub.email, paper.openreview_id)
-
-
-def _send_decision_notifications(
-    db,
-    paper: Paper,
-    email_service: EmailService,
-    decision: Dict[str, Any],
-    reviews: List[Dict[str, Any]],
-) -> None:
-    if not decision:
-        return
+def _use_cached_snapshot(
+    paper: Paper, now: datetime, decision_interval_minutes: int, review_mod_interval_minutes: int, force: bool
+) -> bool:
+    """A paper fetched within the shorter check interval is re-checked from the stored snapshot."""
+    shared_interval_minutes = max(1, min(decision_interval_minutes, review_mod_interval_minutes))
+    return (
+        not force
+        and paper.last_checked is not None
+        and (now - paper.last_checked) < timedelta(minutes=shared_interval_minutes)
+    )
 
-    subscribers = db.query(Subscriber).filter(
-        Subscriber.paper_id == paper.id,
-        Subscriber.notify_on_decision == True,
-        Subscriber.notified_decision == False
-    ).all()
 
-    for sub in subscribers:
-        success = email_service.send_decision_notification(
-            to_email=sub.email,
-            paper_title=paper.title,
-            paper_id=paper.openreview_id,
-            venue=paper.venue,
-            decision=decision.get("decision", "Unknown"),
-            comment=decision.get("comment"),
-            reviews=reviews,
-        )
-        if success:
-            sub.notified_decision = True
-            logger.info("Notified %s about decision for %s", sub.email, paper.openreview_id)
+def _needs_fetch(
+    paper: Paper, now: datetime, decision_interval_minutes: int, review_mod_interval_minutes: int, force: bool
+) -> bool:
+    """Whether _check_single_paper with both check types enabled would fetch the paper from OpenReview."""
+    if force:
+        return True
+    if _is_terminal_status(paper.status):
+        return False
+    if not (
+        _is_due(paper.last_decision_checked, decision_interval_minutes, now)
+        or _is_due(paper.last_review_mod_checked, review_mod_interval_minutes, now)
+    ):
+        return False
+    return not _use_cached_snapshot(paper, now, decision_interval_minutes, review_mod_interval_minutes, force)
 
 
 def _mark_existing_notifications_as_sent(
     db,
+    subscriber_index: SubscriberIndex,
     paper: Paper,
     reviews: List[Dict[str, Any]],
     decision: Optional[Dict[str, Any]],
 ) -> None:
-    """Update subscriber flags so historical data will not trigger delayed notifications."""
+    """Record historical events in the ledger so they will not trigger delayed notifications."""
     has_reviews = bool(reviews)
     has_decision = bool(decision)
     if not has_reviews and not has_decision:
         return
 
-    subscribers = db.query(Subscriber).filter(Subscriber.paper_id == paper.id).all()
-    for sub in subscribers:
-        if has_reviews and sub.notify_on_review and not sub.notified_review:
-            sub.notified_review = True
-        if has_decision and sub.notify_on_decision and not sub.notified_decision:
-            sub.notified_decision = True
+    for sub in subscriber_index.for_paper(paper.id):
+        if has_reviews and sub.notify_on_review:
+            subscriber_index.record(db, sub, "review", REVIEW_EVENT)
+        if has_decision and sub.notify_on_decision:
+            subscriber_index.record(db, sub, "decision", DECISION_EVENT)
+
+
+def _fetch_paper_status(
+    openreview_id: str,
+    encrypted_username: Optional[str],
+    encrypted_password: Optional[str],
+) -> Dict[str, Any]:
+    """Fetch a paper's status from OpenReview; takes plain values so it can run in a worker thread."""
+    service = OpenReviewService(
+        username=decrypt_value(encrypted_username),
+        password=decrypt_value(encrypted_password)
+    )
+    return service.check_paper_status(openreview_id, suppress_errors=False)
 
 
 def _check_single_paper(
     db,
     paper: Paper,
-    email_service: EmailService,
     now: datetime,
     decision_interval_minutes: int,
     review_mod_interval_minutes: int,
@@ -288,14 +189,26 @@ def _check_single_paper(
     run_review_mod_checks: bool,
     force: bool = False,
     send_notifications: bool = True,
-    mark_existing_notifications_as_sent: bool = False,
+    subscriber_index: Optional[SubscriberIndex] = None,
+    prefetched: Optional["Future[Dict[str, Any]]"] = None,
 ) -> Tuple[bool, bool, bool]:
     """
-    Check a single paper according to enabled check types.
+    Check a single paper according to enabled check types and append what changed to paper_events.
+    - With send_notifications=False the events are marked silent and, when subscriber_index is
+      given, existing reviews/decisions are recorded as already notified
+    - prefetched: the paper's status fetched concurrently by the caller, used instead of fetching here;
+      otherwise the caller's pending changes are committed before the request
     Returns (has_decision, fetched_from_openreview, state_changed).
+    Raises JobCancelled before touching the paper when the current job was cancelled.
+    The paper's writes run in a savepoint, so a failing paper leaves nothing behind for the
+    caller's next commit.
     """
+    job_checkpoint(paper.openreview_id)
+    started = time.monotonic()
+    savepoint = None
     try:
         if not force and _is_terminal_status(paper.status):
+            job_event("paper_skipped", paper_id=paper.id, openreview_id=paper.openreview_id, reason="terminal")
             return True, False, False
 
         should_run_decision = run_decision_checks and (
@@ -306,44 +219,43 @@ def _check_single_paper(
         )
 
         if not should_run_decision and not should_run_review_mod:
-            has_decision = bool(paper.decision_data) or (paper.status in {"accepted", "rejected", "decided"})
+            # Counted only: most papers are not due on a given tick
+            job_event("paper_skipped", publish=False)
+            has_decision = paper.decision_hash is not None or (paper.status in {"accepted", "rejected", "decided"})
             return has_decision, False, False
 
-        shared_interval_minutes = max(1, min(decision_interval_minutes, review_mod_interval_minutes))
-        use_cached_snapshot = (
-            not force
-            and paper.last_checked is not None
-            and (now - paper.last_checked) < timedelta(minutes=shared_interval_minutes)
+        use_cached_snapshot = _use_cached_snapshot(
+            paper, now, decision_interval_minutes, review_mod_interval_minutes, force
         )
 
         status_info: Dict[str, Any]
         fetched_from_openreview = False
         state_changed = False
         previous_status = paper.status or "pending"
-        previous_reviews = _extract_reviews_from_cache(paper)
-        previous_review_count = len(previous_reviews)
-        previous_decision = paper.decision_data if isinstance(paper.decision_data, dict) else None
 
         if use_cached_snapshot:
-            status_info = _build_cached_status_info(paper)
+            status_info = _build_cached_status_info(db, paper)
             logger.info(
                 "Using cached status for paper %s (last_checked=%s)",
                 paper.openreview_id,
                 paper.last_checked,
             )
+            job_event("paper_skipped", paper_id=paper.id, openreview_id=paper.openreview_id, reason="cached")
+            savepoint = db.begin_nested()
         else:
             logger.info("Checking paper: %s (Submission #%s)", paper.openreview_id, paper.submission_number)
-            stored_reviews = _extract_reviews_from_cache(paper)
 
-            service = OpenReviewService(
-                username=decrypt_value(paper.openreview_username),
-                password=decrypt_value(paper.openreview_password)
-            )
-            status_info = service.check_paper_status(
-                paper.openreview_id,
-                suppress_errors=False
-            )
+            if prefetched is not None:
+                status_info = prefetched.result()
+            else:
+                # Never hold SQLite's write lock across an OpenReview request (lease heartbeats and
+                # API writes would fail with "database is locked")
+                _commit_check_work(db)
+                status_info = _fetch_paper_status(
+                    paper.openreview_id, paper.openreview_username, paper.openreview_password
+                )
             fetched_from_openreview = True
+            savepoint = db.begin_nested()
 
             reviews = status_info.get("reviews", [])
             if not isinstance(reviews, list):
@@ -352,23 +264,45 @@ def _check_single_paper(
             if not isinstance(decision, dict):
                 decision = None
 
-            modified_reviews = _detect_modified_reviews(stored_reviews, reviews)
-            if send_notifications and run_review_mod_checks:
-                _send_review_modified_notifications(db, paper, email_service, modified_reviews)
+            review_sync = sync_reviews(db, paper, reviews)
+            modified_reviews = review_sync.modified
+            if review_sync.added:
+                append_event(db, paper, REVIEW_ADDED, {
+                    "review_ids": [str(review.get("id")) for review in review_sync.added],
+                    "review_count": paper.review_count,
+                }, notify=send_notifications)
+            if modified_reviews:
+                append_event(db, paper, REVIEW_MODIFIED, {"reviews": modified_reviews}, notify=send_notifications)
 
             paper.last_checked = now
-            paper.review_data = {"reviews": reviews, "review_count": len(reviews)}
-            if decision:
+            new_decision_hash = decision_fingerprint(decision)
+            previous_decision_hash = paper.decision_hash
+            if previous_decision_hash is None and paper.decision_data is not None:
+                # Papers stored before decision_hash existed load the blob once to backfill it.
+                previous_decision_hash = decision_fingerprint(paper.decision_data)
+            decision_changed = previous_decision_hash != new_decision_hash
+            if decision and (decision_changed or paper.decision_hash is None):
                 paper.decision_data = decision
+                paper.decision_hash = new_decision_hash
+            if decision and decision_changed:
+                append_event(db, paper, DECISION_POSTED, {
+                    "decision": decision.get("decision"),
+                }, notify=send_notifications)
             new_status = status_info.get("status", previous_status)
-            decision_changed = _decision_signature(previous_decision) != _decision_signature(decision)
+            if new_status != previous_status:
+                append_event(db, paper, STATUS_CHANGED, {
+                    "from": previous_status,
+                    "to": new_status,
+                }, notify=send_notifications)
             state_changed = (
                 new_status != previous_status
-                or len(reviews) != previous_review_count
+                or review_sync.count_changed
                 or decision_changed
                 or bool(modified_reviews)
             )
             paper.status = new_status
+            if state_changed:
+                paper.last_changed_at = now
 
         reviews = status_info.get("reviews", [])
         if not isinstance(reviews, list):
@@ -378,33 +312,51 @@ def _check_single_paper(
             decision = None
         has_decision = bool(status_info.get("has_decision", False) and decision)
 
-        if mark_existing_notifications_as_sent:
-            _mark_existing_notifications_as_sent(db, paper, reviews, decision)
+        if subscriber_index is not None and not send_notifications:
+            _mark_existing_notifications_as_sent(db, subscriber_index, paper, reviews, decision)
 
         if should_run_decision:
-            if send_notifications:
-                _send_review_notifications(db, paper, email_service, reviews)
-                if has_decision:
-                    _send_decision_notifications(db, paper, email_service, decision, reviews)
             paper.last_decision_checked = now
 
         if should_run_review_mod:
             paper.last_review_mod_checked = now
 
+        savepoint.commit()
         if fetched_from_openreview:
             logger.info("Paper %s updated: status=%s", paper.openreview_id, paper.status)
-
-        db.flush()
+            job_event(
+                "paper_fetched",
+                paper_id=paper.id,
+                openreview_id=paper.openreview_id,
+                status=paper.status,
+                changed=state_changed,
+                duration_ms=round((time.monotonic() - started) * 1000),
+            )
+            if state_changed:
+                # Counted for clients following the job from another worker (RemoteJobWatcher)
+                job_event("paper_changed", publish=False)
         return has_decision, fetched_from_openreview, state_changed
 
+    except CheckRunLockLost:
+        raise
     except Exception as e:
+        if savepoint is not None and savepoint.is_active:
+            savepoint.rollback()
         logger.error("Error checking paper %s: %s", paper.openreview_id, e)
+        job_event(
+            "paper_failed",
+            paper_id=paper.id,
+            openreview_id=paper.openreview_id,
+            error=str(e),
+            duration_ms=round((time.monotonic() - started) * 1000),
+        )
         return False, False, False
+    finally:
+        job_paper_done()
 
 
 def _check_decisions_smart_impl(
     db,
-    email_service: EmailService,
     now: datetime,
     decision_interval_minutes: int,
     review_mod_interval_minutes: int,
@@ -418,30 +370,15 @@ def _check_decisions_smart_impl(
     - If none of the probe papers changed, skip the rest
     - If any probe paper changed, continue checking the rest
     """
-    notification_pending_ids = db.query(Paper.id).join(
-        Subscriber, Subscriber.paper_id == Paper.id
-    ).filter(
-        or_(
-            and_(
-                Subscriber.notify_on_review == True,
-                Subscriber.notified_review == False,
-            ),
-            and_(
-                Subscriber.notify_on_decision == True,
-                Subscriber.notified_decision == False,
-            ),
-        )
-    ).distinct().subquery()
-
     papers = db.query(Paper).filter(
+        Paper.paused_at.is_(None),
+        _not_terminal_clause(),
         or_(
             Paper.status.in_(["pending", "reviewed"]),
             Paper.status.is_(None),
             Paper.status == "",
-            Paper.id.in_(notification_pending_ids.select()),
-        )
+        ),
     ).all()
-    papers = [paper for paper in papers if not _is_terminal_status(paper.status)]
 
     logger.info("Decision check: found %d papers to evaluate", len(papers))
 
@@ -459,13 +396,13 @@ def _check_decisions_smart_impl(
         logger.info("Decision check venue: %s (%d papers)", venue, len(venue_paper_list))
         top_papers = venue_paper_list[:_VENUE_PROBE_COUNT]
         remaining_papers = venue_paper_list[_VENUE_PROBE_COUNT:]
+        add_job_total(len(top_papers))
 
         any_probe_changed = False
         for paper in top_papers:
             _, _, state_changed = _check_single_paper(
                 db=db,
                 paper=paper,
-                email_service=email_service,
                 now=now,
                 decision_interval_minutes=decision_interval_minutes,
                 review_mod_interval_minutes=review_mod_interval_minutes,
@@ -482,11 +419,11 @@ def _check_decisions_smart_impl(
                 venue,
                 len(remaining_papers),
             )
+            add_job_total(len(remaining_papers))
             for paper in remaining_papers:
                 _check_single_paper(
                     db=db,
                     paper=paper,
-                    email_service=email_service,
                     now=now,
                     decision_interval_minutes=decision_interval_minutes,
                     review_mod_interval_minutes=review_mod_interval_minutes,
@@ -505,7 +442,6 @@ def _check_decisions_smart_impl(
 
 def _check_review_modifications_all_impl(
     db,
-    email_service: EmailService,
     now: datetime,
     decision_interval_minutes: int,
     review_mod_interval_minutes: int,
@@ -515,42 +451,35 @@ def _check_review_modifications_all_impl(
     """
     Full review-modification monitor:
     - Targets papers that have at least one subscriber with review-mod notifications enabled
-    - Only checks papers that are already reviewed (status or cached reviews)
+    - Only checks papers that are already reviewed (status or stored reviews)
     - Applies full status sync and modified review detection
     """
-    candidates = db.query(Paper).join(
-        Subscriber, Subscriber.paper_id == Paper.id
-    ).filter(
-        Subscriber.notify_on_review_modified == True
-    ).distinct().all()
-
-    reviewed_statuses = {"reviewed", "decided"}
-    papers = [
-        paper for paper in candidates
-        if (
-            (not _is_terminal_status(paper.status))
-            and ((paper.status in reviewed_statuses) or bool(_extract_reviews_from_cache(paper)))
-        )
-    ]
-
-    papers.sort(key=lambda p: (
-        p.venue or "",
-        p.submission_number is None,
-        p.submission_number or 0,
-        p.id,
-    ))
+    watcher = aliased(Subscriber)
+    papers = db.query(Paper).filter(
+        Paper.paused_at.is_(None),
+        exists().where(
+            watcher.paper_id == Paper.id,
+            watcher.notify_on_review_modified == True,
+        ),
+        _not_terminal_clause(),
+        or_(
+            Paper.status.in_(["reviewed", "decided"]),
+            Paper.review_count > 0,
+        ),
+    ).order_by(
+        func.coalesce(Paper.venue, ""),
+        Paper.submission_number.is_(None),
+        func.coalesce(Paper.submission_number, 0),
+        Paper.id,
+    ).all()
 
-    logger.info(
-        "Review-mod check: found %d subscribed papers, %d review-ready papers to evaluate",
-        len(candidates),
-        len(papers),
-    )
+    logger.info("Review-mod check: found %d review-ready subscribed papers to evaluate", len(papers))
+    add_job_total(len(papers))
 
     for idx, paper in enumerate(papers):
         _, fetched_from_openreview, _ = _check_single_paper(
             db=db,
             paper=paper,
-            email_service=email_service,
             now=now,
             decision_interval_minutes=decision_interval_minutes,
             review_mod_interval_minutes=review_mod_interval_minutes,
@@ -565,54 +494,297 @@ def _check_review_modifications_all_impl(
 
 def _sync_all_papers_status_silent_impl(
     db,
-    email_service: EmailService,
     now: datetime,
     decision_interval_minutes: int,
     review_mod_interval_minutes: int,
     review_mod_request_gap_seconds: float,
     force: bool = True,
+    resume: bool = False,
 ) -> None:
     """
-    Full status synchronization without sending notifications.
-    - Scans all papers
-    - Refreshes status/review/decision cache
+    Full status synchronization without sending notifications, as a resumable bulk job.
+    - Scans all papers that are not paused in id order, SILENT_SYNC_CHUNK_SIZE papers per chunk
+    - Fetches a chunk with SILENT_SYNC_CONCURRENCY workers whose request starts share one pacer,
+      then applies the results in this session; with force=False only papers that are due are fetched
+    - Cancellation is checked while the chunk is fetched and before each paper is applied
+    - Commits every chunk together with its job_checkpoints row, stamped with this worker's check_run
+      holder; resume=True continues after the last committed chunk of an interrupted sync (and does
+      nothing if that sync has finished meanwhile)
+    - Papers whose check failed are kept in the checkpoint and retried first when the sync is resumed
+    - Refreshes status/review/decision cache; the events it appends are marked silent
     - Marks existing review/decision notifications as already handled
     """
-    papers = db.query(Paper).order_by(Paper.id).all()
-    logger.info("Silent sync: found %d papers to evaluate", len(papers))
-
-    for idx, paper in enumerate(papers):
-        _, fetched_from_openreview, _ = _check_single_paper(
-            db=db,
-            paper=paper,
-            email_service=email_service,
-            now=now,
-            decision_interval_minutes=decision_interval_minutes,
-            review_mod_interval_minutes=review_mod_interval_minutes,
-            run_decision_checks=True,
-            run_review_mod_checks=True,
-            force=force,
-            send_notifications=False,
-            mark_existing_notifications_as_sent=True,
+    settings = get_settings()
+    chunk_size = max(1, settings.silent_sync_chunk_size)
+    checkpoint = db.get(JobCheckpoint, _SILENT_SYNC_JOB)
+    if resume and checkpoint is None:
+        logger.info("Silent sync: nothing to resume")
+        return
+    if resume:
+        force = checkpoint.force
+        logger.info(
+            "Silent sync: resuming after paper id %d (%d papers done, %d failed, left by %s)",
+            checkpoint.position,
+            checkpoint.processed,
+            len(checkpoint.failed or []),
+            checkpoint.holder,
         )
-        has_more = idx < len(papers) - 1
-        if fetched_from_openreview and has_more and review_mod_request_gap_seconds > 0:
-            time.sleep(review_mod_request_gap_seconds)
+    else:
+        if checkpoint is None:
+            checkpoint = JobCheckpoint(job=_SILENT_SYNC_JOB)
+            db.add(checkpoint)
+        checkpoint.position = 0
+        checkpoint.processed = 0
+        checkpoint.failed = []
+        checkpoint.force = force
+        checkpoint.started_at = now
+    checkpoint.holder = _check_run_lock.holder
+    _commit_check_work(db)
+
+    criteria = (Paper.paused_at.is_(None),)
+    retry_ids = list(checkpoint.failed or [])
+    remaining = db.query(func.count(Paper.id)).filter(*criteria, Paper.id > checkpoint.position).scalar()
+    logger.info("Silent sync: found %d papers to evaluate, %d to retry", remaining, len(retry_ids))
+    add_job_total(remaining + len(retry_ids))
+
+    _openreview_pacer.interval_seconds = review_mod_request_gap_seconds
+    cancelled = Event()
+
+    def _paced_fetch(*args) -> Dict[str, Any]:
+        _openreview_pacer.wait()
+        if cancelled.is_set():
+            raise JobCancelled()
+        return _fetch_paper_status(*args)
+
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, settings.silent_sync_concurrency), thread_name_prefix="silent-sync"
+    )
+    try:
+        while True:
+            retrying = retry_ids[:chunk_size]
+            if retrying:
+                # Papers that failed before the sync was interrupted, retried before moving on
+                retry_ids = retry_ids[chunk_size:]
+                papers = db.query(Paper).filter(*criteria, Paper.id.in_(retrying)).order_by(Paper.id).all()
+            else:
+                papers = db.query(Paper).filter(
+                    *criteria, Paper.id > checkpoint.position
+                ).order_by(Paper.id).limit(chunk_size).all()
+                if not papers:
+                    break
+
+            paper_ids = [paper.id for paper in papers]
+            subscriber_index = SubscriberIndex()
+            subscriber_index.load(db, criteria + (Paper.id.in_(paper_ids),), paper_ids)
+            fetches = {
+                paper.id: executor.submit(
+                    _paced_fetch, paper.openreview_id, paper.openreview_username, paper.openreview_password
+                )
+                for paper in papers
+                if _needs_fetch(paper, now, decision_interval_minutes, review_mod_interval_minutes, force)
+            }
+            failed: List[int] = []
+            try:
+                # Apply the chunk only once all of it is fetched, so its write transaction is short
+                pending = set(fetches.values())
+                while pending:
+                    job_checkpoint()
+                    _, pending = wait(pending, timeout=_FETCH_CANCEL_POLL_SECONDS)
+                for paper in papers:
+                    _, fetched, _ = _check_single_paper(
+                        db=db,
+                        paper=paper,
+                        now=now,
+                        decision_interval_minutes=decision_interval_minutes,
+                        review_mod_interval_minutes=review_mod_interval_minutes,
+                        run_decision_checks=True,
+                        run_review_mod_checks=True,
+                        force=force,
+                        send_notifications=False,
+                        subscriber_index=subscriber_index,
+                        prefetched=fetches.get(paper.id),
+                    )
+                    if paper.id in fetches and not fetched:
+                        failed.append(paper.id)
+            except JobCancelled:
+                # A cancelled sync keeps what it synced, including the papers marked as notified,
+                # and is not resumed
+                cancelled.set()
+                subscriber_index.flush(db)
+                db.delete(checkpoint)
+                raise
+
+            subscriber_index.flush(db)
+            # A new list, so the JSON column is written
+            checkpoint.failed = [paper_id for paper_id in checkpoint.failed or [] if paper_id not in retrying] + failed
+            if not retrying:
+                checkpoint.position = paper_ids[-1]
+                checkpoint.processed += len(papers)
+            checkpoint.holder = _check_run_lock.holder
+            _commit_check_work(db)
+            signal_new_events()
+            job_event(
+                "chunk_committed",
+                position=checkpoint.position,
+                processed=checkpoint.processed,
+                failed=len(checkpoint.failed),
+            )
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    logger.info(
+        "Silent sync: finished after %d papers (%d failed)", checkpoint.processed, len(checkpoint.failed or [])
+    )
+    db.delete(checkpoint)
+
+
+_consumer_run_lock = Lock()
+
+
+def run_event_consumers() -> None:
+    """
+    Consumers of paper_events (notification dispatch, digest flush, pruning) as their own job.
+    - Scheduled every EVENT_CONSUMER_INTERVAL_SECONDS in the scheduler lease holder, in its own session,
+      so notifications go out while a long check sweep is still running
+    - A failing pass is rolled back and logged; consume_events skips events that keep failing
+    """
+    if not _consumer_run_lock.acquire(blocking=False):
+        return
+    db = SessionLocal()
+    try:
+        email_service = get_email_service()
+        now = datetime.utcnow()
+        queued = dispatch_notifications(db, email_service, now)
+        digests = flush_digests(db, email_service, now)
+        prune_events(db, now)
+        db.commit()
+        if queued or digests:
+            wake_dispatcher()
+            progress_broker.publish("notifications_queued", {"count": queued, "digests": digests})
+    except Exception as e:
+        logger.error("Error in paper event consumers: %s", e)
+        db.rollback()
+    finally:
+        db.close()
+        _consumer_run_lock.release()
+
+
+def run_event_consumers_if_leader() -> None:
+    """Scheduled: only the process holding the scheduler lease consumes paper events."""
+    if scheduler_lease.is_leader:
+        run_event_consumers()
+
+
+def _selected_papers_runner(paper_ids: Optional[List[int]] = None, venue: Optional[str] = None):
+    """Runner that force-checks the given papers (or every paper of a venue), paced like the full sweeps."""
+    def _run(
+        db,
+        now,
+        decision_interval,
+        review_mod_interval,
+        review_mod_request_gap_seconds,
+        run_force,
+    ):
+        query = db.query(Paper)
+        if paper_ids is not None:
+            query = query.filter(Paper.id.in_(paper_ids))
+        if venue is not None:
+            query = query.filter(Paper.venue == venue)
+        papers = query.order_by(Paper.id).all()
+        logger.info("Manual check: %d papers", len(papers))
+        add_job_total(len(papers))
+
+        for idx, paper in enumerate(papers):
+            _, fetched_from_openreview, _ = _check_single_paper(
+                db=db,
+                paper=paper,
+                now=now,
+                decision_interval_minutes=decision_interval,
+                review_mod_interval_minutes=review_mod_interval,
+                run_decision_checks=True,
+                run_review_mod_checks=True,
+                force=run_force,
+            )
+            has_more = idx < len(papers) - 1
+            if fetched_from_openreview and has_more and review_mod_request_gap_seconds > 0:
+                time.sleep(review_mod_request_gap_seconds)
+
+    return _run
+
+
+def _acquire_run_locks(lock_timeout: Optional[float]) -> bool:
+    """Take the in-process lock, then the cross-process check_run lock within the same timeout."""
+    deadline = None if lock_timeout is None else time.monotonic() + lock_timeout
+    if lock_timeout is None:
+        acquired = _scheduler_run_lock.acquire()
+    elif lock_timeout > 0:
+        acquired = _scheduler_run_lock.acquire(timeout=lock_timeout)
+    else:
+        acquired = _scheduler_run_lock.acquire(blocking=False)
+    if not acquired:
+        return False
+    if _check_run_lock.acquire(None if deadline is None else max(0.0, deadline - time.monotonic())):
+        return True
+    _scheduler_run_lock.release()
+    return False
+
+
+def _release_run_locks() -> None:
+    _check_run_lock.stop()
+    _scheduler_run_lock.release()
+
+
+class CheckRunLockLost(RuntimeError):
+    """The check_run lease lapsed mid-job (e.g. its heartbeats failed); another worker may be running a job."""
+
+
+def _commit_check_work(db) -> None:
+    """Commit a check job's work (with its progress) only while this process still holds the check_run lock."""
+    if not _check_run_lock.is_leader:
+        db.rollback()
+        raise CheckRunLockLost("Lost the check_run lock; stopped so two check jobs never write at once")
+    save_job_progress(db)
+    db.commit()
 
 
 def _run_check_job(
     job_name: str,
-    runner: Callable[[Any, EmailService, datetime, int, int, float, bool], None],
+    runner: Callable[[Any, datetime, int, int, float, bool], None],
     force: bool = False,
-) -> None:
-    if not _scheduler_run_lock.acquire(blocking=False):
+    job_id: Optional[str] = None,
+    lock_timeout: Optional[float] = 0.0,
+) -> Optional[Job]:
+    """
+    Run a check job under the scheduler locks (this process and the DB-wide check_run lock) and return its Job.
+    - job_id: a job registered as queued when it was requested; it does not run if cancelled meanwhile
+    - lock_timeout: seconds to wait for a running job (0 skips at once, None waits indefinitely);
+      returns None when the job was skipped
+    - Papers are committed as they are checked (before each OpenReview request), so an error only
+      rolls back the paper in progress
+    - A job cancelled while running stops before its next paper and commits the papers checked so far
+    - Every commit first checks that the check_run lock is still held; a job whose lock lapsed fails
+      without committing the paper in progress (CheckRunLockLost)
+    """
+    if not _acquire_run_locks(lock_timeout):
         logger.info("Skipping %s because another check job is already running", job_name)
-        return
-
-    db = SessionLocal()
+        if job_id is not None:
+            skip_job(job_id, "Another check job is already running")
+        return None
+
+    queued = job_registry.get(job_id) if job_id is not None else None
+    if queued is not None and poll_cancel_request(queued):
+        cancel_job(queued.job_id)  # The request may have come from another worker
+        _release_run_locks()
+        logger.info("Skipping %s because it was cancelled before it started", job_name)
+        return None
+
+    job = start_job(job_name, job_id=job_id, force=force)
+    fail_interrupted_jobs(job)
+    error = None
+    cancelled = False
+    db = SessionLocal(expire_on_commit=False)  # Commits per paper; the loaded papers stay usable
     try:
         decision_interval, review_mod_interval, review_mod_request_gap_seconds = _get_runtime_intervals(db)
-        email_service = get_email_service()
         now = datetime.utcnow()
         logger.info(
             "Starting %s (decision_interval=%sm, review_mod_interval=%sm, review_mod_gap=%ss, force=%s)",
@@ -622,23 +794,30 @@ def _run_check_job(
             review_mod_request_gap_seconds,
             force,
         )
-        runner(
-            db,
-            email_service,
-            now,
-            decision_interval,
-            review_mod_interval,
-            review_mod_request_gap_seconds,
-            force,
-        )
-        db.commit()
+        try:
+            runner(
+                db,
+                now,
+                decision_interval,
+                review_mod_interval,
+                review_mod_request_gap_seconds,
+                force,
+            )
+        except JobCancelled:
+            logger.info("%s cancelled after %d papers", job_name, job.processed)
+            cancelled = True
+        _commit_check_work(db)
+        signal_new_events()
     except Exception as e:
         logger.error("Error in %s: %s", job_name, e)
+        error = str(e)
         db.rollback()
     finally:
         db.close()
-        _scheduler_run_lock.release()
-        logger.info("%s completed", job_name)
+        _release_run_locks()
+        finish_job(job, error, cancelled=cancelled)
+        logger.info("%s %s", job_name, job.status)
+    return job
 
 
 def check_decisions_smart(force: bool = False):
@@ -655,29 +834,81 @@ def check_review_modifications_all(force: bool = False):
     )
 
 
-def sync_all_papers_status_silent(force: bool = True):
-    """Run a one-time full status sync without sending any notifications."""
+def sync_all_papers_status_silent(force: bool = True, job_id: Optional[str] = None):
+    """Run a one-time full status sync without sending any notifications (restarts an interrupted one)."""
     _run_check_job(
-        "sync_all_papers_status_silent",
+        _SILENT_SYNC_JOB,
         _sync_all_papers_status_silent_impl,
         force=force,
+        job_id=job_id,
+    )
+
+
+def resume_interrupted_jobs():
+    """
+    Continue a silent sync interrupted by a restart from its last committed chunk.
+    - Leaves the checkpoint alone while its holder still holds the check_run lease (its sync is still
+      running in another worker); it is resumed once that lease expired
+    """
+    db = SessionLocal()
+    try:
+        checkpoint = db.get(JobCheckpoint, _SILENT_SYNC_JOB)
+        owner_alive = checkpoint is not None and checkpoint.holder is not None and db.query(
+            SchedulerLease.name
+        ).filter(
+            SchedulerLease.name == _check_run_lock.name,
+            SchedulerLease.holder == checkpoint.holder,
+            SchedulerLease.expires_at > datetime.utcnow(),
+        ).first() is not None
+    finally:
+        db.close()
+    if checkpoint is None:
+        return
+    if owner_alive:
+        logger.info("Silent sync checkpoint is still advanced by %s; not resuming it", checkpoint.holder)
+        return
+    _run_check_job(
+        _SILENT_SYNC_JOB,
+        partial(_sync_all_papers_status_silent_impl, resume=True),
+        force=checkpoint.force,
+        lock_timeout=None,
+    )
+
+
+def check_paper_now(paper_id: int) -> Optional[Job]:
+    """Force-check one paper synchronously; None if another job held the lock for too long."""
+    return _run_check_job(
+        "check_paper",
+        _selected_papers_runner(paper_ids=[paper_id]),
+        force=True,
+        lock_timeout=_MANUAL_CHECK_LOCK_TIMEOUT_SECONDS,
     )
 
 
-def check_all_papers(force: bool = False):
-    """Run two-phase checks: venue smart probe first, then review-mod full pass."""
+def check_papers_now(job_id: str, paper_ids: Optional[List[int]] = None, venue: Optional[str] = None) -> None:
+    """Force-check a list of papers or a venue as a background job; waits its turn behind running jobs."""
+    _run_check_job(
+        "check_venue" if venue is not None else "check_papers",
+        _selected_papers_runner(paper_ids=paper_ids, venue=venue),
+        force=True,
+        job_id=job_id,
+        lock_timeout=None,
+    )
+
+
+def check_all_papers(force: bool = False, job_id: Optional[str] = None):
+    """Run lifecycle policies, then two-phase checks: venue smart probe first, then review-mod full pass."""
     def _run_both(
         db,
-        email_service,
         now,
         decision_interval,
         review_mod_interval,
         review_mod_request_gap_seconds,
-        run_force
+        run_force,
     ):
+        apply_lifecycle_policies(db, now)
         _check_decisions_smart_impl(
             db=db,
-            email_service=email_service,
             now=now,
             decision_interval_minutes=decision_interval,
             review_mod_interval_minutes=review_mod_interval,
@@ -686,7 +917,6 @@ def check_all_papers(force: bool = False):
         )
         _check_review_modifications_all_impl(
             db=db,
-            email_service=email_service,
             now=now,
             decision_interval_minutes=decision_interval,
             review_mod_interval_minutes=review_mod_interval,
@@ -694,17 +924,50 @@ def check_all_papers(force: bool = False):
             force=run_force,
         )
 
-    _run_check_job("check_all_papers", _run_both, force=force)
+    _run_check_job("check_all_papers", _run_both, force=force, job_id=job_id)
+
+
+def _on_elected_leader():
+    # Outbox delivery runs in the leader only, so its domain lanes and SMTP rate cap apply once
+    start_dispatcher()
+    # No trigger: runs once right away
+    scheduler.add_job(resume_interrupted_jobs, id="resume_interrupted_jobs", replace_existing=True)
+
+
+def _on_lost_leader():
+    stop_dispatcher()
+
+
+scheduler_lease = LeaderLease(
+    _SCHEDULER_LEASE_NAME,
+    get_settings().scheduler_lease_seconds,
+    on_elected=_on_elected_leader,
+    on_lost=_on_lost_leader,
+)
+
+
+def check_all_papers_if_leader():
+    """Scheduled tick: only the process holding the scheduler lease checks papers."""
+    if not scheduler_lease.is_leader:
+        return
+    check_all_papers()
 
 
 def start_scheduler(interval_minutes: int = 30):
-    """Start scheduler with one dispatcher job running two sequential phases."""
+    """
+    Start scheduler with one dispatcher job running two sequential phases.
+    - Every worker process starts it; scheduled jobs and outbox delivery run only in the holder of
+      the scheduler lease
+    - Manual checks run in the worker that received the request, one check job at a time across
+      all workers (check_run lock)
+    - Paper event consumers run as a separate interval job (run_event_consumers)
+    """
     for job_id in ["check_papers", "check_decisions", "check_review_modifications"]:
         if scheduler.get_job(job_id):
             scheduler.remove_job(job_id)
 
     scheduler.add_job(
-        check_all_papers,
+        check_all_papers_if_leader,
         "interval",
         minutes=_SCHEDULER_TICK_MINUTES,
         id="check_papers",
@@ -712,19 +975,31 @@ def start_scheduler(interval_minutes: int = 30):
         max_instances=1,
         coalesce=True,
     )
+    scheduler.add_job(
+        run_event_consumers_if_leader,
+        "interval",
+        seconds=max(1, get_settings().event_consumer_interval_seconds),
+        id="consume_paper_events",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler_lease.start()
 
     if not scheduler.running:
         scheduler.start()
 
     logger.info(
-        "Scheduler started with %d-minute dispatcher tick (initial decision default=%dm)",
+        "Scheduler started with %d-minute dispatcher tick (initial decision default=%dm, leader=%s)",
         _SCHEDULER_TICK_MINUTES,
         interval_minutes,
+        scheduler_lease.is_leader,
     )
 
 
 def stop_scheduler():
-    """Stop the scheduler."""
+    """Stop the scheduler (and outbox delivery) and hand the scheduler lease to another worker."""
     if scheduler.running:
         scheduler.shutdown()
         logger.info("Scheduler stopped")
+    scheduler_lease.stop()
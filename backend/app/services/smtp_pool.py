@@ -0,0 +1,232 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from threading import BoundedSemaphore, Lock
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+import hashlib
+import logging
+import time
+
+from ..config import get_settings
+from ..utils.rate_limit import RequestPacer
+
+if TYPE_CHECKING:
+    import smtplib
+    from email.message import Message
+
+    from .email import StampedEmail
+
+logger = logging.getLogger(__name__)
+
+# Sessions idle longer than this are health-checked with NOOP before reuse.
+_NOOP_AFTER_IDLE_SECONDS = 30.0
+# Servers drop idle sessions eventually; don't bother checking ones idle longer than this.
+_MAX_IDLE_SECONDS = 240.0
+
+
+@dataclass
+class _PooledConnection:
+    smtp: "smtplib.SMTP"
+    opened_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    messages_sent: int = 0
+
+
+class SMTPConnectionPool:
+    """
+    Authenticated SMTP sessions shared by all senders of one (host, port, user).
+    - At most max_connections sessions; callers block for a free one
+    - Idle sessions are NOOP-checked before reuse and recycled after max_messages_per_connection
+    - A send on a session the server already closed is retried once on a fresh session
+    """
+
+    def __init__(
+        self,
+        max_connections: int,
+        max_messages_per_connection: int,
+        max_messages_per_second: float,
+    ):
+        self.max_messages_per_connection = max(1, max_messages_per_connection)
+        self._slots = BoundedSemaphore(max(1, max_connections))
+        # Spaces sends evenly so the pool never exceeds max_messages_per_second
+        self._throttle = RequestPacer.per_second(max_messages_per_second)
+        self._idle: List[_PooledConnection] = []
+        self._lock = Lock()
+        self._counters: Counter = Counter()
+        self._started_at = time.monotonic()
+
+    def _count(self, name: str, amount: float = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    def _open(self, connect: Callable[[], "smtplib.SMTP"]) -> _PooledConnection:
+        started = time.monotonic()
+        smtp = connect()
+        self._count("connections_opened")
+        self._count("connect_seconds", time.monotonic() - started)
+        return _PooledConnection(smtp=smtp)
+
+    def _close(self, pooled: _PooledConnection) -> None:
+        try:
+            pooled.smtp.quit()
+        except Exception:
+            try:
+                pooled.smtp.close()
+            except Exception:
+                pass
+        self._count("connections_closed")
+
+    def _is_healthy(self, pooled: _PooledConnection) -> bool:
+        try:
+            code, _ = pooled.smtp.noop()
+        except Exception:
+            code = None
+        if code == 250:
+            return True
+        self._count("noop_failures")
+        return False
+
+    def _checkout(self, connect: Callable[[], "smtplib.SMTP"]) -> Tuple[_PooledConnection, bool]:
+        """Return (session, reused): a healthy idle session, or a new one."""
+        while True:
+            with self._lock:
+                pooled = self._idle.pop() if self._idle else None
+            if pooled is None:
+                return self._open(connect), False
+
+            idle_for = time.monotonic() - pooled.last_used
+            if idle_for > _MAX_IDLE_SECONDS:
+                self._close(pooled)
+                continue
+            if idle_for > _NOOP_AFTER_IDLE_SECONDS and not self._is_healthy(pooled):
+                self._close(pooled)
+                continue
+            return pooled, True
+
+    def _checkin(self, pooled: _PooledConnection) -> None:
+        if pooled.messages_sent >= self.max_messages_per_connection:
+            self._close(pooled)
+            return
+        pooled.last_used = time.monotonic()
+        with self._lock:
+            self._idle.append(pooled)
+
+    def _send_on(self, pooled: _PooledConnection, msg: Union["Message", "StampedEmail"]) -> None:
+        import smtplib
+        from .email import StampedEmail
+
+        try:
+            if isinstance(msg, StampedEmail):
+                # Already encoded: sent as-is, without serializing a MIME tree per recipient
+                pooled.smtp.sendmail(msg.from_addr, [msg.to_addr], msg.data)
+            else:
+                pooled.smtp.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            self._close(pooled)
+            raise
+        except smtplib.SMTPException:
+            # Message-level rejection (e.g. refused recipient): the session survives an RSET.
+            try:
+                pooled.smtp.rset()
+                self._checkin(pooled)
+            except Exception:
+                self._close(pooled)
+            raise
+        except OSError:
+            self._close(pooled)
+            raise
+        pooled.messages_sent += 1
+
+    def send(self, msg: Union["Message", "StampedEmail"], connect: Callable[[], "smtplib.SMTP"]) -> None:
+        """Send one message; `connect` opens and authenticates a new session when needed."""
+        import smtplib
+
+        # The server closed a pooled session since its last use: retry once on a new session.
+        disconnect_errors = (smtplib.SMTPServerDisconnected, ConnectionResetError, BrokenPipeError)
+        self._count("throttled_seconds", self._throttle.wait())
+        with self._slots:
+            try:
+                pooled, reused = self._checkout(connect)
+                try:
+                    self._send_on(pooled, msg)
+                except disconnect_errors:
+                    if not reused:
+                        raise
+                    self._count("reconnects")
+                    pooled = self._open(connect)
+                    self._send_on(pooled, msg)
+            except Exception:
+                self._count("send_failures")
+                raise
+            self._checkin(pooled)
+        self._count("messages_sent")
+
+    def close_idle(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            self._close(pooled)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            idle = len(self._idle)
+        elapsed = max(time.monotonic() - self._started_at, 1e-9)
+        sent = counters.get("messages_sent", 0)
+        opened = counters.get("connections_opened", 0)
+        return {
+            "messages_sent": sent,
+            "send_failures": counters.get("send_failures", 0),
+            "connections_opened": opened,
+            "connections_closed": counters.get("connections_closed", 0),
+            "reconnects": counters.get("reconnects", 0),
+            "noop_failures": counters.get("noop_failures", 0),
+            "idle_connections": idle,
+            "messages_per_connection": sent / opened if opened else 0.0,
+            "messages_per_second": sent / elapsed,
+            "avg_connect_ms": counters.get("connect_seconds", 0.0) * 1000 / opened if opened else 0.0,
+            "throttled_seconds": counters.get("throttled_seconds", 0.0),
+        }
+
+
+_pools: Dict[Tuple[str, int, str], SMTPConnectionPool] = {}
+_pool_credentials: Dict[Tuple[str, int, str], str] = {}
+_pools_lock = Lock()
+
+
+def get_smtp_pool(host: str, port: int, user: str, password: str) -> SMTPConnectionPool:
+    """Return the shared pool for (host, port, user); a password change drops its idle sessions."""
+    key = (host, port, user)
+    credential = hashlib.sha256((password or "").encode("utf-8")).hexdigest()
+    stale: Optional[SMTPConnectionPool] = None
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            settings = get_settings()
+            pool = SMTPConnectionPool(
+                max_connections=settings.smtp_pool_size,
+                max_messages_per_connection=settings.smtp_max_messages_per_connection,
+                max_messages_per_second=settings.smtp_max_messages_per_second,
+            )
+            _pools[key] = pool
+        elif _pool_credentials.get(key) != credential:
+            stale = pool
+        _pool_credentials[key] = credential
+    if stale is not None:
+        stale.close_idle()
+    return pool
+
+
+def smtp_pool_stats() -> Dict[str, Dict[str, Any]]:
+    with _pools_lock:
+        pools = dict(_pools)
+    return {f"{user}@{host}:{port}": pool.stats() for (host, port, user), pool in pools.items()}
+
+
+def close_smtp_pools() -> None:
+    """Quit every idle pooled session (application shutdown)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+        _pool_credentials.clear()
+    for pool in pools:
+        pool.close_idle()
@@ -0,0 +1,41 @@
+import hashlib
+import json
+import re
+from typing import Any, Dict, Iterable, Optional
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Fields rendered in notification emails; edits elsewhere never notify subscribers.
+REVIEW_NOTIFY_FIELDS = ("rating", "confidence", "summary", "strengths", "weaknesses")
+DECISION_NOTIFY_FIELDS = ("decision", "comment")
+
+
+def normalize_value(value: Any) -> Any:
+    """Normalize a note field so formatting-only edits compare equal."""
+    if isinstance(value, str):
+        value = _WHITESPACE_RE.sub(" ", value).strip()
+        return value or None
+    if isinstance(value, (list, tuple)):
+        return [normalize_value(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): normalize_value(item) for key, item in value.items()}
+    return value
+
+
+def fingerprint(note: Optional[Dict[str, Any]], fields: Iterable[str]) -> Optional[str]:
+    """Canonical SHA-256 over the normalized values of the given note fields."""
+    if not isinstance(note, dict):
+        return None
+    payload = {key: normalize_value(note.get(key)) for key in fields}
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def event_fingerprint(*parts: Any) -> str:
+    """Canonical SHA-256 over arbitrary JSON-compatible values, e.g. the inputs of a notification."""
+    encoded = json.dumps(parts, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def decision_fingerprint(decision: Optional[Dict[str, Any]]) -> Optional[str]:
+    return fingerprint(decision, DECISION_NOTIFY_FIELDS)
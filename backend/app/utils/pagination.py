@@ -0,0 +1,73 @@
+import base64
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from fastapi import HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MAX_PAGE_SIZE = 500
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any, sort_key: Any) -> Any:
+    if isinstance(value, dict) and "$dt" in value:
+        value = datetime.fromisoformat(value["$dt"])
+    if value is None:
+        return value
+    try:
+        expected = sort_key.type.python_type
+    except NotImplementedError:
+        return value
+    # bool is an int subclass, but never a valid key value
+    if not isinstance(value, expected) or isinstance(value, bool):
+        raise TypeError(f"cursor value {value!r} is not {expected.__name__}")
+    return value
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """Encode the sort key of the last row into an opaque keyset cursor."""
+    raw = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_keys: Sequence[Any]) -> List[Any]:
+    """
+    Decode a keyset cursor for the given sort key columns; raises 400 if it is malformed, for another
+    sort order, or holds a value of the wrong type for its column (which the database cannot compare).
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        if not isinstance(values, list) or len(values) != len(sort_keys):
+            raise ValueError("cursor length mismatch")
+        return [_decode_value(value, sort_key) for value, sort_key in zip(values, sort_keys)]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def etag_json_response(
+    request: Request,
+    content: Any,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """Return JSON with a weak ETag, or 304 if the client already has this representation."""
+    payload = jsonable_encoder(content)
+    body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+    etag = f'W/"{hashlib.sha1(body.encode("utf-8")).hexdigest()}"'
+
+    response_headers = dict(headers or {})
+    response_headers["ETag"] = etag
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=response_headers)
+
+    return Response(content=body, media_type="application/json", headers=response_headers)
@@ -4,6 +4,33 @@ from threading import Lock
 from typing import Deque, Dict, Tuple
 
 
+class RequestPacer:
+    """Spaces out request starts across threads: at most one start per interval_seconds (0 disables)."""
+
+    def __init__(self, interval_seconds: float = 0.0):
+        self.interval_seconds = interval_seconds
+        self._next_start = 0.0
+        self._lock = Lock()
+
+    @classmethod
+    def per_second(cls, max_per_second: float) -> "RequestPacer":
+        return cls(1.0 / max_per_second if max_per_second > 0 else 0.0)
+
+    def wait(self) -> float:
+        """Block until the next start slot; returns the seconds waited."""
+        interval = max(0.0, self.interval_seconds)
+        if not interval:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + interval
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
 class RateLimiter:
     """In-memory rate limiter for simple authentication throttling."""
 
@@ -0,0 +1,123 @@
+"""Benchmark loading the admin paper list with and without the JSON blob columns.
+
+Seeds a throwaway SQLite database with N papers carrying realistic
+decision/legacy review blobs, then compares:
+- full: Paper entities with every blob undeferred (the old behaviour)
+- deferred: Paper entities with blobs left deferred
+- projected: the column projection used by GET /api/admin/papers
+
+Usage (from ``backend/``):
+    uv run python benchmarks/admin_paper_list.py [--papers 10000] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+_tmp_dir = tempfile.mkdtemp(prefix="orm-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp_dir}/bench.db"
+
+from sqlalchemy.orm import undefer_group  # noqa: E402
+
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.models import Paper, PAPER_BLOB_GROUP  # noqa: E402
+from app.routers.admin import _PAPER_LIST_COLUMNS  # noqa: E402
+
+_COMMENT = "The reviewers agree the paper is well motivated. " * 60
+_REVIEW_TEXT = "This submission studies an interesting problem. " * 40
+
+
+def _seed(count: int) -> None:
+    db = SessionLocal()
+    try:
+        papers = []
+        for idx in range(count):
+            papers.append({
+                "openreview_id": f"bench{idx:06d}",
+                "submission_number": idx,
+                "title": f"Benchmark paper {idx}",
+                "venue": f"VENUE {idx % 20}",
+                "status": "accepted" if idx % 3 == 0 else "reviewed",
+                "decision_data": {"decision": "Accept (Poster)", "comment": _COMMENT, "mdate": 1},
+                "review_data": {
+                    "reviews": [
+                        {"id": f"r{idx}-{n}", "rating": 6, "summary": _REVIEW_TEXT, "mdate": 1}
+                        for n in range(4)
+                    ],
+                    "review_count": 4,
+                },
+            })
+        db.bulk_insert_mappings(Paper, papers)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _load_full(db):
+    return db.query(Paper).options(undefer_group(PAPER_BLOB_GROUP)).order_by(
+        Paper.venue, Paper.submission_number
+    ).all()
+
+
+def _load_deferred(db):
+    return db.query(Paper).order_by(Paper.venue, Paper.submission_number).all()
+
+
+def _load_projected(db):
+    return db.query(*_PAPER_LIST_COLUMNS).order_by(Paper.venue, Paper.submission_number).all()
+
+
+def _measure(loader, repeat: int) -> tuple[float, float]:
+    best_seconds = float("inf")
+    best_peak = float("inf")
+    for _ in range(repeat):
+        db = SessionLocal()
+        try:
+            tracemalloc.start()
+            started = time.perf_counter()
+            rows = loader(db)
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            assert rows
+        finally:
+            db.close()
+        best_seconds = min(best_seconds, elapsed)
+        best_peak = min(best_peak, peak)
+    return best_seconds, best_peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Admin paper list loading benchmark")
+    parser.add_argument("--papers", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # Create the schema only; the legacy review_data migration would null the blobs.
+    Base.metadata.create_all(bind=engine)
+    _seed(args.papers)
+    print(f"papers={args.papers} db={os.environ['DATABASE_URL']}")
+
+    baseline = None
+    for name, loader in (
+        ("full", _load_full),
+        ("deferred", _load_deferred),
+        ("projected", _load_projected),
+    ):
+        seconds, peak = _measure(loader, args.repeat)
+        if baseline is None:
+            baseline = (seconds, peak)
+        print(
+            f"{name:>10}: {seconds * 1000:8.1f} ms  peak {peak / 1024 / 1024:7.1f} MiB  "
+            f"({seconds / baseline[0]:.0%} time, {peak / baseline[1]:.0%} memory of full)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
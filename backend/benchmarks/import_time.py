@@ -0,0 +1,92 @@
+"""Import-time benchmark for the backend entrypoint.
+
+Runs ``python -X importtime -c "import app.main"`` a few times in fresh
+interpreters, reports the best cumulative import time of ``app.main`` and
+fails when it exceeds the budget or when a lazily loaded dependency sneaks
+back into the import graph.
+
+Usage (from ``backend/``):
+    uv run python benchmarks/import_time.py [--budget-ms 1500] [--runs 5]
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_BUDGET_MS = 1500.0
+DEFAULT_RUNS = 5
+
+# Modules that must only load on first use.
+LAZY_MODULES = (
+    "openreview",
+    "passlib",
+    "smtplib",
+    "email.mime.multipart",
+    "email.mime.text",
+)
+
+_LINE_RE = re.compile(r"^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)\s*$")
+
+
+def _run_once() -> tuple[float, set[str]]:
+    env = dict(os.environ)
+    env.setdefault("DATABASE_URL", "sqlite:///:memory:")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    app_main_us = None
+    imported = set()
+    for line in result.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if not match:
+            continue
+        module = match.group(4)
+        imported.add(module)
+        if module == "app.main":
+            app_main_us = int(match.group(2))
+
+    if app_main_us is None:
+        raise RuntimeError("app.main was not found in -X importtime output")
+    return app_main_us / 1000.0, imported
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Import-time budget check for app.main")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    timings = []
+    eager = set()
+    for _ in range(max(1, args.runs)):
+        elapsed_ms, imported = _run_once()
+        timings.append(elapsed_ms)
+        eager.update(module for module in LAZY_MODULES if module in imported)
+
+    best = min(timings)
+    print(f"app.main import time: best={best:.1f}ms runs={', '.join(f'{t:.1f}' for t in timings)}")
+    print(f"budget: {args.budget_ms:.1f}ms")
+
+    failed = False
+    if best > args.budget_ms:
+        print(f"FAIL: import time exceeds budget by {best - args.budget_ms:.1f}ms")
+        failed = True
+    if eager:
+        print(f"FAIL: lazily loaded modules imported at startup: {', '.join(sorted(eager))}")
+        failed = True
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""Benchmark notification rendering for one paper event fanned out to N recipients.
+
+Compares, for the review notification of a paper with --reviews reviews:
+- per-recipient: render the HTML, build the MIME tree and serialize it for every
+  recipient (the old behaviour)
+- cached: render and encode once per (template, paper, event fingerprint), then
+  stamp each recipient's To/Date/Message-ID headers onto the shared body
+
+Nothing is sent; the benchmark measures the bytes handed to SMTP.
+
+Usage (from ``backend/``):
+    uv run python benchmarks/render_cache.py [--recipients 1000] [--reviews 4] [--repeat 3]
+"""
+import argparse
+import sys
+import time
+from email.generator import BytesGenerator
+from io import BytesIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services import email as email_module  # noqa: E402
+from app.services import email_templates  # noqa: E402
+from app.services.email import EmailService, _attach_text, _new_message  # noqa: E402
+
+_REVIEW_TEXT = "This submission studies an interesting problem with a careful evaluation. " * 12
+
+
+def _reviews(count: int):
+    return [
+        {
+            "rating": 6 + idx % 3,
+            "confidence": 3 + idx % 2,
+            "summary": _REVIEW_TEXT,
+            "strengths": _REVIEW_TEXT[:400],
+            "weaknesses": _REVIEW_TEXT[:400],
+        }
+        for idx in range(count)
+    ]
+
+
+def _per_recipient(service: EmailService, recipients, reviews) -> int:
+    total = 0
+    for to_email in recipients:
+        html = email_templates.render_review("A Study of Things", "abc123XYZ", "ICLR 2026", reviews)
+        msg = _new_message("[ICLR 2026] Reviews available: A Study of Things", service.from_header, to_email)
+        _attach_text(msg, html, "html")
+        buffer = BytesIO()
+        BytesGenerator(buffer).flatten(msg, linesep="\r\n")
+        total += len(buffer.getvalue())
+    return total
+
+
+def _cached(service: EmailService, recipients, reviews) -> int:
+    email_module._rendered_cache = email_module._LRUCache(email_module._RENDER_CACHE_SIZE)
+    email_module._encoded_cache = email_module._LRUCache(email_module._RENDER_CACHE_SIZE)
+    total = 0
+    for to_email in recipients:
+        rendered = service.build_review_notification("A Study of Things", "abc123XYZ", "ICLR 2026", reviews)
+        total += len(service._encoded(rendered).stamp(service.from_email, to_email).data)
+    return total
+
+
+def _best(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Notification render cache benchmark")
+    parser.add_argument("--recipients", type=int, default=1000)
+    parser.add_argument("--reviews", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    service = EmailService("localhost", 25, "bench", "bench", "monitor@example.com", "OpenReview Monitor")
+    recipients = [f"user{idx}@example.com" for idx in range(args.recipients)]
+    reviews = _reviews(args.reviews)
+    print(f"recipients={args.recipients} reviews={args.reviews}")
+
+    results = {}
+    for name, fn in (("per-recipient", _per_recipient), ("cached", _cached)):
+        results[name] = _best(lambda: fn(service, recipients, reviews), args.repeat)
+        print(
+            f"{name:>14}: {args.recipients / results[name]:10.1f} msg/s  "
+            f"{results[name] * 1000:8.1f}ms  "
+            f"({results[name] * 1e6 / args.recipients:.1f}us per recipient)"
+        )
+    print(f"speedup: {results['per-recipient'] / results['cached']:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""Benchmark SMTP delivery throughput with and without the connection pool.
+
+Starts a local SMTP sink that accepts every message and waits --handshake-ms
+on each new connection (standing in for the TCP + TLS + AUTH round trips of a
+real provider), then sends N messages from --workers threads:
+- per-message: a new authenticated session per message (the old behaviour)
+- pooled: sessions reused through SMTPConnectionPool
+
+Usage (from ``backend/``):
+    uv run python benchmarks/smtp_pool.py [--messages 2000] [--workers 2] [--handshake-ms 40]
+"""
+import argparse
+import os
+import smtplib
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+_tmp_dir = tempfile.mkdtemp(prefix="smtp-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp_dir}/bench.db"
+
+from app.services.email import EmailService, _attach_text, _new_message  # noqa: E402
+from app.services.smtp_pool import SMTPConnectionPool  # noqa: E402
+
+_BODY = "<p>" + "Reviews are available for your paper. " * 80 + "</p>"
+
+
+class _SinkHandler(socketserver.StreamRequestHandler):
+    """Just enough ESMTP to accept authenticated mail and count it."""
+
+    def _reply(self, line: str) -> None:
+        self.wfile.write(line.encode("ascii") + b"\r\n")
+
+    def handle(self) -> None:
+        time.sleep(self.server.handshake_seconds)
+        self._reply("220 sink ESMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("ascii", "replace").strip().upper()
+            if command.startswith("EHLO"):
+                self.wfile.write(b"250-sink\r\n250-AUTH PLAIN LOGIN\r\n250 SIZE 10485760\r\n")
+            elif command.startswith("AUTH"):
+                self._reply("235 2.7.0 Authentication successful")
+            elif command == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                with self.server.lock:
+                    self.server.received += 1
+                self._reply("250 2.0.0 Ok: queued")
+            elif command == "QUIT":
+                self._reply("221 2.0.0 Bye")
+                return
+            else:  # HELO, MAIL, RCPT, RSET, NOOP
+                self._reply("250 2.0.0 Ok")
+
+
+class _SinkServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, handshake_seconds: float):
+        super().__init__(("127.0.0.1", 0), _SinkHandler)
+        self.handshake_seconds = handshake_seconds
+        self.received = 0
+        self.lock = threading.Lock()
+
+
+class _SinkEmailService(EmailService):
+    """EmailService whose sessions skip STARTTLS (the sink speaks plain SMTP)."""
+
+    def _open_connection(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=self.timeout)
+        server.login(self.smtp_user, self.smtp_password)
+        return server
+
+
+def _message(service: EmailService, idx: int):
+    msg = _new_message(f"[BENCH] Reviews available #{idx}", service.from_header, f"user{idx}@example.com")
+    _attach_text(msg, _BODY, "html")
+    return msg
+
+
+def _run(send, count: int, workers: int) -> float:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(send, range(count)))
+    return time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="SMTP connection pool benchmark")
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--handshake-ms", type=float, default=40.0)
+    parser.add_argument("--per-connection", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=0.0, help="Pool messages/second cap (0 = unlimited)")
+    args = parser.parse_args()
+
+    sink = _SinkServer(args.handshake_ms / 1000)
+    threading.Thread(target=sink.serve_forever, daemon=True).start()
+    host, port = sink.server_address
+    service = _SinkEmailService(
+        smtp_host=host,
+        smtp_port=port,
+        smtp_user="bench",
+        smtp_password="bench",
+        from_email="monitor@example.com",
+        from_name="OpenReview Monitor",
+    )
+    print(
+        f"messages={args.messages} workers={args.workers} handshake={args.handshake_ms:.0f}ms "
+        f"sink={host}:{port}"
+    )
+
+    def send_per_message(idx: int) -> None:
+        server = service._open_connection()
+        try:
+            server.send_message(_message(service, idx))
+        finally:
+            server.quit()
+
+    seconds = _run(send_per_message, args.messages, args.workers)
+    print(
+        f"{'per-message':>12}: {args.messages / seconds:8.1f} msg/s  "
+        f"{seconds:6.2f}s  connections={args.messages}"
+    )
+
+    pool = SMTPConnectionPool(
+        max_connections=args.workers,
+        max_messages_per_connection=args.per_connection,
+        max_messages_per_second=args.rate,
+    )
+    seconds = _run(
+        lambda idx: pool.send(_message(service, idx), service._open_connection),
+        args.messages,
+        args.workers,
+    )
+    stats = pool.stats()
+    print(
+        f"{'pooled':>12}: {args.messages / seconds:8.1f} msg/s  {seconds:6.2f}s  "
+        f"connections={stats['connections_opened']}  "
+        f"msgs/connection={stats['messages_per_connection']:.1f}  "
+        f"avg connect={stats['avg_connect_ms']:.1f}ms  failures={stats['send_failures']}"
+    )
+    pool.close_idle()
+    sink.shutdown()
+
+    expected = args.messages * 2
+    if sink.received != expected:
+        print(f"FAIL: sink received {sink.received} messages, expected {expected}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+import os
+import tempfile
+
+# Point the app at a throwaway database before anything imports app.database
+_DB_DIR = tempfile.mkdtemp(prefix="openreview-monitor-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/test.db"
+os.environ["ADMIN_PASSWORD"] = "test-admin-password"
+os.environ["SECRET_KEY"] = "test-secret-key"
+os.environ["OUTBOX_WORKERS"] = "0"
+
+import pytest
+
+import app.models  # noqa: F401  (registers the tables)
+from app.database import Base, SessionLocal, engine
+from app.services.config_cache import invalidate_config_cache
+
+
+@pytest.fixture
+def db():
+    """A session on the app database (the one SessionLocal uses), emptied for every test."""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    invalidate_config_cache()
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def admin_client(db):
+    """An API client logged in as admin (startup tasks such as the scheduler are not run)."""
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    client = TestClient(app)
+    token = client.post("/api/admin/login", json={"password": "test-admin-password"}).json()["token"]
+    client.headers["Authorization"] = f"Bearer {token}"
+    return client
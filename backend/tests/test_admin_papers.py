@@ -0,0 +1,48 @@
+from app.models import Paper
+from app.utils.pagination import NEXT_CURSOR_HEADER, encode_cursor
+
+
+def _add_papers(db, count):
+    for i in range(count):
+        db.add(Paper(openreview_id=f"p{i}", title=f"Paper {i}", venue="V 2026", submission_number=i, status="pending"))
+    db.commit()
+
+
+def test_papers_keyset_pages_cover_every_paper_once(db, admin_client):
+    _add_papers(db, 5)
+    seen = []
+    params = {"limit": 2, "sort": "title"}
+    while True:
+        response = admin_client.get("/api/admin/papers", params=params)
+        assert response.status_code == 200
+        seen += [paper["openreview_id"] for paper in response.json()]
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            break
+        params["cursor"] = cursor
+
+    assert seen == [f"p{i}" for i in range(5)]
+
+
+def test_papers_etag_returns_304_until_the_page_changes(db, admin_client):
+    _add_papers(db, 2)
+    first = admin_client.get("/api/admin/papers")
+    etag = first.headers["ETag"]
+
+    assert admin_client.get("/api/admin/papers", headers={"If-None-Match": etag}).status_code == 304
+    db.query(Paper).filter(Paper.openreview_id == "p0").one().status = "reviewed"
+    db.commit()
+    changed = admin_client.get("/api/admin/papers", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["ETag"] != etag
+
+
+def test_papers_cursor_with_wrong_value_types_is_rejected(db, admin_client):
+    _add_papers(db, 3)
+    for sort, values in [
+        ("venue", [{"a": 1}, 1, 1]),
+        ("venue", ["V 2026", "1", 1]),
+        ("created_at", ["yesterday", 1]),
+        ("title", ["Paper 1", True]),
+    ]:
+        response = admin_client.get("/api/admin/papers", params={"sort": sort, "cursor": encode_cursor(values)})
+        assert response.status_code == 400, (sort, values)
@@ -0,0 +1,65 @@
+import threading
+import time
+
+from app.models import Paper, PaperEvent
+from app.services.events import REVIEW_ADDED, STATUS_CHANGED, append_event, signal_new_events
+from app.utils.pagination import encode_cursor
+
+
+def _papers(db):
+    first = Paper(openreview_id="p1", title="One", venue="A 2026", status="pending")
+    second = Paper(openreview_id="p2", title="Two", venue="B 2026", status="pending")
+    db.add_all([first, second])
+    db.flush()
+    return first, second
+
+
+def test_change_feed_returns_events_after_the_cursor_for_one_venue(db, admin_client):
+    first, second = _papers(db)
+    db.commit()
+    head = admin_client.get("/api/admin/changes").json()
+    assert head["events"] == []
+
+    append_event(db, first, REVIEW_ADDED, {"review_count": 1})
+    append_event(db, second, STATUS_CHANGED, {"from": "pending", "to": "reviewed"})
+    db.commit()
+
+    page = admin_client.get("/api/admin/changes", params={"cursor": head["cursor"], "venue": "B 2026"}).json()
+    assert [(event["openreview_id"], event["kind"]) for event in page["events"]] == [("p2", STATUS_CHANGED)]
+    idle = admin_client.get("/api/admin/changes", params={"cursor": page["cursor"], "timeout": 0}).json()
+    assert idle["events"] == [] and idle["cursor"] == page["cursor"]
+
+
+def test_change_feed_long_poll_wakes_up_on_new_events(db, admin_client):
+    first, _ = _papers(db)
+    db.commit()
+    cursor = admin_client.get("/api/admin/changes").json()["cursor"]
+
+    def append_later():
+        time.sleep(0.3)
+        append_event(db, first, REVIEW_ADDED, {"review_count": 1})
+        db.commit()
+        signal_new_events()
+
+    writer = threading.Thread(target=append_later)
+    started = time.monotonic()
+    writer.start()
+    page = admin_client.get("/api/admin/changes", params={"cursor": cursor, "timeout": 10}).json()
+    writer.join()
+
+    assert [event["kind"] for event in page["events"]] == [REVIEW_ADDED]
+    assert time.monotonic() - started < 3
+
+
+def test_change_feed_reports_pruned_events(db, admin_client):
+    first, _ = _papers(db)
+    for _ in range(3):
+        append_event(db, first, REVIEW_ADDED, {})
+    db.commit()
+    db.query(PaperEvent).filter(PaperEvent.id < 3).delete()
+    db.commit()
+
+    page = admin_client.get("/api/admin/changes", params={"cursor": encode_cursor([0]), "timeout": 0}).json()
+
+    assert page["truncated"] is True
+    assert [event["id"] for event in page["events"]] == [3]
@@ -0,0 +1,30 @@
+from app.models import Config
+from app.services import config_cache
+from app.services.config_cache import bump_config_version, get_cached_email_service, get_runtime_config
+
+
+def test_admin_config_update_is_written_through(db, admin_client):
+    service = get_cached_email_service()
+    assert get_cached_email_service() is service
+
+    response = admin_client.put("/api/admin/config", json={"check_interval": 7, "smtp_host": "mail.example.org"})
+
+    assert response.status_code == 200
+    assert get_runtime_config().check_interval == 7
+    assert get_cached_email_service().smtp_host == "mail.example.org"
+
+
+def test_edit_from_another_worker_shows_up_once_the_version_moves(db, monkeypatch):
+    monkeypatch.setattr(config_cache, "_VERSION_CHECK_INTERVAL_SECONDS", 0.0)
+    db.add(Config(key="check_interval", value="11"))
+    db.commit()
+    assert get_runtime_config().check_interval == 11
+
+    # Another worker writes the row; without a version bump this worker keeps its snapshot
+    db.query(Config).filter(Config.key == "check_interval").update({Config.value: "13"})
+    db.commit()
+    assert get_runtime_config().check_interval == 11
+
+    bump_config_version(db)
+    db.commit()
+    assert get_runtime_config().check_interval == 13
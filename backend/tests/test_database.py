@@ -0,0 +1,16 @@
+from sqlalchemy import inspect, text
+
+from app.database import engine, ensure_indexes
+
+
+def test_retired_subscriber_indexes_are_dropped(db):
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE INDEX ix_subscribers_pending_review ON subscribers (paper_id) WHERE notified_review = 0"
+        ))
+
+    ensure_indexes()
+
+    names = {index["name"] for index in inspect(engine).get_indexes("subscribers")}
+    assert "ix_subscribers_pending_review" not in names
+    assert "ix_subscribers_paper_review_modified" in names
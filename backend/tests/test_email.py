@@ -0,0 +1,41 @@
+from email import message_from_bytes
+
+from app.services import email as email_module
+from app.services.email import EmailService
+
+
+def _html(message):
+    return [part.get_payload() for part in message.walk() if part.get_content_type() == "text/html"]
+
+
+def _service():
+    return EmailService("smtp.example.org", 587, "user", "secret", "monitor@example.org", "Monitor")
+
+
+def test_notification_is_rendered_and_encoded_once_for_all_subscribers(monkeypatch):
+    renders = []
+    render_review = email_module.email_templates.render_review
+
+    def counting_render(*args):
+        renders.append(args)
+        return render_review(*args)
+
+    monkeypatch.setattr(email_module.email_templates, "render_review", counting_render)
+    sent = []
+    monkeypatch.setattr(EmailService, "_send_email_sync", lambda self, msg: sent.append(msg))
+    reviews = [{"id": "r1", "rating": "6: accept", "summary": "Solid"}]
+
+    for recipient in ("a@example.org", "b@example.org"):
+        service = _service()
+        service.send_rendered(recipient, service.build_review_notification("Title", "once-p1", "V 2026", reviews))
+
+    assert len(renders) == 1
+    assert [message.to_addr for message in sent] == ["a@example.org", "b@example.org"]
+    first, second = (message_from_bytes(message.data) for message in sent)
+    assert (first["To"], second["To"]) == ("a@example.org", "b@example.org")
+    assert first["Message-ID"] != second["Message-ID"]
+    assert _html(first) == _html(second)
+
+    edited = [{**reviews[0], "summary": "Solid, revised"}]
+    _service().build_review_notification("Title", "once-p1", "V 2026", edited)
+    assert len(renders) == 2
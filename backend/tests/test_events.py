@@ -0,0 +1,58 @@
+from app.models import EventCursor, OutboxMessage, Paper, PaperEvent, Review, Subscriber
+from app.services.events import REVIEW_ADDED, append_event, consume_events
+from app.services.scheduler import run_event_consumers
+
+
+def _paper(db, openreview_id="p1", **fields):
+    paper = Paper(openreview_id=openreview_id, title="A paper", venue="V 2026", status="reviewed", **fields)
+    db.add(paper)
+    db.flush()
+    return paper
+
+
+def test_failing_event_is_isolated_retried_and_skipped(db):
+    paper = _paper(db)
+    for _ in range(3):
+        append_event(db, paper, REVIEW_ADDED, {})
+    db.commit()
+    handled = []
+
+    def handler(session, events):
+        if any(event.id == 2 for event in events):
+            raise ValueError("bad payload")
+        handled.extend(event.id for event in events)
+
+    def run_pass():
+        consume_events(db, "test", handler)
+        db.commit()
+        return db.get(EventCursor, "test")
+
+    cursor = run_pass()  # The batch fails and is marked for one-by-one retries
+    assert (cursor.position, cursor.retry_until) == (0, 3)
+    cursor = run_pass()  # Event 1 goes through, event 2 fails
+    assert (cursor.position, cursor.failures) == (1, 1)
+    cursor = run_pass()
+    assert (cursor.position, cursor.failures) == (1, 2)
+    cursor = run_pass()  # Third failure: skipped
+    assert (cursor.position, cursor.failures) == (2, 0)
+    assert "bad payload" in cursor.last_error
+    cursor = run_pass()
+    assert (cursor.position, cursor.retry_until, cursor.last_error) == (3, None, None)
+    assert handled == [1, 3]
+
+
+def test_event_consumer_job_queues_notifications(db):
+    paper = _paper(db, review_count=1)
+    db.add(Review(paper_id=paper.id, review_id="r1", rating=6, content_hash="h"))
+    db.add(Subscriber(paper_id=paper.id, email="author@example.org", notify_on_review=True))
+    append_event(db, paper, REVIEW_ADDED, {"review_ids": ["r1"], "review_count": 1})
+    db.commit()
+
+    run_event_consumers()
+
+    assert [(message.kind, message.to_email) for message in db.query(OutboxMessage)] == [
+        ("review", "author@example.org")
+    ]
+    assert db.get(EventCursor, "notifications").position == db.query(PaperEvent.id).scalar()
+    run_event_consumers()
+    assert db.query(OutboxMessage).count() == 1
@@ -0,0 +1,124 @@
+from app.models import CheckJob, Paper
+from app.services import jobs, scheduler
+from app.services.jobs import (
+    CANCELLED,
+    COMPLETED,
+    QUEUED,
+    RUNNING,
+    JobCancelled,
+    RemoteJobWatcher,
+    cancel_job,
+    finish_job,
+    get_job,
+    job_checkpoint,
+    job_event,
+    job_paper_done,
+    list_jobs,
+    poll_cancel_request,
+    queue_job,
+    start_job,
+)
+
+
+def _forget_locally(job):
+    """Make a job look like it belongs to another worker process."""
+    jobs.job_registry._jobs.pop(job.job_id, None)
+
+
+def test_job_of_another_worker_is_visible_and_cancellable(db):
+    job = queue_job("check_papers")
+    _forget_locally(job)
+
+    loaded = get_job(job.job_id)
+    assert loaded is not None and loaded.status == QUEUED
+    assert job.job_id in [listed.job_id for listed in list_jobs()]
+
+    cancelled = cancel_job(job.job_id)
+    assert cancelled.status == CANCELLED and cancelled.cancel_requested
+    assert db.get(CheckJob, job.job_id).status == CANCELLED
+    assert cancel_job("missing") is None
+
+
+def test_running_job_stops_on_cancel_from_another_worker(db):
+    job = start_job("check_all_papers")
+    try:
+        job_checkpoint("p1")
+        db.query(CheckJob).filter(CheckJob.job_id == job.job_id).update({CheckJob.cancel_requested: True})
+        db.commit()
+        assert poll_cancel_request(job)
+        try:
+            job_checkpoint("p2")
+            raise AssertionError("checkpoint did not raise")
+        except JobCancelled:
+            pass
+    finally:
+        finish_job(job, cancelled=True)
+    assert db.get(CheckJob, job.job_id).status == CANCELLED
+
+
+def test_remote_watcher_reports_progress_of_other_workers(db):
+    watcher = RemoteJobWatcher()
+    job = start_job("check_all_papers")
+    job.total = 3
+    job_paper_done()
+    job_event("paper_fetched", publish=False)
+    jobs.store_job(job)
+
+    # Jobs of this worker are streamed from the in-process broker, not by the watcher
+    assert watcher.poll(db) == []
+    db.query(CheckJob).update({CheckJob.worker: "other-host:1:abc"})
+    db.commit()
+
+    events = watcher.poll(db)
+    assert [kind for kind, _ in events] == ["started", "progress"]
+    assert events[1][1]["processed"] == 1 and events[1][1]["totals"] == {"paper_fetched": 1}
+    assert watcher.poll(db) == []
+
+    job.worker = "other-host:1:abc"
+    finish_job(job)
+    events = watcher.poll(db)
+    assert [kind for kind, _ in events] == [COMPLETED]
+    assert db.get(CheckJob, job.job_id).status == COMPLETED
+
+
+def test_job_row_tracks_running_state(db):
+    job = start_job("check_paper")
+    try:
+        row = db.get(CheckJob, job.job_id)
+        assert row.status == RUNNING and row.started_at is not None
+    finally:
+        finish_job(job)
+
+
+def test_check_job_is_cancelled_between_papers(db, admin_client, monkeypatch):
+    for openreview_id in ("p1", "p2", "p3"):
+        db.add(Paper(openreview_id=openreview_id, status="pending"))
+    db.commit()
+    fetched = []
+
+    def fetch(openreview_id, *credentials):
+        fetched.append(openreview_id)
+        if openreview_id == "p2":
+            [running] = [job for job in list_jobs() if job.status == RUNNING]
+            assert admin_client.post(f"/api/admin/jobs/{running.job_id}/cancel").status_code == 200
+            raise RuntimeError("OpenReview unavailable")
+        return {"status": "reviewed", "reviews": []}
+
+    def runner(session, now, decision_interval, review_mod_interval, gap, force):
+        for paper in session.query(Paper).order_by(Paper.id).all():
+            scheduler._check_single_paper(
+                session, paper, now, decision_interval, review_mod_interval, True, True, force=force
+            )
+
+    monkeypatch.setattr(scheduler, "_fetch_paper_status", fetch)
+    job = scheduler._run_check_job("check_all_papers", runner, force=True)
+
+    assert fetched == ["p1", "p2"]
+    assert [paper.status for paper in db.query(Paper).order_by(Paper.id)] == ["reviewed", "pending", "pending"]
+    response = admin_client.get(f"/api/admin/jobs/{job.job_id}").json()
+    assert (response["status"], response["processed"], response["error_count"]) == (CANCELLED, 2, 1)
+    assert response["errors"][0]["openreview_id"] == "p2"
+    completed = start_job("check_paper")
+    finish_job(completed)
+    assert admin_client.post(f"/api/admin/jobs/{completed.job_id}/cancel").status_code == 409
+    assert admin_client.get("/api/admin/jobs/missing").status_code == 404
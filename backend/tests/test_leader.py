@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta
+
+from app.models import JobCheckpoint, SchedulerLease
+from app.services import scheduler
+from app.services.leader import LeaderLease
+
+
+def _expire(db, name):
+    db.query(SchedulerLease).filter(SchedulerLease.name == name).update(
+        {SchedulerLease.expires_at: datetime.utcnow() - timedelta(seconds=1)}
+    )
+    db.commit()
+
+
+def test_expired_lease_is_taken_over_and_the_old_holder_steps_down(db):
+    transitions = []
+    first = LeaderLease("test", 30, on_lost=lambda: transitions.append("first lost"))
+    second = LeaderLease("test", 30, on_elected=lambda: transitions.append("second elected"))
+
+    assert first.heartbeat() and not second.heartbeat()
+    _expire(db, "test")  # The first holder stopped heartbeating
+    assert second.heartbeat()
+    assert not first.heartbeat()
+
+    assert transitions == ["second elected", "first lost"]
+    assert db.get(SchedulerLease, "test").holder == second.holder
+
+
+def test_released_lease_is_taken_over_at_once(db):
+    first = LeaderLease("test", 30)
+    second = LeaderLease("test", 30)
+    assert first.heartbeat()
+
+    first.release()
+
+    assert not first.is_leader
+    assert second.heartbeat()
+
+
+def test_interrupted_silent_sync_is_resumed_only_after_its_holder_lease_expired(db, monkeypatch):
+    runs = []
+    monkeypatch.setattr(scheduler, "_run_check_job", lambda name, runner, **kwargs: runs.append(name))
+    other_worker = LeaderLease(scheduler._check_run_lock.name, 30)
+    assert other_worker.heartbeat()
+    db.add(JobCheckpoint(job=scheduler._SILENT_SYNC_JOB, position=10, holder=other_worker.holder))
+    db.commit()
+
+    scheduler.resume_interrupted_jobs()
+    assert runs == []
+
+    _expire(db, scheduler._check_run_lock.name)
+    scheduler.resume_interrupted_jobs()
+    assert runs == [scheduler._SILENT_SYNC_JOB]
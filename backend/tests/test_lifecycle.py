@@ -0,0 +1,91 @@
+from datetime import datetime
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import Paper, PaperArchive, ReviewVersion, Subscriber
+from app.services.lifecycle import archive_paper, restore_archived_paper
+from app.services.reviews import get_rating_timeline, sync_reviews
+
+
+def _session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+
+def _archive_and_restore(db, paper):
+    archive = archive_paper(db, paper, "decided", datetime.utcnow())
+    db.commit()
+    assert db.query(Paper).count() == 0
+    restored = restore_archived_paper(db, archive)
+    db.commit()
+    assert db.query(PaperArchive).count() == 0
+    return restored
+
+
+def test_restore_keeps_digest_preference():
+    db = _session()
+    paper = Paper(openreview_id="p1", title="T", status="accepted")
+    db.add(paper)
+    db.flush()
+    db.add_all([
+        Subscriber(paper_id=paper.id, email="digest@x.org", digest=True),
+        Subscriber(paper_id=paper.id, email="now@x.org", digest=False),
+    ])
+    db.commit()
+
+    restored = _archive_and_restore(db, paper)
+
+    subscribers = db.query(Subscriber).filter(Subscriber.paper_id == restored.id).order_by(Subscriber.email).all()
+    assert [(sub.email, sub.digest) for sub in subscribers] == [("digest@x.org", True), ("now@x.org", False)]
+
+
+def test_restore_keeps_quarantine_and_backoff():
+    db = _session()
+    paper = Paper(openreview_id="p1", title="T", status="accepted")
+    db.add(paper)
+    db.flush()
+    quarantined_at = datetime(2026, 1, 2, 3, 4, 5)
+    next_send_after = datetime(2026, 1, 3)
+    db.add(Subscriber(
+        paper_id=paper.id,
+        email="bounce@x.org",
+        send_failures=4,
+        hard_failures=3,
+        last_send_error="550 mailbox unavailable",
+        next_send_after=next_send_after,
+        quarantined_at=quarantined_at,
+    ))
+    db.commit()
+
+    restored = _archive_and_restore(db, paper)
+
+    subscriber = db.query(Subscriber).filter(Subscriber.paper_id == restored.id).one()
+    assert (subscriber.send_failures, subscriber.hard_failures) == (4, 3)
+    assert subscriber.last_send_error == "550 mailbox unavailable"
+    assert subscriber.next_send_after == next_send_after
+    assert subscriber.quarantined_at == quarantined_at
+
+
+def test_restore_keeps_review_history():
+    db = _session()
+    paper = Paper(openreview_id="p1", title="T", status="accepted")
+    db.add(paper)
+    db.flush()
+    sync_reviews(db, paper, [{"id": "r1", "rating": 5, "confidence": 3, "mdate": 1}])
+    db.commit()
+    sync_reviews(db, paper, [{"id": "r1", "rating": 6, "confidence": 3, "mdate": 2}])
+    db.commit()
+
+    restored = _archive_and_restore(db, paper)
+
+    versions = db.query(ReviewVersion.version).filter(ReviewVersion.paper_id == restored.id).order_by(
+        ReviewVersion.version
+    ).all()
+    assert [version for version, in versions] == [1, 2]
+    sync_reviews(db, restored, [{"id": "r1", "rating": 7, "confidence": 3, "mdate": 3}])
+    db.commit()
+    points = get_rating_timeline(db, restored.id)[0]["points"]
+    assert [(point["version"], point["rating"]) for point in points] == [(1, 5), (2, 6), (3, 7)]
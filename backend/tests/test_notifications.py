@@ -0,0 +1,46 @@
+from app.models import EventCursor, NotificationLedger, OutboxMessage, Paper, Review, Subscriber
+from app.services.events import REVIEW_ADDED, REVIEW_MODIFIED, append_event
+from app.services.notifier import NOTIFICATIONS_CONSUMER
+from app.services.scheduler import run_event_consumers
+
+_MODIFIED = [{"id": "r1", "rating": 7, "summary": "Better", "version": 2}]
+
+
+def _paper_with_subscriber(db):
+    paper = Paper(openreview_id="p1", title="A paper", venue="V 2026", status="reviewed", review_count=1)
+    db.add(paper)
+    db.flush()
+    db.add(Review(paper_id=paper.id, review_id="r1", rating=6, content_hash="h"))
+    db.add(Subscriber(
+        paper_id=paper.id, email="author@example.org", notify_on_review=True, notify_on_review_modified=True,
+    ))
+    return paper
+
+
+def test_replayed_events_never_queue_a_notification_twice(db):
+    paper = _paper_with_subscriber(db)
+    append_event(db, paper, REVIEW_ADDED, {"review_ids": ["r1"], "review_count": 1})
+    append_event(db, paper, REVIEW_MODIFIED, {"reviews": _MODIFIED})
+    db.commit()
+    run_event_consumers()
+
+    # A crash before the cursor was saved, and the same edit detected again after a restart
+    db.get(EventCursor, NOTIFICATIONS_CONSUMER).position = 0
+    append_event(db, paper, REVIEW_MODIFIED, {"reviews": _MODIFIED})
+    db.commit()
+    run_event_consumers()
+
+    assert sorted(message.kind for message in db.query(OutboxMessage)) == ["review", "review_modified"]
+    assert db.query(NotificationLedger).count() == 2
+    assert db.query(Subscriber.notified_review).scalar() is True
+
+
+def test_new_edit_of_the_same_review_is_notified(db):
+    paper = _paper_with_subscriber(db)
+    append_event(db, paper, REVIEW_MODIFIED, {"reviews": _MODIFIED})
+    append_event(db, paper, REVIEW_MODIFIED, {"reviews": [{**_MODIFIED[0], "rating": 8, "version": 3}]})
+    db.commit()
+
+    run_event_consumers()
+
+    assert db.query(OutboxMessage).filter(OutboxMessage.kind == "review_modified").count() == 2
@@ -0,0 +1,137 @@
+from datetime import datetime, timedelta
+
+from app.config import get_settings
+from app.models import Paper, Subscriber
+from app.services import outbox
+from app.services.email import EmailDeliveryError, RenderedEmail
+
+
+class _RecordingEmailService:
+    def __init__(self):
+        self.sent = []
+
+    def send_rendered(self, to_email, rendered):
+        self.sent.append(to_email)
+
+
+def _queue(db, to_email="author@example.org"):
+    message = outbox.enqueue_email(db, "review", to_email, RenderedEmail("Subject", "<p>Body</p>"), paper_id=1)
+    db.commit()
+    return message
+
+
+def test_expired_claim_taken_over_by_another_dispatcher_is_not_sent_twice(db, monkeypatch):
+    email_service = _RecordingEmailService()
+    monkeypatch.setattr(outbox, "get_cached_email_service", lambda: email_service)
+    message = _queue(db)
+
+    [(message_id, _, first_token)] = outbox.claim_due_messages(db, datetime.utcnow(), 10)
+    # The message waited in a slow dispatch lane past its lease, and another dispatcher claimed it
+    later = datetime.utcnow() + timedelta(seconds=outbox._CLAIM_LEASE_SECONDS + 1)
+    [(_, _, second_token)] = outbox.claim_due_messages(db, later, 10)
+
+    assert outbox.deliver_message(message_id, first_token) is False
+    assert outbox.deliver_message(message_id, second_token) is True
+    assert outbox.deliver_message(message_id, second_token) is False
+    assert email_service.sent == ["author@example.org"]
+    db.refresh(message)
+    assert (message.status, message.attempts) == ("sent", 1)
+
+
+def test_release_hands_back_only_the_current_claim(db):
+    message = _queue(db)
+    [(message_id, _, first_token)] = outbox.claim_due_messages(db, datetime.utcnow(), 10)
+    later = datetime.utcnow() + timedelta(seconds=outbox._CLAIM_LEASE_SECONDS + 1)
+    [(_, _, second_token)] = outbox.claim_due_messages(db, later, 10)
+
+    outbox.release_messages(db, [(message_id, first_token)])
+    db.refresh(message)
+    assert message.status == "sending"
+    outbox.release_messages(db, [(message_id, second_token)])
+    db.refresh(message)
+    assert message.status == "pending"
+
+
+class _FailingEmailService:
+    def send_rendered(self, to_email, rendered):
+        raise ValueError("Connection refused")
+
+
+def test_failed_send_backs_off_then_is_dead_lettered(db, monkeypatch):
+    monkeypatch.setattr(outbox, "get_cached_email_service", lambda: _FailingEmailService())
+    monkeypatch.setattr(get_settings(), "outbox_max_attempts", 2)
+    message = _queue(db)
+
+    [(message_id, _, token)] = outbox.claim_due_messages(db, datetime.utcnow(), 10)
+    assert outbox.deliver_message(message_id, token) is False
+    db.refresh(message)
+    assert (message.status, message.attempts, message.last_error) == ("pending", 1, "Connection refused")
+    assert message.next_attempt_at > datetime.utcnow()
+    assert outbox.claim_due_messages(db, datetime.utcnow(), 10) == []
+
+    [(_, _, token)] = outbox.claim_due_messages(db, message.next_attempt_at, 10)
+    outbox.deliver_message(message_id, token)
+    db.refresh(message)
+    assert (message.status, message.attempts) == ("dead", 2)
+    assert outbox.claim_due_messages(db, datetime.utcnow() + timedelta(days=1), 10) == []
+
+
+def test_claims_round_robin_across_papers(db):
+    for paper_id in (1, 1, 1, 2):
+        outbox.enqueue_email(db, "review", f"p{paper_id}@example.org", RenderedEmail("S", "B"), paper_id=paper_id)
+    db.commit()
+
+    claimed = outbox.claim_due_messages(db, datetime.utcnow(), 2)
+
+    assert sorted(to_email for _, to_email, _ in claimed) == ["p1@example.org", "p2@example.org"]
+
+
+def _subscriber(db, email, **fields):
+    paper = Paper(openreview_id=email, status="reviewed")
+    db.add(paper)
+    db.flush()
+    db.add(Subscriber(paper_id=paper.id, email=email, **fields))
+    db.commit()
+
+
+class _RejectingEmailService:
+    def send_rendered(self, to_email, rendered):
+        raise EmailDeliveryError("550 Mailbox unavailable", smtp_code=550, recipient_failure="permanent")
+
+
+def test_rejected_address_backs_off_and_is_quarantined(db, monkeypatch):
+    monkeypatch.setattr(outbox, "get_cached_email_service", lambda: _RejectingEmailService())
+    monkeypatch.setattr(get_settings(), "subscriber_quarantine_hard_failures", 2)
+    _subscriber(db, "gone@example.org")
+    messages = [_queue(db, "gone@example.org") for _ in range(3)]
+
+    for _ in range(2):
+        [(message_id, _, token)] = outbox.claim_due_messages(db, datetime.utcnow(), 1)
+        outbox.deliver_message(message_id, token)
+    subscriber = db.query(Subscriber).one()
+    db.refresh(subscriber)
+    assert (subscriber.send_failures, subscriber.hard_failures) == (2, 2)
+    assert subscriber.next_send_after > datetime.utcnow()
+    assert subscriber.quarantined_at is not None
+
+    [(message_id, _, token)] = outbox.claim_due_messages(db, datetime.utcnow(), 1)
+    assert message_id == messages[2].id
+    assert outbox.deliver_message(message_id, token) is False
+    db.refresh(messages[2])
+    assert (messages[2].status, messages[2].last_error) == ("dead", "Recipient address is quarantined")
+
+
+def test_successful_send_clears_the_failure_streak(db, monkeypatch):
+    monkeypatch.setattr(outbox, "get_cached_email_service", lambda: _RecordingEmailService())
+    _subscriber(
+        db, "back@example.org", send_failures=3, hard_failures=1,
+        next_send_after=datetime.utcnow() - timedelta(minutes=1), last_send_error="421 Try later",
+    )
+    _queue(db, "back@example.org")
+
+    [(message_id, _, token)] = outbox.claim_due_messages(db, datetime.utcnow(), 1)
+    assert outbox.deliver_message(message_id, token) is True
+
+    subscriber = db.query(Subscriber).one()
+    db.refresh(subscriber)
+    assert (subscriber.send_failures, subscriber.hard_failures, subscriber.next_send_after) == (0, 0, None)
@@ -0,0 +1,91 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import Paper, Review, ReviewVersion
+from app.services.notifications import review_modified_event_key
+from app.services.reviews import get_rating_timeline, sync_reviews
+from app.utils.fingerprint import decision_fingerprint
+
+
+def _session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+
+def _review(rating, mdate):
+    return {"id": "r1", "rating": rating, "confidence": 3, "summary": "ok", "mdate": mdate}
+
+
+def test_review_removed_then_restored_continues_history():
+    db = _session()
+    paper = Paper(openreview_id="p1", title="T", status="reviewed")
+    db.add(paper)
+    db.flush()
+
+    sync_reviews(db, paper, [_review(5, 1)])
+    db.commit()
+    sync_reviews(db, paper, [_review(6, 2)])
+    db.commit()
+
+    removed = sync_reviews(db, paper, [])
+    db.commit()
+    assert removed.removed == ["r1"]
+    assert paper.review_count == 0
+
+    restored = sync_reviews(db, paper, [_review(8, 3)])
+    db.commit()
+    assert [review["id"] for review in restored.added] == ["r1"]
+    assert paper.review_count == 1
+
+    versions = db.query(ReviewVersion).filter(ReviewVersion.review_id == "r1").order_by(ReviewVersion.version).all()
+    assert [(version.version, version.is_snapshot) for version in versions] == [(1, True), (2, False), (3, True)]
+    points = get_rating_timeline(db, paper.id)[0]["points"]
+    assert [point["rating"] for point in points] == [5, 6, 8]
+
+
+def test_review_edited_back_and_forth_gets_a_new_notification_key():
+    db = _session()
+    paper = Paper(openreview_id="p1", title="T", status="reviewed")
+    db.add(paper)
+    db.flush()
+    sync_reviews(db, paper, [_review(5, 1)])
+    db.commit()
+
+    keys = []
+    for mdate, rating in enumerate([6, 5, 6], start=2):
+        result = sync_reviews(db, paper, [_review(rating, mdate)])
+        db.commit()
+        keys.append(review_modified_event_key(result.modified))
+
+    assert [review["version"] for review in result.modified] == [4]
+    assert len(set(keys)) == 3
+
+
+def test_only_edits_to_displayed_fields_count_as_modifications():
+    db = _session()
+    paper = Paper(openreview_id="p1", title="T", status="reviewed")
+    db.add(paper)
+    db.flush()
+    sync_reviews(db, paper, [_review(5, 1)])
+    db.commit()
+
+    mdate_only = sync_reviews(db, paper, [_review(5, 2)])
+    reformatted = sync_reviews(db, paper, [{**_review(5, 3), "summary": "  ok\n"}])
+    hidden_field = sync_reviews(db, paper, [{**_review(5, 4), "soundness": 3}])
+    rating = sync_reviews(db, paper, [_review(7, 5)])
+    db.commit()
+
+    assert (mdate_only.modified, reformatted.modified, hidden_field.modified) == ([], [], [])
+    assert [review["rating"] for review in rating.modified] == [7]
+    assert db.query(Review.mdate).filter(Review.review_id == "r1").scalar() == 5
+
+
+def test_decision_fingerprint_ignores_formatting_and_undisplayed_fields():
+    decision = {"decision": "Accept (poster)", "comment": "Nice work.", "mdate": 1}
+
+    assert decision_fingerprint(decision) == decision_fingerprint(
+        {"decision": " Accept  (poster)", "comment": "Nice work.\n", "mdate": 2}
+    )
+    assert decision_fingerprint(decision) != decision_fingerprint({**decision, "decision": "Reject"})
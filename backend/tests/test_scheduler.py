@@ -0,0 +1,134 @@
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from functools import partial
+import time
+
+from app.config import get_settings
+from app.models import CheckJob, JobCheckpoint, Paper, Review
+from app.services import scheduler
+from app.services.jobs import CANCELLED, COMPLETED, FAILED, job_registry
+
+
+def test_check_job_stops_when_its_lock_lapses(db):
+    def runner(session, now, *intervals):
+        session.add(Paper(openreview_id="p1", status="pending"))
+        scheduler._commit_check_work(session)
+        # Heartbeats failed for longer than the lease: another worker may hold check_run now
+        scheduler._check_run_lock._valid_until = 0.0
+        session.add(Paper(openreview_id="p2", status="pending"))
+        scheduler._commit_check_work(session)
+
+    job = scheduler._run_check_job("test_job", runner)
+
+    assert job.status == FAILED and "check_run" in job.error
+    assert [paper.openreview_id for paper in db.query(Paper)] == ["p1"]
+    assert db.get(CheckJob, job.job_id).status == FAILED
+
+
+def test_failed_paper_leaves_no_partial_writes(db, monkeypatch):
+    paper = Paper(openreview_id="p1", status="pending")
+    db.add(paper)
+    db.commit()
+    prefetched = Future()
+    prefetched.set_result({"status": "reviewed", "reviews": [{"id": "r1", "rating": "6: accept"}]})
+
+    def broken_append_event(*args, **kwargs):
+        raise ValueError("bad payload")
+
+    monkeypatch.setattr(scheduler, "append_event", broken_append_event)
+    now = datetime.utcnow()
+
+    result = scheduler._check_single_paper(db, paper, now, 60, 60, True, True, force=True, prefetched=prefetched)
+
+    assert result == (False, False, False)
+    db.commit()
+
+    assert db.query(Review).count() == 0
+    assert (paper.status, paper.review_count, paper.last_checked) == ("pending", 0, None)
+
+
+def _silent_sync_setup(db, monkeypatch, count, fetch):
+    for i in range(1, count + 1):
+        db.add(Paper(openreview_id=f"p{i}", status="pending"))
+    db.commit()
+    monkeypatch.setattr(get_settings(), "silent_sync_chunk_size", 2)
+    monkeypatch.setattr(scheduler, "_get_runtime_intervals", lambda session: (60, 60, 0.0))
+    monkeypatch.setattr(scheduler, "_fetch_paper_status", lambda openreview_id, *credentials: fetch(openreview_id))
+
+
+def _silent_sync(force=True, resume=False):
+    return scheduler._run_check_job(
+        scheduler._SILENT_SYNC_JOB,
+        partial(scheduler._sync_all_papers_status_silent_impl, resume=resume),
+        force=force,
+    )
+
+
+def test_silent_sync_resume_retries_failed_papers(db, monkeypatch):
+    fetched = []
+    failures = ["p2"]
+
+    def fetch(openreview_id):
+        fetched.append(openreview_id)
+        if openreview_id in failures:
+            failures.remove(openreview_id)
+            raise RuntimeError("OpenReview unavailable")
+        return {"status": "reviewed", "reviews": []}
+
+    _silent_sync_setup(db, monkeypatch, 5, fetch)
+    commits = []
+
+    def crash_after_second_chunk():
+        commits.append(True)
+        if len(commits) == 2:
+            raise RuntimeError("worker stopped")
+
+    monkeypatch.setattr(scheduler, "signal_new_events", crash_after_second_chunk)
+    assert _silent_sync().status == FAILED
+    checkpoint = db.get(JobCheckpoint, scheduler._SILENT_SYNC_JOB)
+    assert (checkpoint.position, checkpoint.processed, checkpoint.failed) == (4, 4, [2])
+
+    monkeypatch.setattr(scheduler, "signal_new_events", lambda: None)
+    fetched.clear()
+    assert _silent_sync(resume=True).status == COMPLETED
+
+    assert fetched == ["p2", "p5"]
+    db.expire_all()
+    assert db.get(JobCheckpoint, scheduler._SILENT_SYNC_JOB) is None
+    assert [paper.status for paper in db.query(Paper).order_by(Paper.id)] == ["reviewed"] * 5
+
+
+def test_silent_sync_without_force_fetches_only_due_papers(db, monkeypatch):
+    fetched = []
+
+    def fetch(openreview_id):
+        fetched.append(openreview_id)
+        return {"status": "reviewed", "reviews": []}
+
+    _silent_sync_setup(db, monkeypatch, 3, fetch)
+    recent = datetime.utcnow() - timedelta(minutes=5)
+    paper = db.query(Paper).filter(Paper.openreview_id == "p2").one()
+    paper.last_checked = paper.last_decision_checked = paper.last_review_mod_checked = recent
+    db.query(Paper).filter(Paper.openreview_id == "p3").one().status = "accepted"
+    db.commit()
+
+    assert _silent_sync(force=False).status == COMPLETED
+    assert fetched == ["p1"]
+
+
+def test_silent_sync_cancelled_while_fetching_a_chunk(db, monkeypatch):
+    fetched = []
+
+    def fetch(openreview_id):
+        fetched.append(openreview_id)
+        if len(fetched) == 1:
+            job_registry.list()[0].cancel_requested = True
+            # Still fetching when the job notices the cancel request
+            time.sleep(1.5)
+        return {"status": "reviewed", "reviews": []}
+
+    _silent_sync_setup(db, monkeypatch, 4, fetch)
+    monkeypatch.setattr(get_settings(), "silent_sync_concurrency", 1)
+    assert _silent_sync().status == CANCELLED
+    assert fetched == ["p1"]
+    assert db.query(Paper).filter(Paper.status == "reviewed").count() == 0
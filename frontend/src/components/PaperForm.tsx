@@ -31,6 +31,7 @@ export function PaperForm() {
     notify_on_review: true,
     notify_on_review_modified: true,
     notify_on_decision: true,
+    digest: false,
   })
 
   const { toast } = useToast()
@@ -124,6 +125,7 @@ export function PaperForm() {
       notify_on_review: formData.notify_on_review,
       notify_on_review_modified: formData.notify_on_review_modified,
       notify_on_decision: formData.notify_on_decision,
+      digest: formData.digest,
     })
 
     if (result.error) {
@@ -150,6 +152,7 @@ export function PaperForm() {
       notify_on_review: true,
       notify_on_review_modified: true,
       notify_on_decision: true,
+      digest: false,
     })
     setVerificationCode('')
     setVerificationSent(false)
@@ -410,6 +413,18 @@ export function PaperForm() {
                   {t('paperForm.preferences.decision')}
                 </Label>
               </div>
+              <div className="flex items-center space-x-2">
+                <Checkbox
+                  id="digest"
+                  checked={formData.digest}
+                  onCheckedChange={(checked) =>
+                    setFormData({ ...formData, digest: checked as boolean })
+                  }
+                />
+                <Label htmlFor="digest" className="font-normal">
+                  {t('paperForm.preferences.digest')}
+                </Label>
+              </div>
             </div>
           </div>
 
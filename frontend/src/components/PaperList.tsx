@@ -1,18 +1,31 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import { Button } from '@/components/ui/button'
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
 import { useToast } from '@/components/ui/use-toast'
 import { api, Paper } from '@/lib/api'
 import { useI18n } from '@/lib/i18n'
-import { Trash2, ExternalLink, RefreshCw, MailCheck, Bell } from 'lucide-react'
+import { Trash2, ExternalLink, RefreshCw, MailCheck, Bell, Loader2 } from 'lucide-react'
 
 interface PaperListProps {
   onRefresh?: () => void
 }
 
+interface RunningJob {
+  jobId: string
+  fetched: number
+  skipped: number
+  failed: number
+  changed: number
+}
+
+const JOB_STREAM_RETRY_MS = 5000
+
 export function PaperList({ onRefresh }: PaperListProps) {
   const [papers, setPapers] = useState<Paper[]>([])
   const [loading, setLoading] = useState(true)
+  const [runningJob, setRunningJob] = useState<RunningJob | null>(null)
+  const [checkingPaperId, setCheckingPaperId] = useState<number | null>(null)
+  const runningJobRef = useRef<RunningJob | null>(null)
   const { toast } = useToast()
   const { t, formatDateTime } = useI18n()
 
@@ -35,6 +48,56 @@ export function PaperList({ onRefresh }: PaperListProps) {
     fetchPapers()
   }, [])
 
+  // Follow scheduler jobs; reload the list when a job changed any paper
+  useEffect(() => {
+    const controller = new AbortController()
+    const updateJob = (job: RunningJob | null) => {
+      runningJobRef.current = job
+      setRunningJob(job)
+    }
+
+    const follow = async () => {
+      while (!controller.signal.aborted) {
+        try {
+          await api.streamJobEvents(({ event, data }) => {
+            const job = runningJobRef.current
+            if (event === 'started') {
+              updateJob({ jobId: data.job_id ?? '', fetched: 0, skipped: 0, failed: 0, changed: 0 })
+            } else if (!job || data.job_id !== job.jobId) {
+              return
+            } else if (event === 'paper_fetched') {
+              updateJob({ ...job, fetched: job.fetched + 1, changed: job.changed + (data.changed ? 1 : 0) })
+            } else if (event === 'paper_skipped') {
+              updateJob({ ...job, skipped: job.skipped + 1 })
+            } else if (event === 'paper_failed') {
+              updateJob({ ...job, failed: job.failed + 1 })
+            } else if (event === 'progress') {
+              const totals = data.totals ?? {}
+              updateJob({
+                ...job,
+                fetched: totals.paper_fetched ?? 0,
+                skipped: totals.paper_skipped ?? 0,
+                failed: totals.paper_failed ?? 0,
+                changed: totals.paper_changed ?? 0,
+              })
+            } else if (event === 'completed' || event === 'failed' || event === 'cancelled') {
+              updateJob(null)
+              if (job.changed > 0 || (data.totals?.paper_changed ?? 0) > 0) fetchPapers()
+            }
+          }, controller.signal)
+        } catch {
+          // Reconnect below unless the component unmounted
+        }
+        if (!controller.signal.aborted) {
+          await new Promise((resolve) => setTimeout(resolve, JOB_STREAM_RETRY_MS))
+        }
+      }
+    }
+
+    follow()
+    return () => controller.abort()
+  }, [])
+
   const handleDelete = async (paperId: number) => {
     if (!confirm(t('paperList.confirmDelete'))) return
 
@@ -71,6 +134,58 @@ export function PaperList({ onRefresh }: PaperListProps) {
     }
   }
 
+  const handleCancelJob = async (jobId: string) => {
+    const result = await api.cancelJob(jobId)
+    if (result.error) {
+      toast({
+        title: t('common.error'),
+        description: result.error,
+        variant: 'destructive',
+      })
+    } else {
+      toast({
+        title: t('common.success'),
+        description: t('paperList.toast.jobCancelled'),
+      })
+    }
+  }
+
+  const handleCheckPaper = async (paperId: number) => {
+    setCheckingPaperId(paperId)
+    const result = await api.checkPaper(paperId)
+    if (result.error) {
+      toast({
+        title: t('common.error'),
+        description: result.error,
+        variant: 'destructive',
+      })
+    } else if (result.data) {
+      const checked = result.data
+      setPapers((current) => current.map((paper) => (paper.id === checked.id ? checked : paper)))
+      toast({
+        title: t('common.success'),
+        description: t('paperList.toast.paperChecked'),
+      })
+    }
+    setCheckingPaperId(null)
+  }
+
+  const handleCheckVenue = async (venue: string) => {
+    const result = await api.checkPapers({ venue })
+    if (result.error) {
+      toast({
+        title: t('common.error'),
+        description: result.error,
+        variant: 'destructive',
+      })
+    } else {
+      toast({
+        title: t('common.success'),
+        description: t('paperList.toast.venueCheckQueued', { count: result.data?.paper_count ?? 0 }),
+      })
+    }
+  }
+
   const getStatusBadge = (status: string) => {
     const colors: Record<string, string> = {
       pending: 'bg-yellow-100 text-yellow-800',
@@ -126,6 +241,19 @@ export function PaperList({ onRefresh }: PaperListProps) {
         </div>
       </CardHeader>
       <CardContent>
+        {runningJob && (
+          <p className="mb-4 flex items-center gap-2 text-sm text-muted-foreground">
+            <Loader2 className="h-4 w-4 animate-spin" />
+            {t('paperList.jobProgress', {
+              fetched: runningJob.fetched,
+              skipped: runningJob.skipped,
+              failed: runningJob.failed,
+            })}
+            <Button variant="ghost" size="sm" onClick={() => handleCancelJob(runningJob.jobId)}>
+              {t('paperList.cancelJob')}
+            </Button>
+          </p>
+        )}
         {papers.length === 0 ? (
           <p className="text-muted-foreground text-center py-4">
             {t('paperList.none')}
@@ -141,6 +269,16 @@ export function PaperList({ onRefresh }: PaperListProps) {
                   <span className="text-xs">
                     {t('paperList.venueCount', { count: venuePapers.length })}
                   </span>
+                  {venue !== t('common.unknownVenue') && (
+                    <button
+                      type="button"
+                      className="text-muted-foreground hover:text-primary"
+                      title={t('paperList.checkVenueTitle')}
+                      onClick={() => handleCheckVenue(venue)}
+                    >
+                      <RefreshCw className="h-3 w-3" />
+                    </button>
+                  )}
                 </h3>
                 <div className="space-y-3">
                   {venuePapers.map((paper) => (
@@ -224,6 +362,20 @@ export function PaperList({ onRefresh }: PaperListProps) {
                         variant="ghost"
                         size="icon"
                         className="flex-shrink-0 ml-2"
+                        title={t('paperList.checkPaperTitle')}
+                        disabled={checkingPaperId === paper.id}
+                        onClick={() => handleCheckPaper(paper.id)}
+                      >
+                        {checkingPaperId === paper.id ? (
+                          <Loader2 className="h-4 w-4 animate-spin" />
+                        ) : (
+                          <RefreshCw className="h-4 w-4" />
+                        )}
+                      </Button>
+                      <Button
+                        variant="ghost"
+                        size="icon"
+                        className="flex-shrink-0"
                         onClick={() => handleDelete(paper.id)}
                       >
                         <Trash2 className="h-4 w-4 text-destructive" />
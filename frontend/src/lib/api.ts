@@ -53,6 +53,69 @@ async function fetchApi<T>(
   }
 }
 
+export interface JobProgressEvent {
+  // started, paper_fetched, paper_skipped, paper_failed, notifications_queued, completed, failed, cancelled, dropped;
+  // jobs running in another worker send progress (with totals so far) instead of per-paper events
+  event: string;
+  data: {
+    job_id?: string;
+    job?: string;
+    paper_id?: number;
+    openreview_id?: string;
+    reason?: string;
+    changed?: boolean;
+    error?: string;
+    duration_ms?: number;
+    count?: number;
+    processed?: number;
+    total?: number;
+    totals?: Record<string, number>;
+  };
+}
+
+// Server-Sent Events over fetch, so the admin token can go in the Authorization header.
+// Resolves when the stream ends; rejects on HTTP errors or when the signal aborts.
+async function streamEvents(
+  endpoint: string,
+  onEvent: (event: JobProgressEvent) => void,
+  signal: AbortSignal
+): Promise<void> {
+  const token = getAdminToken();
+  const headers = new Headers({ Accept: 'text/event-stream' });
+  if (token) {
+    headers.set('Authorization', `Bearer ${token}`);
+  }
+  const response = await fetch(buildApiUrl(getApiBase(), endpoint), { headers, signal });
+  if (!response.ok || !response.body) {
+    throw new Error(`HTTP error! status: ${response.status}`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) return;
+    buffer += decoder.decode(value, { stream: true });
+    let boundary = buffer.indexOf('\n\n');
+    while (boundary !== -1) {
+      const block = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+      boundary = buffer.indexOf('\n\n');
+
+      let event = 'message';
+      let data = '';
+      for (const line of block.split('\n')) {
+        if (line.startsWith('event: ')) event = line.slice(7);
+        else if (line.startsWith('data: ')) data += line.slice(6);
+      }
+      if (data) {
+        onEvent({ event, data: JSON.parse(data) });
+      }
+    }
+  }
+}
+
 // Paper Preview (step 1)
 export interface PaperPreviewRequest {
   openreview_url: string;
@@ -79,6 +142,7 @@ export interface PaperCreate {
   notify_on_review: boolean;
   notify_on_review_modified: boolean;
   notify_on_decision: boolean;
+  digest?: boolean;
 }
 
 export interface EmailVerificationRequest {
@@ -113,6 +177,12 @@ export interface Subscriber {
   notify_on_decision: boolean;
   notified_review: boolean;
   notified_decision: boolean;
+  digest?: boolean;
+  send_failures?: number;
+  hard_failures?: number;
+  last_send_error?: string | null;
+  next_send_after?: string | null;
+  quarantined_at?: string | null;
   created_at: string;
   paper_title: string | null;
   paper_venue: string | null;
@@ -201,6 +271,11 @@ export const api = {
       method: 'POST',
     }),
 
+  unquarantineSubscriber: (subscriberId: number) =>
+    fetchApi<{ message: string }>(`/admin/subscribers/${subscriberId}/unquarantine`, {
+      method: 'POST',
+    }),
+
   getConfig: () => fetchApi<Config>('/admin/config'),
 
   updateConfig: (data: ConfigUpdate) =>
@@ -217,12 +292,31 @@ export const api = {
     }, 45000),
 
   checkNow: () =>
-    fetchApi<{ message: string }>('/admin/check-now', {
+    fetchApi<{ job_id: string; message: string }>('/admin/check-now', {
+      method: 'POST',
+    }),
+
+  checkPaper: (paperId: number) =>
+    fetchApi<Paper>(`/admin/papers/${paperId}/check`, {
+      method: 'POST',
+    }, 90000),
+
+  checkPapers: (data: { paper_ids?: number[]; venue?: string }) =>
+    fetchApi<{ job_id: string; paper_count: number; message: string }>('/admin/check', {
       method: 'POST',
+      body: JSON.stringify(data),
     }),
 
   syncStatusSilent: () =>
-    fetchApi<{ message: string }>('/admin/sync-status-silent', {
+    fetchApi<{ job_id: string; message: string }>('/admin/sync-status-silent', {
+      method: 'POST',
+    }),
+
+  cancelJob: (jobId: string) =>
+    fetchApi<{ job_id: string; status: string }>(`/admin/jobs/${jobId}/cancel`, {
       method: 'POST',
     }),
+
+  streamJobEvents: (onEvent: (event: JobProgressEvent) => void, signal: AbortSignal) =>
+    streamEvents('/admin/jobs/events', onEvent, signal),
 };
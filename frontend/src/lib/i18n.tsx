@@ -114,6 +114,8 @@ const translations = {
     'paperForm.preferences.review': 'Notify me when reviews are available',
     'paperForm.preferences.reviewModified': 'Notify me when reviews are modified',
     'paperForm.preferences.decision': 'Notify me when the final decision is announced',
+    'paperForm.preferences.digest':
+      'Combine these notifications with my other papers into one digest email',
     'paperForm.confirm.subscribe': 'Confirm & Subscribe',
     'paperForm.success.title': 'Subscription active',
     'paperForm.success.body.prefix': 'You will receive email notifications at ',
@@ -163,11 +165,16 @@ const translations = {
     'admin.subscribers.reviewStatus': 'Review {status}',
     'admin.subscribers.decisionStatus': 'Decision {status}',
     'admin.subscribers.reviewChanges': 'Review changes on',
+    'admin.subscribers.digest': 'Digest',
     'admin.subscribers.resetTitle': 'Reset notification status',
+    'admin.subscribers.quarantined': 'Quarantined',
+    'admin.subscribers.failures': '{count} failed send(s)',
+    'admin.subscribers.unquarantineTitle': 'Resume delivery to this address',
     'admin.subscribers.confirmDelete':
       'Are you sure you want to delete this subscriber?',
     'admin.toast.subscriberDeleted': 'Subscriber deleted',
     'admin.toast.notificationReset': 'Notification status reset',
+    'admin.toast.deliveryResumed': 'Delivery resumed',
     'admin.toast.configSaved': 'Configuration saved',
     'admin.toast.emailRequired': 'Please enter an email address',
     'admin.toast.testEmailSent': 'Test email sent to {email}',
@@ -219,11 +226,18 @@ const translations = {
     'paperList.decisionSentTitle': 'Decision notification sent',
     'paperList.decisionPendingTitle': 'Decision notification pending',
     'paperList.lastChecked': 'Last checked: {date}',
+    'paperList.jobProgress': 'Checking papers: {fetched} fetched, {skipped} skipped, {failed} failed',
+    'paperList.cancelJob': 'Cancel',
     'paperList.confirmDelete':
       'Are you sure you want to delete this paper and all its subscribers?',
     'paperList.toast.deleted': 'Paper deleted successfully',
     'paperList.toast.checkInitiated':
       'Paper check initiated. This may take a few minutes.',
+    'paperList.toast.paperChecked': 'Paper checked against OpenReview',
+    'paperList.toast.jobCancelled': 'Check will stop before the next paper.',
+    'paperList.toast.venueCheckQueued': 'Check queued for {count} paper(s) in this venue.',
+    'paperList.checkPaperTitle': 'Check this paper now',
+    'paperList.checkVenueTitle': 'Check all papers in this venue now',
     'paperList.status.pending': 'Pending',
     'paperList.status.reviewed': 'Reviewed',
     'paperList.status.accepted': 'Accepted',
@@ -332,6 +346,7 @@ const translations = {
     'paperForm.preferences.review': '有评审可用时通知我',
     'paperForm.preferences.reviewModified': '评审更新时通知我',
     'paperForm.preferences.decision': '最终决定公布时通知我',
+    'paperForm.preferences.digest': '将这些通知与我关注的其他论文合并为一封摘要邮件',
     'paperForm.confirm.subscribe': '确认并订阅',
     'paperForm.success.title': '订阅已生效',
     'paperForm.success.body.prefix': '当以下论文有更新时，我们会发送通知到',
@@ -379,10 +394,15 @@ const translations = {
     'admin.subscribers.reviewStatus': '评审 {status}',
     'admin.subscribers.decisionStatus': '决定 {status}',
     'admin.subscribers.reviewChanges': '评审更新提醒',
+    'admin.subscribers.digest': '摘要邮件',
     'admin.subscribers.resetTitle': '重置通知状态',
+    'admin.subscribers.quarantined': '已隔离',
+    'admin.subscribers.failures': '发送失败 {count} 次',
+    'admin.subscribers.unquarantineTitle': '恢复向该邮箱发送',
     'admin.subscribers.confirmDelete': '确定要删除该订阅者吗？',
     'admin.toast.subscriberDeleted': '订阅者已删除',
     'admin.toast.notificationReset': '通知状态已重置',
+    'admin.toast.deliveryResumed': '已恢复发送',
     'admin.toast.configSaved': '配置已保存',
     'admin.toast.emailRequired': '请输入邮箱地址',
     'admin.toast.testEmailSent': '测试邮件已发送至 {email}',
@@ -427,9 +447,16 @@ const translations = {
     'paperList.decisionSentTitle': '决定通知已发送',
     'paperList.decisionPendingTitle': '决定通知待发送',
     'paperList.lastChecked': '上次检查：{date}',
+    'paperList.jobProgress': '正在检查论文：已获取 {fetched} 篇，跳过 {skipped} 篇，失败 {failed} 篇',
+    'paperList.cancelJob': '取消',
     'paperList.confirmDelete': '确定要删除这篇论文及其所有订阅者吗？',
     'paperList.toast.deleted': '论文已删除',
     'paperList.toast.checkInitiated': '已开始检查论文，可能需要几分钟。',
+    'paperList.toast.paperChecked': '已从 OpenReview 刷新该论文',
+    'paperList.toast.jobCancelled': '检查将在下一篇论文前停止。',
+    'paperList.toast.venueCheckQueued': '已为该 venue 的 {count} 篇论文排队检查。',
+    'paperList.checkPaperTitle': '立即检查该论文',
+    'paperList.checkVenueTitle': '立即检查该 venue 的全部论文',
     'paperList.status.pending': '待更新',
     'paperList.status.reviewed': '已评审',
     'paperList.status.accepted': '已录用',
@@ -13,7 +13,7 @@ import { api, Subscriber, ConfigUpdate } from '@/lib/api'
 import { clearAdminToken, getAdminToken } from '@/lib/adminToken'
 import { getApiConfig } from '@/lib/apiBase'
 import { useI18n } from '@/lib/i18n'
-import { Home, LogOut, Trash2, Save, Loader2, Mail, MailCheck, Bell, RotateCcw } from 'lucide-react'
+import { Home, LogOut, Trash2, Save, Loader2, Mail, MailCheck, Bell, RotateCcw, ShieldOff } from 'lucide-react'
 
 export default function Admin() {
   const [isLoggedIn, setIsLoggedIn] = useState(false)
@@ -83,6 +83,23 @@ export default function Admin() {
     }
   }
 
+  const handleUnquarantine = async (id: number) => {
+    const result = await api.unquarantineSubscriber(id)
+    if (result.error) {
+      toast({
+        title: t('common.error'),
+        description: result.error,
+        variant: 'destructive',
+      })
+    } else {
+      toast({
+        title: t('common.success'),
+        description: t('admin.toast.deliveryResumed'),
+      })
+      loadData()
+    }
+  }
+
   const handleResetNotifications = async (id: number) => {
     const result = await api.resetSubscriberNotifications(id)
     if (result.error) {
@@ -310,6 +327,28 @@ export default function Admin() {
                                         {t('admin.subscribers.reviewChanges')}
                                       </span>
                                     )}
+                                    {sub.digest && (
+                                      <span className="flex items-center gap-1 text-xs px-2 py-1 rounded bg-indigo-100 text-indigo-700">
+                                        {t('admin.subscribers.digest')}
+                                      </span>
+                                    )}
+                                    {sub.quarantined_at ? (
+                                      <span
+                                        className="flex items-center gap-1 text-xs px-2 py-1 rounded bg-red-100 text-red-700"
+                                        title={sub.last_send_error || undefined}
+                                      >
+                                        {t('admin.subscribers.quarantined')}
+                                      </span>
+                                    ) : (
+                                      !!sub.send_failures && (
+                                        <span
+                                          className="flex items-center gap-1 text-xs px-2 py-1 rounded bg-orange-100 text-orange-700"
+                                          title={sub.last_send_error || undefined}
+                                        >
+                                          {t('admin.subscribers.failures', { count: sub.send_failures })}
+                                        </span>
+                                      )
+                                    )}
                                     {/* Decision notification status */}
                                     {sub.notify_on_decision && (
                                       <span className={`flex items-center gap-1 text-xs px-2 py-1 rounded ${
@@ -332,6 +371,16 @@ export default function Admin() {
                                   </div>
                                 </div>
                                 <div className="flex gap-1">
+                                  {(sub.quarantined_at || !!sub.send_failures) && (
+                                    <Button
+                                      variant="ghost"
+                                      size="icon"
+                                      title={t('admin.subscribers.unquarantineTitle')}
+                                      onClick={() => handleUnquarantine(sub.id)}
+                                    >
+                                      <ShieldOff className="h-4 w-4 text-muted-foreground" />
+                                    </Button>
+                                  )}
                                   <Button
                                     variant="ghost"
                                     size="icon"